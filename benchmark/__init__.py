@@ -0,0 +1,4 @@
+"""
+Benchmarks for pulumi_snowflake.  Each module can be run with `python -m benchmark.<module>` from
+the repository root and needs no network access or Snowflake account.
+"""
@@ -0,0 +1,152 @@
+"""
+Compares the throughput of concurrent `create` calls using blocking pooled execution against
+asynchronous execution multiplexed on a single session.  Statements run against a fake connection
+which answers after a fixed latency, so the results show how many sessions each mode needs and how
+much latency it can overlap.
+
+    python -m benchmark.async_execution [--latency SECONDS] [--counts 10 100 1000] [--pool-size N]
+"""
+import argparse
+import contextlib
+import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pulumi_snowflake import Client, Provider
+from pulumi_snowflake.async_executor import close_all_executors
+from pulumi_snowflake.connection_pool import close_all_pools
+from pulumi_snowflake.database import DatabaseProvider
+
+
+class FakeConnection:
+    """
+    Fake connector connection.  Blocking statements sleep for `latency` seconds, asynchronous
+    statements finish `latency` seconds after they are submitted.
+    """
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.finish_times = {}
+        self.lock = threading.Lock()
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def _get_query_status(self, query_id):
+        if time.monotonic() < self.finish_times[query_id]:
+            return "RUNNING", {"data": {"queries": [{"id": query_id, "status": "RUNNING"}]}}
+
+        return "SUCCESS", {"data": {"queries": [{"id": query_id, "status": "SUCCESS",
+                                                 "stats": {"producedRows": 1}}]}}
+
+    def _process_error_query_status(self, query_id, response):
+        raise Exception(f"Query {query_id} failed")
+
+    @staticmethod
+    def is_an_error(status):
+        return status == "FAILED_WITH_ERROR"
+
+    @staticmethod
+    def is_still_running(status):
+        return status == "RUNNING"
+
+    def is_closed(self):
+        return False
+
+    def close(self):
+        pass
+
+
+class FakeCursor:
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.sfqid = None
+        self.rowcount = None
+
+    def execute(self, statement, **kwargs):
+        time.sleep(self.connection.latency)
+        self.rowcount = 1
+
+    def execute_async(self, statement, **kwargs):
+        with self.connection.lock:
+            self.sfqid = f"query-{len(self.connection.finish_times)}"
+            self.connection.finish_times[self.sfqid] = time.monotonic() + self.connection.latency
+
+    def close(self):
+        pass
+
+
+class FakeConnectionClient(Client):
+    """
+    A `Client` which opens fake connections, counting how many sessions are created.
+    """
+
+    def __init__(self, provider, latency):
+        super().__init__(provider)
+        self.latency = latency
+        self.sessions = 0
+
+    def _connect(self, slot=0):
+        self.sessions += 1
+        return FakeConnection(self.latency)
+
+
+def run(count, latency, pool_size, async_execution):
+    close_all_executors()
+    close_all_pools()
+
+    provider_params = Provider(
+        username="benchmark",
+        password="benchmark",
+        account_name="benchmark",
+        pool_max_size=pool_size,
+        async_execution=async_execution,
+        max_in_flight=count
+    )
+    client = FakeConnectionClient(provider_params, latency)
+    provider = DatabaseProvider(provider_params, client)
+
+    start = time.perf_counter()
+
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        with ThreadPoolExecutor(max_workers=count) as threads:
+            list(threads.map(lambda i: provider.create({"name": f"db_{i}"}), range(count)))
+
+    elapsed = time.perf_counter() - start
+
+    close_all_executors()
+    close_all_pools()
+
+    return {
+        "mode": "async" if async_execution else "blocking",
+        "creates": count,
+        "seconds": elapsed,
+        "creates_per_second": count / elapsed,
+        "sessions": client.sessions
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.05,
+                        help="Seconds taken by each statement")
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 100, 1000],
+                        help="Concurrent creates")
+    parser.add_argument("--pool-size", type=int, default=8,
+                        help="Maximum sessions for blocking execution")
+    args = parser.parse_args()
+
+    print(f"{'mode':<10}{'creates':>10}{'seconds':>10}{'creates/s':>12}{'sessions':>10}")
+
+    for count in args.counts:
+        for async_execution in (False, True):
+            result = run(count, args.latency, args.pool_size, async_execution)
+            print(f"{result['mode']:<10}{result['creates']:>10}{result['seconds']:>10.2f}"
+                  f"{result['creates_per_second']:>12.1f}{result['sessions']:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Measures the `sql` filter on lists of 10^3 to 10^6 values, such as a storage integration's allowed
+locations or a file format's NULL_IF, comparing the previous recursive implementation against the
+dispatch table, joined builders and the single-scan validation of string lists.  Mixed lists and
+lists of dicts exercise the general path.
+
+    python -m benchmark.filters [--sizes 1000 10000 100000 1000000]
+"""
+import argparse
+import time
+
+from pulumi_snowflake.baseprovider.filters import to_sql
+from pulumi_snowflake.validation import Validation
+
+
+def previous_to_sql(value, allow_none=True):
+    """
+    The `sql` filter as it was before the rework.
+    """
+    if allow_none and value is None:
+        return None
+    elif isinstance(value, str):
+        Validation.validate_string(value)
+        return f"'{value}'"
+    elif isinstance(value, dict):
+        valid_keys = list(filter(lambda k: value[k] is not None, value.keys()))
+        sql_values = {k: previous_to_sql(value[k]) for k in valid_keys}
+        sql_statements = [f"{key.upper()} = {sql_values[key]}" for key in valid_keys]
+        return f"({','.join(sql_statements)})"
+    elif isinstance(value, list):
+        all_values = list(map(lambda v: previous_to_sql(v), value))
+        return f"({','.join(all_values)})"
+    elif isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    elif isinstance(value, (int, float)):
+        if int(value) == value:
+            value = int(value)
+        return f"{value}"
+    else:
+        raise Exception(f"Cannot convert type '{type(value)}' to SQL representation")
+
+
+def measure(function, value):
+    start = time.perf_counter()
+    result = function(value)
+    return (time.perf_counter() - start, result)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[1_000, 10_000, 100_000, 1_000_000],
+                        help="List lengths to convert")
+    args = parser.parse_args()
+
+    print(f"{'case':<18}{'items':>10}{'previous (ms)':>16}{'current (ms)':>15}{'speedup':>10}")
+
+    for size in args.sizes:
+        cases = [
+            ("strings", [f"s3://bucket/path/{index}/" for index in range(size)]),
+            ("mixed", [f"value_{index}" if index % 3 else index for index in range(size)]),
+            ("dicts", [{"name": f"value_{index}", "size": index, "unset": None}
+                       for index in range(size // 10)]),
+        ]
+
+        for (name, value) in cases:
+            (previous_seconds, previous_sql) = measure(previous_to_sql, value)
+            (current_seconds, current_sql) = measure(to_sql, value)
+
+            if previous_sql != current_sql:
+                raise Exception(f"Converting {name} gives different SQL")
+
+            print(f"{name:<18}{len(value):>10}{previous_seconds * 1e3:>16.1f}"
+                  f"{current_seconds * 1e3:>15.1f}{previous_seconds / current_seconds:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Measures the time taken to import pulumi_snowflake and its resource sub-packages using
+`python -X importtime`, and fails if it exceeds a threshold or if a heavy dependency which should
+only be imported on first connection (such as `snowflake.connector`) is imported.
+
+`pulumi` and `jinja2` are imported before pulumi_snowflake, so the measurement only covers this
+package's own import cost rather than that of its required dependencies.
+
+    python -m benchmark.import_time [--max-ms MILLISECONDS] [--repeat N]
+"""
+import argparse
+import subprocess
+import sys
+
+MODULES = [
+    "pulumi_snowflake",
+    "pulumi_snowflake.database",
+    "pulumi_snowflake.fileformat",
+    "pulumi_snowflake.pipe",
+    "pulumi_snowflake.schema",
+    "pulumi_snowflake.stage",
+    "pulumi_snowflake.storageintegration",
+    "pulumi_snowflake.table",
+    "pulumi_snowflake.warehouse",
+]
+
+FORBIDDEN_MODULES = [
+    "snowflake.connector",
+    "pyarrow",
+    "boto3",
+    "botocore",
+]
+"""
+Modules which must not be imported until a connection is made.
+"""
+
+
+def measure_import_time():
+    """
+    Imports the package in a fresh interpreter and returns a tuple of the cumulative import time in
+    milliseconds and the set of modules which were imported.
+    """
+    code = "import pulumi, jinja2; " + "; ".join(f"import {module}" for module in MODULES)
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True
+    )
+
+    total_us = 0
+    imported = set()
+
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        (_, cumulative, name) = line[len("import time:"):].split("|")
+
+        if not cumulative.strip().isdigit():
+            continue
+
+        imported.add(name.strip())
+
+        # Only top-level entries are summed, since their cumulative time already includes nested
+        # imports
+        if name.startswith(" pulumi_snowflake") and not name.startswith("  "):
+            total_us += int(cumulative)
+
+    return total_us / 1000, imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-ms", type=float, default=150,
+                        help="Maximum allowed import time in milliseconds")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="Number of runs, the fastest is reported")
+    args = parser.parse_args()
+
+    runs = [measure_import_time() for _ in range(args.repeat)]
+    best_ms = min(total_ms for (total_ms, _) in runs)
+    imported = runs[0][1]
+
+    print(f"pulumi_snowflake import time: {best_ms:.1f}ms "
+          f"(best of {args.repeat}, threshold {args.max_ms:.0f}ms)")
+
+    failures = []
+
+    for module in FORBIDDEN_MODULES:
+        if module in imported:
+            failures.append(f"{module} was imported")
+
+    if best_ms > args.max_ms:
+        failures.append(f"import time {best_ms:.1f}ms exceeds threshold {args.max_ms:.0f}ms")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Drives every dynamic provider through the real connector path of `Client` (pooling, retries and
+asynchronous execution in `snowflake.connector`) against a `LocalSnowflakeServer` on localhost.
+Each resource set is a database containing a schema, file format, stage, table and pipe, plus a
+storage integration and a warehouse, which are created concurrently and then deleted.  The server
+adds latency to logins and statements and can fail or throttle a fraction of requests, so the
+results show how each client configuration copes with a slow or unreliable service.
+
+    python -m benchmark.local_server [--resources N] [--workers N] [--latency SECONDS]
+                                     [--login-latency SECONDS] [--error-rate FRACTION]
+                                     [--throttle-rate FRACTION]
+"""
+import argparse
+import contextlib
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pulumi_snowflake import Client, Provider
+from pulumi_snowflake.async_executor import close_all_executors
+from pulumi_snowflake.concurrency import clear_limiters
+from pulumi_snowflake.connection_pool import close_all_pools
+from pulumi_snowflake.database import DatabaseProvider
+from pulumi_snowflake.fileformat import FileFormatProvider
+from pulumi_snowflake.pipe import PipeProvider
+from pulumi_snowflake.schema import SchemaProvider
+from pulumi_snowflake.stage import StageProvider
+from pulumi_snowflake.storageintegration import StorageIntegrationProvider
+from pulumi_snowflake.table import TableProvider
+from pulumi_snowflake.testing import LocalSnowflakeServer
+from pulumi_snowflake.token_cache import clear_memory_cache
+from pulumi_snowflake.warehouse import WarehouseProvider
+
+CONFIGURATIONS = {
+    "single session": {"pool_max_size": 1},
+    "pooled": {"pool_max_size": 16},
+    "pooled, token cache": {"pool_max_size": 16, "token_cache": "memory"},
+    "async": {"pool_max_size": 4, "async_execution": True, "max_in_flight": 64},
+    "pooled, limit 8": {"pool_max_size": 16, "max_concurrency": 8},
+}
+
+
+def get_resource_inputs(index):
+    """
+    Returns the providers and inputs of one resource set, in dependency order.
+    """
+    database = f"db_{index}"
+    schema = "benchmark"
+    return [
+        (DatabaseProvider, {"name": database, "comment": "benchmark"}),
+        (StorageIntegrationProvider, {
+            "name": f"integration_{index}", "type": "EXTERNAL_STAGE", "enabled": True,
+            "storage_provider": "S3", "storage_allowed_locations": ["s3://bucket/"],
+            "storage_aws_role_arn": "arn:aws:iam::001234567890:role/benchmark"}),
+        (WarehouseProvider, {"name": f"wh_{index}", "warehouse_size": "XSMALL",
+                             "auto_resume": True, "initially_suspended": True}),
+        (SchemaProvider, {"name": schema, "database": database, "data_retention_time_in_days": 1}),
+        (FileFormatProvider, {"name": "csv", "database": database, "schema": schema, "type": "CSV",
+                              "skip_header": 1, "null_if": ["", "NULL"]}),
+        (StageProvider, {"name": "stage", "database": database, "schema": schema,
+                         "url": "s3://bucket/", "storage_integration": f"integration_{index}",
+                         "copy_options": {"on_error": "CONTINUE"}}),
+        (TableProvider, {"name": "events", "database": database, "schema": schema,
+                         "columns": [{"name": "id", "type": "NUMBER(38,0)", "not_null": True},
+                                     {"name": "data", "type": "VARIANT"}],
+                         "cluster_by": ["id"]}),
+        (PipeProvider, {"name": "pipe", "database": database, "schema": schema,
+                        "code": f"COPY INTO {database}.{schema}.events "
+                                f"FROM @{database}.{schema}.stage "
+                                f"FILE_FORMAT = (FORMAT_NAME = '{database}.{schema}.csv')"}),
+    ]
+
+
+def run_resource_set(provider_params, client, index):
+    created = []
+
+    for (provider_class, inputs) in get_resource_inputs(index):
+        provider = provider_class(provider_params, client)
+        created.append((provider, provider.create(inputs)))
+
+    for (provider, result) in reversed(created):
+        provider.delete(result.id, result.outs)
+
+
+def run(server, name, parameters, resources, workers):
+    close_all_executors()
+    close_all_pools()
+    clear_limiters()
+    clear_memory_cache()
+
+    (logins, queries) = (server.logins, server.queries)
+    provider_params = Provider(
+        username="benchmark",
+        password="benchmark",
+        account_name="benchmark",
+        **server.connection_parameters,
+        **parameters
+    )
+    client = Client(provider_params)
+
+    start = time.perf_counter()
+
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        with ThreadPoolExecutor(max_workers=workers) as threads:
+            list(threads.map(lambda index: run_resource_set(provider_params, client, index),
+                             range(resources)))
+
+    elapsed = time.perf_counter() - start
+
+    close_all_executors()
+    close_all_pools()
+
+    if server.catalog.objects:
+        raise Exception(f"{len(server.catalog.objects)} objects were not deleted by "
+                        f"configuration '{name}'")
+
+    return {
+        "configuration": name,
+        "seconds": elapsed,
+        "operations_per_second": resources * len(get_resource_inputs(0)) * 2 / elapsed,
+        "logins": server.logins - logins,
+        "requests": server.queries - queries,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resources", type=int, default=50,
+                        help="Resource sets created and deleted")
+    parser.add_argument("--workers", type=int, default=16,
+                        help="Resource sets processed concurrently")
+    parser.add_argument("--latency", type=float, default=0.02,
+                        help="Seconds taken by each statement")
+    parser.add_argument("--login-latency", type=float, default=0.2,
+                        help="Seconds taken by each login")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="Fraction of requests failing with HTTP 503")
+    parser.add_argument("--throttle-rate", type=float, default=0.0,
+                        help="Fraction of requests failing with HTTP 429")
+    parser.add_argument("--configurations", nargs="+", choices=list(CONFIGURATIONS),
+                        default=list(CONFIGURATIONS), help="Client configurations to compare")
+    args = parser.parse_args()
+
+    server = LocalSnowflakeServer(latency=args.latency, login_latency=args.login_latency,
+                                  error_rate=args.error_rate, throttle_rate=args.throttle_rate)
+
+    print(f"{'configuration':<22}{'seconds':>10}{'ops/s':>10}{'logins':>8}{'requests':>10}")
+
+    with server:
+        for name in args.configurations:
+            result = run(server, name, CONFIGURATIONS[name], args.resources, args.workers)
+            print(f"{result['configuration']:<22}{result['seconds']:>10.2f}"
+                  f"{result['operations_per_second']:>10.1f}{result['logins']:>8}"
+                  f"{result['requests']:>10}")
+
+    print(f"injected failures: {server.failed_requests}, throttled requests: "
+          f"{server.throttled_requests}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+"""
+Times `generate_sql_create_statement` and `generate_sql_drop_statement` for every provider, with
+realistic inputs and with extreme ones: a table with 5,000 columns, a file format with every option
+set, a storage integration with 10,000 allowed locations and a stage with large copy options.  No
+network access is needed.  The create SQL is also written to a file in chunks with
+`write_sql_create_statement`, and the peak memory allocated by each operation is measured with
+`tracemalloc`.
+
+Results can be written as JSON and compared with an earlier run, in which case the suite fails if
+any case is slower than the baseline by more than the threshold:
+
+    python -m benchmark.sql_generation [--output results.json] [--baseline baseline.json]
+                                       [--threshold 0.25] [--min-seconds SECONDS]
+                                       [--cases NAME ...]
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+from pulumi_snowflake.database import DatabaseProvider
+from pulumi_snowflake.fileformat import FileFormatProvider, file_format_provider
+from pulumi_snowflake.pipe import PipeProvider
+from pulumi_snowflake.schema import SchemaProvider
+from pulumi_snowflake.stage import StageProvider
+from pulumi_snowflake.storageintegration import StorageIntegrationProvider
+from pulumi_snowflake.table import TableProvider
+from pulumi_snowflake.table.column import Column
+from pulumi_snowflake.warehouse import WarehouseProvider
+
+COLUMN_TYPES = ["NUMBER(38,0)", "VARCHAR(256)", "TIMESTAMP_NTZ", "VARIANT", "BOOLEAN"]
+
+
+def get_table_columns(count):
+    return [
+        Column(
+            name=f"column_{index}",
+            type=COLUMN_TYPES[index % len(COLUMN_TYPES)],
+            not_null=index % 3 == 0,
+            default="0" if index % 7 == 0 else None,
+            collation="en-ci" if index % 11 == 0 else None
+        ).as_dict()
+        for index in range(count)
+    ]
+
+
+def get_all_file_format_options():
+    """
+    Returns inputs setting every option of a file format, whether or not Snowflake allows them
+    together.
+    """
+    sample_values = {"string": "value", "number": 1, "bool": True, "list": ["", "NULL", "\\\\N"]}
+    return {spec.name: sample_values[spec.kind] for spec in file_format_provider.PROPERTIES.specs}
+
+
+def get_cases():
+    """
+    Returns a list of tuples of case name, provider class and inputs.
+    """
+    schema_scope = {"database": "benchmark_db", "schema": "benchmark_schema"}
+
+    return [
+        ("database", DatabaseProvider, {"comment": "Benchmark database",
+                                        "data_retention_time_in_days": 7}),
+        ("schema", SchemaProvider, {"database": "benchmark_db", "transient": True,
+                                    "comment": "Benchmark schema"}),
+        ("warehouse", WarehouseProvider, {"warehouse_size": "XSMALL", "auto_suspend": 60,
+                                          "auto_resume": True, "initially_suspended": True,
+                                          "comment": "Benchmark warehouse"}),
+        ("pipe", PipeProvider, {**schema_scope, "auto_ingest": True,
+                                "code": "COPY INTO benchmark_db.benchmark_schema.events "
+                                        "FROM @benchmark_db.benchmark_schema.stage"}),
+        ("file_format", FileFormatProvider, {**schema_scope, "type": "CSV", "skip_header": 1,
+                                             "null_if": ["", "NULL"],
+                                             "field_optionally_enclosed_by": "\""}),
+        ("file_format_all_options", FileFormatProvider,
+         {**schema_scope, **get_all_file_format_options()}),
+        ("storage_integration", StorageIntegrationProvider, {
+            "type": "EXTERNAL_STAGE", "storage_provider": "S3", "enabled": True,
+            "storage_aws_role_arn": "arn:aws:iam::001234567890:role/benchmark",
+            "storage_allowed_locations": ["s3://bucket/path/"]
+        }),
+        ("storage_integration_10k_locations", StorageIntegrationProvider, {
+            "type": "EXTERNAL_STAGE", "storage_provider": "S3", "enabled": True,
+            "storage_aws_role_arn": "arn:aws:iam::001234567890:role/benchmark",
+            "storage_allowed_locations": [f"s3://bucket-{index}/path/" for index in range(10_000)],
+            "storage_blocked_locations": [f"s3://bucket-{index}/private/" for index in range(100)]
+        }),
+        ("stage", StageProvider, {
+            **schema_scope, "url": "s3://bucket/path/", "storage_integration": "integration",
+            "file_format": {"format_name": "benchmark_db.benchmark_schema.csv"},
+            "copy_options": {"on_error": "CONTINUE"}
+        }),
+        ("stage_large_copy_options", StageProvider, {
+            **schema_scope, "url": "s3://bucket/path/", "storage_integration": "integration",
+            "file_format": {"type": "CSV", "null_if": [f"null_{index}" for index in range(200)],
+                            "skip_header": 1},
+            "copy_options": {
+                "on_error": "SKIP_FILE_10%", "size_limit": 1_000_000, "purge": True,
+                "return_failed_only": True, "match_by_column_name": "CASE_INSENSITIVE",
+                "enforce_length": False, "truncatecolumns": None, "force": False,
+                "load_uncertain_files": True,
+                **{f"option_{index}": f"value_{index}" for index in range(1_000)}
+            }
+        }),
+        ("table", TableProvider, {**schema_scope, "columns": get_table_columns(20),
+                                  "cluster_by": ["column_0"], "comment": "Benchmark table"}),
+        ("table_5000_columns", TableProvider, {**schema_scope, "columns": get_table_columns(5_000),
+                                               "cluster_by": ["column_0", "column_1"],
+                                               "data_retention_time_in_days": 1}),
+        ("table_20000_columns", TableProvider,
+         {**schema_scope, "columns": get_table_columns(20_000)}),
+    ]
+
+
+def time_call(function, min_seconds):
+    """
+    Calls `function` repeatedly for at least `min_seconds` and at least 5 times, and returns the
+    fastest and median times of a single call in microseconds.  The fastest time is the least
+    affected by noise, so it is the one compared against baselines.
+    """
+    times = []
+    deadline = time.perf_counter() + min_seconds
+
+    while len(times) < 5 or time.perf_counter() < deadline:
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+
+    return {"min_us": min(times) * 1e6, "median_us": statistics.median(times) * 1e6,
+            "calls": len(times)}
+
+
+def measure_peak_memory(function):
+    """
+    Returns the peak memory allocated while calling `function`, in bytes, excluding memory
+    allocated beforehand.
+    """
+    tracemalloc.start()
+
+    try:
+        function()
+        (_, peak) = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+def run_case(provider_class, inputs, min_seconds):
+    provider = provider_class(None, None)
+    environment = provider._create_jinja_environment()
+    name = "benchmark_object"
+
+    def create():
+        return provider.generate_sql_create_statement(name, inputs, environment)
+
+    def drop():
+        return provider.generate_sql_drop_statement(name, inputs, environment)
+
+    with open(os.devnull, "w") as devnull:
+        def stream():
+            return provider.write_sql_create_statement(name, inputs, devnull)
+
+        # Warm up caches, such as enquoted identifiers, before measuring memory
+        operations = {"create": create, "drop": drop, "stream": stream}
+        sql = {operation: function() for (operation, function) in operations.items()}
+        lengths = {operation: value if isinstance(value, int) else len(value)
+                   for (operation, value) in sql.items()}
+
+        return {
+            operation: {
+                **time_call(function, min_seconds),
+                "peak_bytes": measure_peak_memory(function),
+                "sql_length": lengths[operation]
+            }
+            for (operation, function) in operations.items()
+        }
+
+
+def find_regressions(results, baseline, threshold):
+    """
+    Returns a description of each case and operation whose fastest time exceeds the baseline by
+    more than `threshold`, as a fraction of the baseline.
+    """
+    regressions = []
+
+    for (case, operations) in results["cases"].items():
+        for (operation, result) in operations.items():
+            baseline_result = baseline.get("cases", {}).get(case, {}).get(operation)
+
+            if baseline_result is None:
+                continue
+
+            ratio = result["min_us"] / baseline_result["min_us"]
+
+            if ratio > 1 + threshold:
+                regressions.append(f"{case} {operation}: {result['min_us']:.1f}us vs baseline "
+                                   f"{baseline_result['min_us']:.1f}us ({ratio:.2f}x)")
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", help="File to which the results are written as JSON")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Fraction by which a case may be slower than the baseline before "
+                             "the suite fails")
+    parser.add_argument("--min-seconds", type=float, default=0.5,
+                        help="Minimum time spent timing each operation")
+    parser.add_argument("--cases", nargs="+",
+                        help="Names of the cases to run, by default all of them")
+    args = parser.parse_args()
+
+    results = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "cases": {},
+    }
+
+    print(f"{'case':<36}{'create (us)':>14}{'drop (us)':>12}{'stream (us)':>14}"
+          f"{'create peak (KiB)':>19}{'stream peak (KiB)':>19}{'SQL length':>12}")
+
+    for (name, provider_class, inputs) in get_cases():
+        if args.cases and name not in args.cases:
+            continue
+
+        result = run_case(provider_class, inputs, args.min_seconds)
+        results["cases"][name] = result
+
+        print(f"{name:<36}{result['create']['min_us']:>14.1f}{result['drop']['min_us']:>12.1f}"
+              f"{result['stream']['min_us']:>14.1f}{result['create']['peak_bytes'] / 1024:>19.1f}"
+              f"{result['stream']['peak_bytes'] / 1024:>19.1f}"
+              f"{result['create']['sql_length']:>12}")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = find_regressions(results, json.load(file), args.threshold)
+
+        for regression in regressions:
+            print(f"FAIL: {regression}")
+
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
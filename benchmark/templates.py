@@ -0,0 +1,112 @@
+"""
+Measures the cost of generating each provider's create statement from its reference Jinja template
+(from the test fixtures), compiled on every call in a new environment as providers did before, and
+compiled once, against the Jinja-free property clause builders which providers now use.  Every
+method must render the same SQL.
+
+    python -m benchmark.templates [--iterations N]
+"""
+import argparse
+import time
+
+from pulumi_snowflake.database import DatabaseProvider
+from pulumi_snowflake.fileformat import FileFormatProvider
+from pulumi_snowflake.pipe import PipeProvider
+from pulumi_snowflake.schema import SchemaProvider
+from pulumi_snowflake.stage import StageProvider
+from pulumi_snowflake.storageintegration import StorageIntegrationProvider
+from pulumi_snowflake.table import TableProvider
+from pulumi_snowflake.warehouse import WarehouseProvider
+from test.provider.reference_templates import CREATE_TEMPLATES
+
+CASES = [
+    (DatabaseProvider, {"comment": "benchmark", "data_retention_time_in_days": 1}),
+    (SchemaProvider, {"database": "benchmark_db", "comment": "benchmark"}),
+    (FileFormatProvider, {"database": "benchmark_db", "schema": "public", "type": "CSV",
+                          "compression": "GZIP", "skip_header": 1, "null_if": ["", "NULL"],
+                          "field_optionally_enclosed_by": "\"", "trim_space": True}),
+    (StageProvider, {"database": "benchmark_db", "schema": "public", "url": "s3://bucket/",
+                     "storage_integration": "integration",
+                     "copy_options": {"on_error": "CONTINUE"}}),
+    (StorageIntegrationProvider, {"type": "EXTERNAL_STAGE", "enabled": True,
+                                  "storage_provider": "S3",
+                                  "storage_allowed_locations": ["s3://bucket/"]}),
+    (TableProvider, {"database": "benchmark_db", "schema": "public",
+                     "columns": [{"name": f"column_{i}", "type": "VARCHAR"} for i in range(20)]}),
+    (PipeProvider, {"database": "benchmark_db", "schema": "public", "auto_ingest": True,
+                    "code": "COPY INTO benchmark_db.public.t FROM @benchmark_db.public.s"}),
+    (WarehouseProvider, {"warehouse_size": "XSMALL", "auto_resume": True}),
+]
+
+
+def get_context(provider, inputs):
+    return {
+        **inputs,
+        "full_name": provider._get_full_object_name(inputs, "benchmark_name"),
+        "resource_type": provider.resource_type
+    }
+
+
+def time_per_render(render, iterations):
+    start = time.perf_counter()
+
+    for _ in range(iterations):
+        render()
+
+    return (time.perf_counter() - start) / iterations
+
+
+def run(iterations):
+    """
+    Returns, for each provider class name, the time of a single render with each method in
+    seconds.
+    """
+    results = {}
+
+    for (provider_class, inputs) in CASES:
+        provider = provider_class(None, None)
+        context = get_context(provider, inputs)
+        source = CREATE_TEMPLATES[provider_class]
+        template = provider._create_jinja_environment().from_string(source)
+
+        def compile_and_render():
+            return provider._create_jinja_environment().from_string(source).render(context)
+
+        def render_precompiled():
+            return template.render(context)
+
+        def render_property_specs():
+            return provider.generate_sql_create_statement("benchmark_name", inputs, None)
+
+        if not compile_and_render() == render_precompiled() == render_property_specs():
+            raise Exception(f"{provider_class.__name__} renders different SQL with each method")
+
+        results[provider_class.__name__] = {
+            "compiled_per_call": time_per_render(compile_and_render, iterations),
+            "precompiled": time_per_render(render_precompiled, iterations),
+            "property_specs": time_per_render(render_property_specs, iterations)
+        }
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200,
+                        help="Renders per provider and method")
+    args = parser.parse_args()
+
+    print(f"{'provider':<28}{'compiled per call (us)':>24}{'precompiled (us)':>18}"
+          f"{'property specs (us)':>21}{'speedup':>10}")
+
+    for (name, result) in run(args.iterations).items():
+        before = result["compiled_per_call"]
+        after = result["property_specs"]
+
+        print(f"{name:<28}{before * 1e6:>24.1f}{result['precompiled'] * 1e6:>18.1f}"
+              f"{after * 1e6:>21.1f}{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Measures identifier and string validation over 100k values: enquoting identifiers with the patterns
+compiled on every call (as before they became class attributes), with precompiled patterns and with
+memoization, and validating strings one at a time against the batch `validate_strings` scan.
+Identifiers are drawn from a small set of names, as in a stack where the same databases and schemas
+qualify every object, and from unique names.
+
+    python -m benchmark.validation [--count N] [--distinct N]
+"""
+import argparse
+import re
+import time
+
+from pulumi_snowflake.validation import Validation
+
+
+def legacy_enquote_identifier(id):
+    """
+    `enquote_identifier` as it was before its patterns were precompiled and its results memoized.
+    """
+    if id is None:
+        return None
+    elif Validation.identifier_regex.match(id):
+        return id
+    elif not re.compile("^[\x20-\x21\x23-\x7E]*$").match(id):
+        raise Exception(f"Invalid identifier: {id}")
+    else:
+        return f'"{id}"'
+
+
+def legacy_validate_string(string):
+    if not re.compile("^(?:[^'\\\\]|\\\\.)*$").match(string):
+        raise Exception(f'Invalid Snowflake string: {string}')
+
+
+def measure(function, values):
+    start = time.perf_counter()
+    function(values)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=100_000,
+                        help="Values validated by each method")
+    parser.add_argument("--distinct", type=int, default=1_000,
+                        help="Distinct identifiers in the repeated set")
+    args = parser.parse_args()
+
+    repeated = [f"name-{index % args.distinct}" for index in range(args.count)]
+    unique = [f"unique name {index}" for index in range(args.count)]
+    strings = [f"s3://bucket/path/{index}/it\\'s" for index in range(args.count)]
+    uncached_enquote = Validation.enquote_identifier.__wrapped__
+
+    print(f"{'case':<44}{'ms':>10}{'ns/value':>10}")
+
+    cases = [
+        ("enquote repeated, compiled per call",
+         lambda values: [legacy_enquote_identifier(v) for v in values], repeated),
+        ("enquote repeated, precompiled",
+         lambda values: [uncached_enquote(v) for v in values], repeated),
+        ("enquote repeated, memoized", Validation.enquote_identifiers, repeated),
+        ("enquote unique, compiled per call",
+         lambda values: [legacy_enquote_identifier(v) for v in values], unique),
+        ("enquote unique, memoized", Validation.enquote_identifiers, unique),
+        ("validate strings, compiled per call",
+         lambda values: [legacy_validate_string(v) for v in values], strings),
+        ("validate strings, precompiled",
+         lambda values: [Validation.validate_string(v) for v in values], strings),
+        ("validate strings, batch", Validation.validate_strings, strings),
+    ]
+
+    for (name, function, values) in cases:
+        Validation.enquote_identifier.cache_clear()
+        seconds = measure(function, values)
+        print(f"{name:<44}{seconds * 1e3:>10.1f}{seconds * 1e9 / len(values):>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,46 @@
-from .client import Client
-from .provider import Provider
+"""
+The package's public classes and sub-packages are imported lazily on first access, so that
+importing `pulumi_snowflake` (which the Pulumi language host does for every program) stays fast.
+In particular, `snowflake.connector` is only imported when the first connection is made.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .provider import Provider
+
+__all__ = ["Client", "Provider"]
+
+_exports = {
+    "Client": ".client",
+    "Provider": ".provider",
+}
+
+_subpackages = {
+    "baseprovider",
+    "database",
+    "fileformat",
+    "pipe",
+    "schema",
+    "stage",
+    "storageintegration",
+    "table",
+    "warehouse",
+}
+
+
+def __getattr__(name):
+    if name in _exports:
+        value = getattr(importlib.import_module(_exports[name], __name__), name)
+        globals()[name] = value
+        return value
+
+    if name in _subpackages:
+        return importlib.import_module(f".{name}", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_exports) | _subpackages)
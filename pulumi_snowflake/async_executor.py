@@ -0,0 +1,418 @@
+import asyncio
+import atexit
+import functools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Hashable, NamedTuple, Optional, Tuple
+
+from .connection_pool import ConnectionPool, PooledConnection
+
+
+DEFAULT_MAX_IN_FLIGHT = 32
+"""
+The default maximum number of statements which are running on a multiplexed session at the same
+time.
+"""
+
+DEFAULT_POLL_INTERVAL = 0.05
+"""
+The initial number of seconds between query status checks.  The interval doubles up to
+`DEFAULT_MAX_POLL_INTERVAL`.
+"""
+
+DEFAULT_MAX_POLL_INTERVAL = 1.0
+
+
+class AsyncQuery(NamedTuple):
+    """
+    A statement which has finished running on an `AsyncExecutor`.
+    """
+
+    query_id: str
+
+    rowcount: Optional[int]
+    """
+    The number of rows produced by the statement, as reported by the final status check, if known.
+    """
+
+    results: Tuple["AsyncQuery", ...] = ()
+    """
+    The query ID and row count of each statement of a multi-statement request, in order.  Empty for
+    a single statement.
+    """
+
+
+class AsyncExecutor:
+    """
+    Keeps many statements in flight on a single Snowflake session.  Statements are submitted with
+    the connector's `execute_async` and their query IDs are polled from an asyncio event loop
+    running on a background thread, so a provider thread waiting for a statement does not hold a
+    session of its own.
+    """
+
+    def __init__(self,
+                 pool: ConnectionPool,
+                 max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL):
+        """
+        :param pool: The pool from which the shared session is borrowed
+        :param max_in_flight: The maximum number of statements running at the same time
+        :param poll_interval: The initial number of seconds between query status checks
+        :param max_poll_interval: The maximum number of seconds between query status checks
+        """
+        self.pool = pool
+        self.max_in_flight = max_in_flight
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._blocking_calls: Optional[ThreadPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._connection: Optional[PooledConnection] = None
+
+        # The number of statements running on each session, and the sessions which have been
+        # replaced and are logged out once their last statement finishes
+        self._statements: Dict[PooledConnection, int] = {}
+        self._retired = set()
+
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.completed = 0
+
+    def submit(self, statement: str, **kwargs) -> Future:
+        """
+        Submits a statement and returns a future which resolves to an `AsyncQuery` once it has
+        finished.  Keyword arguments are passed on to the connector's `execute_async`.
+        """
+        return asyncio.run_coroutine_threadsafe(self._run(statement, kwargs), self._get_loop())
+
+    def execute(self, statement: str, **kwargs) -> str:
+        """
+        Submits a statement and blocks until it has finished, returning its query ID.
+        """
+        return self.execute_query(statement, **kwargs).query_id
+
+    def execute_query(self, statement: str, **kwargs) -> AsyncQuery:
+        """
+        Submits a statement and blocks until it has finished, returning its query ID and row count.
+        """
+        return self.submit(statement, **kwargs).result()
+
+    async def execute_async(self, statement: str, **kwargs) -> str:
+        """
+        Coroutine version of `execute` which may be awaited from any event loop.
+        """
+        return (await asyncio.wrap_future(self.submit(statement, **kwargs))).query_id
+
+    def get_connection(self) -> PooledConnection:
+        """
+        Returns the shared session, borrowing it from the pool on first use.
+        """
+        with self._lock:
+            if self._connection is None:
+                self._connection = self.pool.acquire()
+
+            return self._connection
+
+    def invalidate_connection(self):
+        """
+        Replaces the shared session, for example after it has expired, so that the next statement
+        opens a new session.  Other statements may still be running on the old session, so it is
+        only logged out once they have finished.
+        """
+        with self._lock:
+            connection = self._connection
+            self._connection = None
+
+            if connection is None:
+                return
+
+            if self._statements.get(connection):
+                self._retired.add(connection)
+                return
+
+        connection.invalidate()
+
+    def close(self):
+        """
+        Stops the event loop and returns the shared session to the pool.
+        """
+        with self._lock:
+            loop, thread, blocking_calls, connection, retired = \
+                self._loop, self._thread, self._blocking_calls, self._connection, self._retired
+            self._loop = None
+            self._thread = None
+            self._blocking_calls = None
+            self._semaphore = None
+            self._connection = None
+            self._statements = {}
+            self._retired = set()
+
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+            blocking_calls.shutdown()
+
+        if connection is not None:
+            connection.close()
+
+        for retired_connection in retired:
+            retired_connection.invalidate()
+
+    async def _run(self, statement, kwargs):
+        loop = asyncio.get_event_loop()
+
+        async with self._get_semaphore():
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+            try:
+                connection = await loop.run_in_executor(self._blocking_calls,
+                                                        self._start_statement)
+
+                try:
+                    query_id = await loop.run_in_executor(
+                        self._blocking_calls,
+                        functools.partial(self._submit_statement, connection, statement, kwargs)
+                    )
+                    rowcount = await self._wait_for_query(loop, connection, query_id)
+                    results = ()
+
+                    if _is_multi_statement(kwargs):
+                        results = await self._get_statement_results(loop, connection, query_id)
+                finally:
+                    await loop.run_in_executor(self._blocking_calls, self._finish_statement,
+                                               connection)
+            finally:
+                self.in_flight -= 1
+
+        self.completed += 1
+        return AsyncQuery(query_id, rowcount, results)
+
+    def _start_statement(self):
+        with self._lock:
+            if self._connection is None:
+                self._connection = self.pool.acquire()
+
+            connection = self._connection
+            self._statements[connection] = self._statements.get(connection, 0) + 1
+
+        return connection
+
+    def _finish_statement(self, connection):
+        with self._lock:
+            remaining = self._statements.get(connection, 1) - 1
+
+            if remaining > 0:
+                self._statements[connection] = remaining
+                return
+
+            self._statements.pop(connection, None)
+
+            if connection not in self._retired:
+                return
+
+            self._retired.remove(connection)
+
+        connection.invalidate()
+
+    def _submit_statement(self, connection, statement, kwargs):
+        cursor = connection.cursor()
+
+        try:
+            cursor.execute_async(statement, **kwargs)
+            return cursor.sfqid
+        finally:
+            cursor.close()
+
+    async def _wait_for_query(self, loop, connection, query_id):
+        """
+        Polls the status of a query until it has finished, and returns the number of rows it
+        produced, if the status response has it, so that the results need not be fetched just to
+        count them.
+        """
+        interval = self.poll_interval
+
+        while True:
+            await asyncio.sleep(interval)
+
+            # The connector's public status methods discard the response, which holds the query's
+            # statistics
+            (status, response) = await loop.run_in_executor(
+                self._blocking_calls,
+                connection._get_query_status,
+                query_id
+            )
+
+            if connection.is_an_error(status):
+                connection._process_error_query_status(query_id, response)
+
+            if not connection.is_still_running(status):
+                return _get_produced_rows(response)
+
+            interval = min(interval * 2, self.max_poll_interval)
+
+    async def _get_statement_results(self, loop, connection, query_id):
+        """
+        Returns the query ID and row count of each statement of a finished multi-statement request.
+        The statements' query IDs are listed in the request's result, and their row counts are read
+        from their status, so that no results are fetched.
+        """
+        response = await loop.run_in_executor(
+            self._blocking_calls,
+            functools.partial(connection.rest.request, url=f"/queries/{query_id}/result",
+                              method="get")
+        )
+        result_ids_text = (response.get("data") or {}).get("resultIds") or ""
+        result_ids = [result_id for result_id in result_ids_text.split(",") if result_id]
+
+        statuses = await asyncio.gather(*[
+            loop.run_in_executor(self._blocking_calls, connection._get_query_status, result_id)
+            for result_id in result_ids
+        ])
+
+        return tuple(AsyncQuery(result_id, _get_produced_rows(status_response))
+                     for (result_id, (_, status_response)) in zip(result_ids, statuses))
+
+    def _get_semaphore(self):
+        # Created lazily so that it is bound to the executor's event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        return self._semaphore
+
+    def _get_loop(self):
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._blocking_calls = ThreadPoolExecutor(
+                    max_workers=min(self.max_in_flight, 16),
+                    thread_name_prefix="snowflake-async"
+                )
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="snowflake-async-executor",
+                    daemon=True
+                )
+                self._thread.start()
+
+            return self._loop
+
+
+class AsyncExecutorConnection:
+    """
+    A connection-like object whose cursors run statements through an `AsyncExecutor`, so that code
+    written against the connector's blocking `cursor.execute` shares one multiplexed session.
+    """
+
+    def __init__(self, executor: AsyncExecutor):
+        self.executor = executor
+
+    def cursor(self):
+        return AsyncExecutorCursor(self.executor)
+
+    def close(self):
+        """
+        The shared session stays open, it is closed with the executor.
+        """
+        pass
+
+    def invalidate(self):
+        self.executor.invalidate_connection()
+
+
+class AsyncExecutorCursor:
+    """
+    Cursor returned by `AsyncExecutorConnection`.  Once a statement has finished, any attribute
+    other than `execute`, `nextset`, `sfqid`, `rowcount` and `close` is delegated to a connector
+    cursor holding the statement's results.
+
+    As with a connector cursor, after a multi-statement request the cursor is at the first
+    statement, and `nextset` moves to the next one.
+    """
+
+    def __init__(self, executor: AsyncExecutor):
+        self.executor = executor
+        self.sfqid = None
+        self.rowcount = None
+        self._results_cursor = None
+        self._next_results = []
+
+    def execute(self, command: str, **kwargs):
+        query = self.executor.execute_query(command, **kwargs)
+        self._next_results = list(query.results) or [query]
+        self.nextset()
+        return self
+
+    def nextset(self):
+        """
+        Moves to the next statement of a multi-statement request, and returns the cursor, or `None`
+        if there are no more statements.
+        """
+        if not self._next_results:
+            return None
+
+        query = self._next_results.pop(0)
+        (self.sfqid, self.rowcount) = (query.query_id, query.rowcount)
+        self.close()
+
+        return self
+
+    def close(self):
+        if self._results_cursor is not None:
+            self._results_cursor.close()
+            self._results_cursor = None
+
+    def __getattr__(self, name):
+        if name.startswith("_") or self.sfqid is None:
+            raise AttributeError(name)
+
+        if self._results_cursor is None:
+            self._results_cursor = self.executor.get_connection().cursor()
+            self._results_cursor.get_results_from_sfqid(self.sfqid)
+
+        return getattr(self._results_cursor, name)
+
+
+def _is_multi_statement(kwargs) -> bool:
+    return (kwargs.get("_statement_params") or {}).get("MULTI_STATEMENT_COUNT", 1) != 1
+
+
+def _get_produced_rows(response) -> Optional[int]:
+    queries = (response.get("data") or {}).get("queries") or [{}]
+
+    return (queries[0].get("stats") or {}).get("producedRows")
+
+
+_executors: Dict[Hashable, AsyncExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_executor(key: Hashable, pool: ConnectionPool,
+                 max_in_flight: int = DEFAULT_MAX_IN_FLIGHT) -> AsyncExecutor:
+    """
+    Returns the process-wide executor for the given key, creating it if necessary.
+    """
+    with _executors_lock:
+        executor = _executors.get(key)
+
+        if executor is None:
+            executor = AsyncExecutor(pool, max_in_flight=max_in_flight)
+            _executors[key] = executor
+
+        return executor
+
+
+def close_all_executors():
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+
+    for executor in executors:
+        executor.close()
+
+
+atexit.register(close_all_executors)
@@ -1 +1,3 @@
 from .base_dynamic_provider import BaseDynamicProvider
+from .sql_plan import write_sql_plan
+from .statement_result import StatementResult
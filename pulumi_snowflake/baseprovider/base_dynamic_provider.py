@@ -1,22 +1,64 @@
-from typing import List
+import time
+from typing import Dict, FrozenSet, Iterator, List, Optional, TextIO, Union
 
 from pulumi import info
 from jinja2 import Environment
-from pulumi.dynamic import ResourceProvider, CreateResult, DiffResult
-
-from .filters import to_sql, to_identifier, dict_to_sql, number_to_sql, bool_to_sql, string_to_sql, list_to_sql
+from pulumi.dynamic import ResourceProvider, CreateResult, DiffResult, UpdateResult
+
+from .filters import to_sql, to_identifier, dict_to_sql, number_to_sql, bool_to_sql, \
+    string_to_sql, list_to_sql
+from .properties import ClauseBuilder
+from .renames import resolve_renames
+from .retry import RetryPolicy, retry_stats, make_idempotent, is_replayable
+from .sql_plan import RenderMode, write_sql_plan
+from .statement_result import StatementResult
 from .. import Provider
 from ..client import Client
 from ..validation import Validation
 from ..random_id import RandomId
 
+_jinja_environments: Dict[type, Environment] = {}
+"""
+The Jinja environment of each provider class, created the first time it is needed.
+"""
+
 
 class BaseDynamicProvider(ResourceProvider):
     """
     Generic base class for a Pulumi dynamic provider which manages Snowflake objects using a SQL
-    connection.  Subclasses should override the `generate_sql_create_statement` and `generate_sql_drop_statement`
-    methods to return the appropriate SQL.  These methods are passed a Jinja template with addition filters to help
-    create SQL statements.
+    connection.  Subclasses should override the `generate_sql_create_statement` and
+    `generate_sql_drop_statement` methods to return the appropriate SQL.  These methods are passed
+    a Jinja template with addition filters to help create SQL statements, and may return either a
+    single statement or a list of statements which are sent to Snowflake in one request.
+
+    In render-only mode (see `configure`), statements are written to the SQL plan (see
+    `write_sql_plan`) instead of being executed, and no connection is ever made.  Unless the stack
+    is set aside for review, the operations return placeholder results, so that a later deployment
+    still executes the statements: a created object is marked with `PLACEHOLDER_OUTPUT`, which
+    forces its replacement, an updated object keeps its old outputs, and a delete fails once its
+    statement has been written, so that the object stays in the stack state.
+    """
+
+    PLACEHOLDER_OUTPUT = "render_only_placeholder"
+    """
+    The output which marks an object recorded by render-only mode but never created.
+    """
+
+    retry_policy = RetryPolicy()
+    """
+    The policy used to retry statements which fail with a transient error.
+    """
+
+    updatable_properties: FrozenSet[str] = frozenset()
+    """
+    The inputs which can be changed in place by `update`.  A change to any other input replaces the
+    object.  Subclasses which add inputs here must implement `generate_sql_update_statements`.
+    """
+
+    render_mode: Optional[RenderMode] = None
+    """
+    The render mode set in the config of the running stack, once `configure` has been called.  It
+    defaults at class level so that providers pickled by an earlier release can still be used.
     """
 
     def __init__(self,
@@ -27,6 +69,26 @@ class BaseDynamicProvider(ResourceProvider):
         self.connection_provider = connection_provider
         self.resource_type = resource_type
 
+    def configure(self, req):
+        """
+        Called by Pulumi with the config of the running stack once the provider has been unpickled.
+        Render-only mode is taken from this config rather than from the provider parameters, since
+        Pulumi deletes an object with the provider pickled into its state when it was last created
+        or updated, which may have been before the stack was switched into or out of render-only
+        mode.
+
+        Pulumi configures a provider before it first diffs or changes an object, so this also
+        starts the warm-up of pooled sessions (see `Client.warm_up`), which then overlaps the diff
+        rather than delaying the first statement.
+        """
+        self.render_mode = RenderMode.from_config(req.config)
+
+        # Read with a default, since connection providers may not have it
+        warm_up = getattr(self.connection_provider, "warm_up", None)
+
+        if warm_up is not None and not self._is_render_only():
+            warm_up()
+
     def generate_sql_create_statement(self, name, inputs, environment=None):
         raise Exception("The BaseDynamicProvider class cannot be used directly, please create a subclass and "
                         "implement _generate_sql_create_statement")
@@ -35,6 +97,41 @@ class BaseDynamicProvider(ResourceProvider):
         raise Exception("The BaseDynamicProvider class cannot be used directly, please create a subclass and "
                         "implement _generate_sql_drop_statement")
 
+    def generate_sql_update_statements(self, name, olds, news, environment) -> List[str]:
+        raise Exception("The BaseDynamicProvider class cannot be used directly, please create a "
+                        "subclass and implement generate_sql_update_statements")
+
+    def generate_sql_create_chunks(self, name, inputs, environment=None) -> Iterator[str]:
+        """
+        Yields the SQL of `generate_sql_create_statement` in chunks which concatenate to the same
+        SQL, with multiple statements separated as in a multi-statement request.  Subclasses whose
+        statements can grow very large, such as tables with thousands of columns, override this to
+        render them incrementally, and build `generate_sql_create_statement` on it.
+        """
+        environment = environment or self._get_jinja_environment()
+        sql = self.generate_sql_create_statement(name, inputs, environment)
+
+        if isinstance(sql, str):
+            yield sql
+        else:
+            yield ";\n".join(sql)
+
+    def write_sql_create_statement(self, name, inputs, stream: TextIO) -> int:
+        """
+        Writes the create SQL into a text stream, such as an open file or an `io.StringIO` request
+        buffer, one chunk at a time so that the whole statement is never held in memory at once.
+        Returns the number of characters written.
+        """
+        written = 0
+
+        environment = self._get_jinja_environment()
+
+        for chunk in self.generate_sql_create_chunks(name, inputs, environment):
+            stream.write(chunk)
+            written += len(chunk)
+
+        return written
+
     def create(self, inputs):
 
         info(f"Creating object {self.resource_type}...")
@@ -45,10 +142,16 @@ class BaseDynamicProvider(ResourceProvider):
 
         validated_name = self._get_autogenerated_name(inputs)
 
-        # Perform SQL command to create object
-        environment = self._create_jinja_environment()
-        sql_statement = self.generate_sql_create_statement(validated_name, inputs, environment)
-        self._execute_sql(sql_statement)
+        # Perform SQL command to create object.  In render-only mode the statement is streamed into
+        # the plan.
+        if self._is_render_only():
+            chunks = self.generate_sql_create_chunks(validated_name, inputs,
+                                                     self._get_jinja_environment())
+            write_sql_plan(chunks, self._get_render_mode().plan_file)
+        else:
+            environment = self._get_jinja_environment()
+            sql_statement = self.generate_sql_create_statement(validated_name, inputs, environment)
+            self._execute_sql(sql_statement)
 
         # Generate provisional outputs from inputs.  Provisional because the call to generate_outputs below allows
         # subclasses to modify them if necessary.
@@ -57,20 +160,45 @@ class BaseDynamicProvider(ResourceProvider):
             **self._generate_outputs_from_inputs(inputs)
         }
 
+        outputs = self._generate_outputs(validated_name, inputs, provisional_outputs)
+
+        if self._is_recording_placeholders():
+            outputs[self.PLACEHOLDER_OUTPUT] = True
+
         info(f"Creation of {self.resource_type} with name {validated_name} successful")
 
         return CreateResult(
             id_=validated_name,
-            outs=self._generate_outputs(validated_name, inputs, provisional_outputs)
+            outs=outputs
         )
 
     def diff(self, id, olds, news):
         """
-        Simple implementation which forces a replacement if any fields have changed.
+        Compares the old outputs with the new inputs.  Changes to `updatable_properties` are
+        applied in place by `update`, and any other change forces a replacement.
         """
         info(f"Diffing object {self.resource_type} with name {id}...")
 
-        ignoreFields = ["name", "resource_name", "__provider"]
+        changed_fields = self._get_changed_fields(olds, news)
+        replaced_fields = [field for field in changed_fields
+                           if self._is_replacement_required(field, olds, news)]
+
+        info(f"Diff of {self.resource_type} with name {id} has changes: "
+             f"{len(changed_fields) > 0}, replacement: {len(replaced_fields) > 0}")
+
+        return DiffResult(
+            changes=len(changed_fields) > 0,
+            replaces=replaced_fields,
+            delete_before_replace=True
+        )
+
+    def _get_changed_fields(self, olds, news) -> List[str]:
+        """
+        Returns the fields which differ between the old outputs and the new inputs.
+        """
+        # The database and schema are compared below as resolved against the provider, and the full
+        # name is an output
+        ignoreFields = ["name", "resource_name", "database", "schema", "full_name", "__provider"]
         oldFields = set(filter(lambda k: k not in ignoreFields, olds.keys()))
         newFields = set(filter(lambda k: k not in ignoreFields, news.keys()))
         fields = list(oldFields.union(newFields))
@@ -78,25 +206,233 @@ class BaseDynamicProvider(ResourceProvider):
         changed_fields = []
 
         for field in fields:
-            if olds.get(field) != news.get(field):
+            if self._is_changed(field, olds, news):
                 changed_fields.append(field)
 
+        (old_database, old_schema) = self._get_database_and_schema(olds)
+        (new_database, new_schema) = self._get_database_and_schema(news)
+
+        if old_database != new_database:
+            changed_fields.append("database")
+
+        if old_schema != new_schema:
+            changed_fields.append("schema")
+
         if (news.get("name") is not None and olds.get("name") != news.get("name")):
             changed_fields.append("name")
 
-        info(f"Diff of {self.resource_type} with name {id} has changes: {len(changed_fields) > 0}")
+        return changed_fields
 
-        return DiffResult(
-            changes=len(changed_fields) > 0,
-            replaces=changed_fields,
-            delete_before_replace=True
-        )
+    def _is_changed(self, field, olds, news):
+        """
+        Returns whether the given field differs between the old outputs and the new inputs.
+        Subclasses can override this for fields whose values can differ without any change to the
+        object.
+        """
+        return olds.get(field) != news.get(field)
+
+    def _is_replacement_required(self, field, olds, news):
+        """
+        Returns whether a change to the given field requires the object to be replaced.  Subclasses
+        can override this for fields which can only be changed in place in some cases.  A change of
+        database or schema which only follows a rename of the database or schema the object is in
+        (see `renames`) is recorded without replacing it.
+        """
+        if field in ("database", "schema") and self._is_moved_by_rename(olds, news):
+            return False
+
+        return field not in self.updatable_properties
+
+    def _is_moved_by_rename(self, olds, news) -> bool:
+        (database, schema) = self._get_database_and_schema(olds)
+
+        return resolve_renames(database, schema) == self._get_database_and_schema(news)
+
+    def _follow_renames(self, inputs):
+        """
+        Returns the inputs with the database and schema which the object is in after the renames
+        recorded in `renames`.  An object which is replaced in the same run as the rename of its
+        database or schema has already been moved by the rename, so it must be dropped from its new
+        location.
+        """
+        (database, schema) = self._get_database_and_schema(inputs)
+        (new_database, new_schema) = resolve_renames(database, schema)
+
+        if (new_database, new_schema) == (database, schema):
+            return inputs
+
+        return {**inputs, "database": new_database, "schema": new_schema}
+
+    def update(self, id, olds, news):
+        """
+        Applies changes to `updatable_properties` with the statements from
+        `generate_sql_update_statements`, which are sent in a single request.  If `name` is
+        updatable, a new name renames the object first.  The resource ID stays the name the object
+        was created with, so the current name is taken from the outputs.
+
+        An object whose only change is the database or schema it was moved to by a rename (see
+        `renames`) needs no statements, so only its state is updated.  This applies to every
+        provider, including those which have no `updatable_properties`.
+        """
+        name = olds.get("name") or id
+        new_name = news.get("name") or name
+
+        info(f"Updating object {self.resource_type} with name {name}...")
+
+        changed_fields = self._get_changed_fields(olds, news)
+        statements = []
+
+        if new_name != name:
+            statements.append(self._generate_sql_rename_statement(name, new_name, news))
+
+        if any(field not in ("name", "database", "schema") for field in changed_fields):
+            environment = self._get_jinja_environment()
+            statements.extend(self.generate_sql_update_statements(new_name, olds, news,
+                                                                  environment))
+
+        self._execute_sql(statements)
+
+        if new_name != name:
+            self._record_rename(name, new_name, news)
+
+        if self._is_recording_placeholders():
+            info(f"Render-only update of {self.resource_type} with name {name} keeps its old "
+                 f"outputs")
+            return UpdateResult(outs=olds)
+
+        provisional_outputs = {
+            "name": new_name,
+            **self._generate_outputs_from_inputs(news)
+        }
+
+        info(f"Update of {self.resource_type} with name {new_name} successful")
+
+        return UpdateResult(outs=self._generate_outputs(new_name, news, provisional_outputs))
 
     def delete(self, id, props):
-        info(f"Deleting object {self.resource_type} with name {id}...")
-        sql = self.generate_sql_drop_statement(id, props, self._create_jinja_environment())
+        # An object which has been renamed keeps its original ID, so its current name is taken from
+        # the outputs
+        name = props.get("name") or id
+        props = self._follow_renames(props)
+
+        if props.get(self.PLACEHOLDER_OUTPUT) is True:
+            info(f"Object {self.resource_type} with name {name} was only rendered, so there is "
+                 f"nothing to delete")
+            return
+
+        info(f"Deleting object {self.resource_type} with name {name}...")
+        sql = self.generate_sql_drop_statement(name, props, self._get_jinja_environment())
         self._execute_sql(sql)
-        info(f"Deletion of object {self.resource_type} with name {id} successful")
+
+        # Pulumi removes an object from the stack state once it is deleted, so a delete which was
+        # only rendered fails to keep the object there
+        if self._is_recording_placeholders():
+            raise Exception(f"Render-only mode: the SQL to delete {self.resource_type.lower()} "
+                            f"{name} was written to the SQL plan but not executed, so the object "
+                            f"is kept in the stack state")
+
+        info(f"Deletion of object {self.resource_type} with name {name} successful")
+
+    def _generate_sql_drop_statement(self, name, inputs) -> str:
+        return f"DROP {self.resource_type.upper()} {self._get_full_object_name(inputs, name)}"
+
+    def _record_rename(self, name, new_name, inputs):
+        """
+        Called once `update` has renamed the object.  Providers of objects which hold other objects
+        record the rename in `renames`, so that the objects inside are moved with it rather than
+        replaced.
+        """
+        pass
+
+    def _generate_sql_rename_statement(self, name, new_name, inputs) -> str:
+        full_name = self._get_full_object_name(inputs, name)
+        new_full_name = self._get_full_object_name(inputs, new_name)
+
+        return f"ALTER {self.resource_type.upper()} {full_name} RENAME TO {new_full_name}"
+
+    def _generate_sql_alter_statements(self, full_name, properties: ClauseBuilder,
+                                       olds, news) -> List[str]:
+        """
+        Returns an `ALTER ... SET` statement for the properties which have been set or changed, and
+        an `ALTER ... UNSET` statement for those which have been removed, omitting either if there
+        is nothing to do.
+        """
+        (clauses, keywords) = properties.render_changes(olds, news)
+        statements = []
+
+        if clauses:
+            set_clauses = "\n".join(clauses)
+            statements.append(f"ALTER {self.resource_type.upper()} {full_name} SET\n{set_clauses}")
+
+        if keywords:
+            statements.append(f"ALTER {self.resource_type.upper()} {full_name} UNSET "
+                              f"{', '.join(keywords)}")
+
+        return statements
+
+    def _generate_sql_alter_set_statements(self, full_name, properties: ClauseBuilder,
+                                           olds, news) -> List[str]:
+        """
+        Returns an `ALTER ... SET` statement for the properties which have been set or changed, for
+        objects which cannot unset properties.  A removed comment is set to an empty string, and
+        removing any other property raises an exception, so such changes should be replacements
+        (see `_is_property_removed`).
+        """
+        (clauses, keywords) = properties.render_changes(olds, news)
+        removed = [keyword for keyword in keywords if keyword != "COMMENT"]
+
+        if removed:
+            raise Exception(f"Properties of {self.resource_type.lower()} {full_name} cannot be "
+                            f"removed in place: {', '.join(removed)}")
+
+        if "COMMENT" in keywords:
+            clauses.append("COMMENT = ''")
+
+        if not clauses:
+            return []
+
+        return [f"ALTER {self.resource_type.upper()} {full_name} SET\n" + "\n".join(clauses)]
+
+    def _is_property_removed(self, properties: ClauseBuilder, field, olds, news) -> bool:
+        """
+        Returns whether the given property, other than the comment, is set in `olds` but not
+        in `news`.
+        """
+        if field == "comment":
+            return False
+
+        (_, keywords) = properties.render_changes({field: olds.get(field)},
+                                                  {field: news.get(field)})
+
+        return len(keywords) > 0
+
+    def _get_render_mode(self) -> RenderMode:
+        """
+        Returns the render mode of the running stack, or that of the provider parameters if Pulumi
+        has not passed it to `configure`.
+        """
+        if self.render_mode is not None:
+            return self.render_mode
+
+        if self.provider_params is None:
+            return RenderMode(False, False, None)
+
+        return RenderMode(self.provider_params.render_only is True,
+                          self.provider_params.render_only_review_stack is True,
+                          self.provider_params.sql_plan_file)
+
+    def _is_render_only(self):
+        return self._get_render_mode().render_only
+
+    def _is_recording_placeholders(self):
+        """
+        Returns whether operations return placeholder results, which is in render-only mode unless
+        the stack is set aside for review, so that Pulumi does not record statements which were
+        never executed as if they had been.
+        """
+        render_mode = self._get_render_mode()
+
+        return render_mode.render_only and not render_mode.review_stack
 
     def _get_autogenerated_name(self, inputs):
         """
@@ -181,20 +517,140 @@ class BaseDynamicProvider(ResourceProvider):
             if k not in ['name', 'resource_name']
         }
 
-    def _execute_sql(self, statement):
-        connection = self.connection_provider.get()
-        cursor = connection.cursor()
+    def _execute_sql(self, statement: Union[str, List[str]]) -> List[StatementResult]:
+        """
+        Executes one statement, or a list of statements in a single multi-statement request on one
+        session, and returns the result of each statement.  The statements are not wrapped in a
+        transaction, since Snowflake commits each DDL statement implicitly, so statements before a
+        failed one stay applied.
+
+        Statements which fail with a transient error are retried according to `retry_policy`.
+        Retries rewrite `CREATE` and `DROP` statements with `IF NOT EXISTS` and `IF EXISTS`, since
+        the failed attempt may have been applied before the error was reported.  A request which
+        was sent and holds any statement which cannot safely be executed twice, such as a rename,
+        is not retried (see `is_replayable`), since it may have been partly applied.
+        """
+        statements = [statement] if isinstance(statement, str) else list(statement)
+
+        if len(statements) == 0:
+            return []
+
+        if self._is_render_only():
+            for statement in statements:
+                write_sql_plan([statement], self._get_render_mode().plan_file)
+
+            return [StatementResult(statement, None, None) for statement in statements]
+
+        attempt = 1
+
+        while True:
+            start = time.monotonic()
+            connection = None
+
+            try:
+                connection = self.connection_provider.get()
+                results = self._execute_statements(connection, statements)
+
+                if attempt > 1:
+                    info(f"Statement for {self.resource_type} succeeded after {attempt} attempts: "
+                         f"{retry_stats.summary()}")
+
+                return results
+            except Exception as error:
+                if not self.retry_policy.is_retryable(error):
+                    raise
+
+                if connection is not None and not all(is_replayable(make_idempotent(statement))
+                                                      for statement in statements):
+                    info(f"Not retrying statement for {self.resource_type} after transient error, "
+                         f"since it may have been partly applied: {error}")
+                    raise
+
+                if attempt >= self.retry_policy.max_attempts:
+                    retry_stats.record_exhausted(time.monotonic() - start)
+                    info(f"Statement for {self.resource_type} failed after {attempt} attempts: "
+                         f"{retry_stats.summary()}")
+                    raise
 
+                delay = self.retry_policy.get_delay(attempt - 1)
+                info(f"Retrying statement for {self.resource_type} in {delay:.1f}s after "
+                     f"transient error (attempt {attempt} of {self.retry_policy.max_attempts}): "
+                     f"{error}")
+
+                time.sleep(delay)
+                retry_stats.record_retry(time.monotonic() - start)
+
+                statements = [make_idempotent(statement) for statement in statements]
+                attempt += 1
+
+    def _execute_statements(self, connection, statements):
         try:
-            cursor.execute(statement)
-        finally:
-            cursor.close()
+            cursor = connection.cursor()
+
+            try:
+                if len(statements) == 1:
+                    cursor.execute(statements[0])
+                else:
+                    self._execute_multiple_statements(cursor, statements)
+
+                results = self._get_statement_results(cursor, statements)
+            finally:
+                cursor.close()
+        except Exception as error:
+            # A session which failed with a transient error may be broken, so it is not returned to
+            # the pool
+            if self.retry_policy.is_retryable(error) and hasattr(connection, "invalidate"):
+                connection.invalidate()
+            else:
+                connection.close()
+            raise
 
         connection.close()
 
+        return results
+
+    def _execute_multiple_statements(self, cursor, statements):
+        cursor.execute(";\n".join(statements), _statement_params={
+            "MULTI_STATEMENT_COUNT": len(statements)
+        })
+
+    def _get_statement_results(self, cursor, statements):
+        """
+        Reads the query ID and row count of each statement, moving through the result sets of a
+        multi-statement request.
+        """
+        results = []
+
+        for (index, statement) in enumerate(statements):
+            results.append(StatementResult(statement, cursor.sfqid, cursor.rowcount))
+
+            if index < len(statements) - 1 and not cursor.nextset():
+                break
+
+        if len(results) > 1:
+            for result in results:
+                info(f"Executed statement {result.query_id}: {result.statement.splitlines()[0]}")
+
+        return results
+
+    def _get_jinja_environment(self):
+        """
+        Returns the Jinja environment which is passed to the SQL generation methods.  It is created
+        with `_create_jinja_environment` the first time a provider of the class needs it, and then
+        shared by every operation of the process, rather than created with its filters on each.
+        """
+        environment = _jinja_environments.get(type(self))
+
+        if environment is None:
+            created = self._create_jinja_environment()
+            environment = _jinja_environments.setdefault(type(self), created)
+
+        return environment
+
     def _create_jinja_environment(self):
         """
-        Convenience method which creates a Jinja environment with additional filters for SQL generation.
+        Convenience method which creates a Jinja environment with additional filters for SQL
+        generation.
         """
         environment = Environment()
         environment.filters["sql"] = to_sql
@@ -205,4 +661,4 @@ class BaseDynamicProvider(ResourceProvider):
         environment.filters["dict_to_sql"] = dict_to_sql
         environment.filters["list_to_sql"] = list_to_sql
 
-        return environment
\ No newline at end of file
+        return environment
@@ -22,18 +22,26 @@ def to_sql(value, allow_none=True):
 
     if allow_none and value is None:
         return None
-    elif isinstance(value, str):
-        return string_to_sql(value)
-    elif isinstance(value, dict):
-        return dict_to_sql(value)
-    elif isinstance(value, list):
-        return list_to_sql(value)
-    elif isinstance(value, bool):
-        return bool_to_sql(value)
-    elif isinstance(value, (int, float)):
-        return number_to_sql(value)
-    else:
-        raise Exception(f"Cannot convert type '{type(value)}' to SQL representation")
+
+    converter = _converters.get(type(value))
+
+    if converter is None:
+        converter = _get_subclass_converter(value)
+
+    return converter(value)
+
+
+def _get_subclass_converter(value):
+    """
+    Finds the converter for an instance of a subclass of a supported type, such as an
+    `OrderedDict`.  Types are checked in order, so that `bool`, a subclass of `int`, is converted
+    as a boolean.
+    """
+    for (value_type, converter) in _subclass_converters:
+        if isinstance(value, value_type):
+            return converter
+
+    raise Exception(f"Cannot convert type '{type(value)}' to SQL representation")
 
 
 def number_to_sql(value):
@@ -47,19 +55,47 @@ def bool_to_sql(value):
 
 
 def list_to_sql(value):
-    all_values = list(map(lambda v: to_sql(v), value))
-    values_string = ",".join(all_values)
-    return f"({values_string})"
+    try:
+        # Only succeeds if every item is a string, which is the common case for long lists such as
+        # a file format's NULL_IF or an integration's allowed locations
+        joined = "\n".join(value)
+    except TypeError:
+        return "(" + ",".join([to_sql(v) for v in value]) + ")"
+
+    # The joined strings are validated with a single scan.  If it fails, they are validated one by
+    # one to report the first invalid string
+    if not Validation.string_regex.fullmatch(joined):
+        Validation.validate_strings(value)
+
+    return "('" + "','".join(value) + "')" if value else "()"
 
 
 def dict_to_sql(value):
-    valid_keys = list(filter(lambda k: value[k] is not None, value.keys()))
-    sql_values = {k: to_sql(value[k]) for k in valid_keys}
-    sql_statements = [ f"{key.upper()} = {sql_values[key]}" for key in valid_keys ]
-    values_string = ",".join(sql_statements)
-    return f"({values_string})"
+    return "(" + ",".join([f"{key.upper()} = {to_sql(v)}"
+                           for (key, v) in value.items() if v is not None]) + ")"
 
 
 def string_to_sql(value):
     Validation.validate_string(value)
     return f"'{value}'"
+
+
+_converters = {
+    str: string_to_sql,
+    dict: dict_to_sql,
+    list: list_to_sql,
+    bool: bool_to_sql,
+    int: number_to_sql,
+    float: number_to_sql,
+}
+"""
+The converter for each supported type, looked up by exact type.
+"""
+
+_subclass_converters = [
+    (str, string_to_sql),
+    (dict, dict_to_sql),
+    (list, list_to_sql),
+    (bool, bool_to_sql),
+    ((int, float), number_to_sql),
+]
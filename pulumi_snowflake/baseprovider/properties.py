@@ -0,0 +1,130 @@
+from typing import Any, Callable, List, NamedTuple, Tuple
+
+from .filters import to_sql, to_identifier, dict_to_sql, number_to_sql, bool_to_sql, \
+    string_to_sql, list_to_sql
+
+"""
+This module provides declarative property specs, from which the property clauses of CREATE
+statements are rendered without Jinja.  Most provider templates consist of nothing but "if the
+property is set, emit `KEY = <value | sql>`" branches, which a loop over the specs renders far more
+cheaply than a template, with byte-identical output.  The equivalent Jinja templates, against which
+the specs are tested, are kept with the tests rather than in the providers.
+"""
+
+
+class PropertyKind:
+    STRING = "string"
+    NUMBER = "number"
+    BOOL = "bool"
+    LIST = "list"
+    DICT = "dict"
+    IDENTIFIER = "identifier"
+    RAW = "raw"
+
+
+class PropertySpec(NamedTuple):
+    """
+    Describes one optional property clause of a CREATE statement.
+    """
+
+    name: str
+    """
+    The name of the input holding the property value.
+    """
+
+    keyword: str
+    """
+    The SQL keyword of the property, for example `DATA_RETENTION_TIME_IN_DAYS`.
+    """
+
+    kind: str = PropertyKind.STRING
+    """
+    The expected kind of value, one of the `PropertyKind` values, which determines how it is
+    converted to SQL.
+    """
+
+    emit_when_false: bool = False
+    """
+    If true, the clause is emitted whenever the value is a boolean, including `False`, as for the
+    templates' `is boolean` test.  Otherwise the clause is only emitted when the value is truthy.
+    """
+
+    separator: str = " = "
+    """
+    The text between the keyword and the value.
+    """
+
+
+def _converter(expected_type, convert) -> Callable[[Any], str]:
+    """
+    Returns a converter which uses the specific conversion for values of the expected kind, and
+    otherwise falls back to `to_sql`, just as the templates' `sql` filter would.
+    """
+    def convert_value(value):
+        return convert(value) if type(value) in expected_type else to_sql(value)
+
+    return convert_value
+
+
+_converters = {
+    PropertyKind.STRING: _converter((str,), string_to_sql),
+    PropertyKind.NUMBER: _converter((int, float), number_to_sql),
+    PropertyKind.BOOL: _converter((bool,), bool_to_sql),
+    PropertyKind.LIST: _converter((list,), list_to_sql),
+    PropertyKind.DICT: _converter((dict,), dict_to_sql),
+    PropertyKind.IDENTIFIER: to_identifier,
+    PropertyKind.RAW: str,
+}
+
+
+class ClauseBuilder:
+    """
+    Renders the clauses of an ordered list of property specs, one line per property which is set.
+    """
+
+    def __init__(self, *specs: PropertySpec):
+        for spec in specs:
+            if spec.kind not in _converters:
+                raise Exception(f"Invalid property kind '{spec.kind}' for property '{spec.name}'")
+
+        self.specs = specs
+        self._clauses = [
+            (spec.name, f"{spec.keyword}{spec.separator}", _converters[spec.kind],
+             spec.emit_when_false)
+            for spec in specs
+        ]
+
+    def render(self, inputs: dict) -> str:
+        lines = []
+
+        for (name, prefix, convert, emit_when_false) in self._clauses:
+            value = inputs.get(name)
+
+            if (value is True or value is False) if emit_when_false else value:
+                lines.append(f"{prefix}{convert(value)}\n")
+
+        return "".join(lines)
+
+    def render_changes(self, olds: dict, news: dict) -> Tuple[List[str], List[str]]:
+        """
+        Compares the properties of two sets of inputs for `ALTER ... SET` and `ALTER ... UNSET`.
+        Returns the clauses of the properties which are set in `news` with a different value than
+        in `olds`, and the keywords of the properties which are set in `olds` but not in `news`.
+        Unlike `render`, a value such as `0` or an empty string counts as set, so that changing a
+        number to zero sets it rather than unsetting it.
+        """
+        clauses = []
+        keywords = []
+
+        for (spec, (name, prefix, convert, emit_when_false)) in zip(self.specs, self._clauses):
+            (old, new) = (olds.get(name), news.get(name))
+
+            if old == new:
+                continue
+
+            if (new is True or new is False) if emit_when_false else new is not None:
+                clauses.append(f"{prefix}{convert(new)}")
+            elif (old is True or old is False) if emit_when_false else old is not None:
+                keywords.append(spec.keyword)
+
+        return (clauses, keywords)
@@ -0,0 +1,52 @@
+import threading
+from typing import Dict, Optional, Tuple
+
+"""
+This module records the databases and schemas which this provider process has renamed in place.  An
+object inside a renamed database or schema sees its `database` or `schema` input change, but it has
+already been moved by the rename, so the change is recorded in its state rather than replacing it,
+and an object which is replaced for another reason in the same run is dropped from where the rename
+moved it.  Pulumi only diffs a resource once the resources whose outputs it takes have been
+updated, so the rename is recorded before the objects inside are diffed, as long as they take their
+database or schema from the outputs of the renamed resource.
+
+Renames are only recorded when they are executed, so `pulumi preview` still shows the objects
+inside as replaced.
+"""
+
+_lock = threading.Lock()
+_databases: Dict[Optional[str], str] = {}
+_schemas: Dict[Tuple[Optional[str], Optional[str]], str] = {}
+
+
+def record_database_rename(name: str, new_name: str):
+    with _lock:
+        _databases[name] = new_name
+
+
+def record_schema_rename(database: Optional[str], name: str, new_name: str):
+    """
+    Records the rename of a schema in the given database, which is the database's name after any
+    rename.
+    """
+    with _lock:
+        _schemas[(database, name)] = new_name
+
+
+def resolve_renames(database: Optional[str],
+                    schema: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Returns the database and schema which an object in the given database and schema is in after
+    the renames recorded so far.
+    """
+    with _lock:
+        database = _databases.get(database, database)
+        schema = _schemas.get((database, schema), schema)
+
+    return (database, schema)
+
+
+def clear_renames():
+    with _lock:
+        _databases.clear()
+        _schemas.clear()
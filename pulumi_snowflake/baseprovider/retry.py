@@ -0,0 +1,189 @@
+import random
+import re
+import threading
+
+"""
+This module provides the retry policy used by dynamic providers when a statement fails with a
+transient error, and helpers to make statements safe to execute again.
+
+Errors are classified by their class names and Snowflake error codes rather than by importing
+`snowflake.connector.errors`, so that importing this module does not import the connector.
+"""
+
+
+RETRYABLE_ERROR_CODES = {
+    250001,  # Failed to connect to DB
+    250002,  # Connection is closed
+    250003,  # Failed to execute request
+    251011,  # Connection timeout
+    390111,  # Session no longer exists
+    390112,  # Session expired
+    390114,  # Authentication token expired
+}
+"""
+Snowflake error codes which indicate a network failure or an expired session.
+"""
+
+RETRYABLE_ERROR_TYPES = {
+    "OperationalError",
+    "InternalServerError",
+    "ServiceUnavailableError",
+    "GatewayTimeoutError",
+    "RequestTimeoutError",
+    "BadGatewayError",
+    "TooManyRequests",
+    "OtherHTTPRetryableError",
+    "RequestExceedMaxRetryError",
+    "TokenExpiredError",
+    "ConnectionError",
+    "TimeoutError",
+}
+"""
+Names of error classes, including base classes, which are considered transient.
+"""
+
+FATAL_ERROR_TYPES = {
+    "ProgrammingError",
+    "IntegrityError",
+    "DataError",
+    "NotSupportedError",
+    "NonRetryableTlsError",
+    "RevocationCheckError",
+    "ForbiddenError",
+    "BadRequest",
+}
+"""
+Names of error classes which are never retried, even if they derive from a retryable class.
+"""
+
+_modifiers = r"(?:TRANSIENT|TEMPORARY|TEMP|VOLATILE|LOCAL|GLOBAL)"
+_object_type = r"(?:FILE\s+FORMAT|STORAGE\s+INTEGRATION|MATERIALIZED\s+VIEW|[A-Z_]+)"
+_create_regex = re.compile(
+    r"^\s*CREATE(?:\s+" + _modifiers + r")*\s+(?!" + _modifiers + r"\b)" + _object_type + r"\s+",
+    re.IGNORECASE
+)
+_create_or_replace_regex = re.compile(r"^\s*CREATE\s+OR\s+REPLACE\b", re.IGNORECASE)
+_drop_regex = re.compile(r"^\s*DROP\s+" + _object_type + r"\s+", re.IGNORECASE)
+_if_exists_regex = re.compile(r"IF\s+(?:NOT\s+)?EXISTS\b", re.IGNORECASE)
+_object_name = r'(?:"(?:[^"]|"")*"|[^\s"])+'
+_alter_object = r"ALTER\s+" + _object_type + r"\s+(?:IF\s+EXISTS\s+)?" + _object_name
+_replayable_regex = re.compile(
+    r"^\s*(?:BEGIN|COMMIT|ROLLBACK|CREATE\s+OR\s+REPLACE\b"
+    r"|CREATE(?:\s+" + _modifiers + r")*\s+" + _object_type + r"\s+IF\s+NOT\s+EXISTS\b"
+    r"|DROP\s+" + _object_type + r"\s+IF\s+EXISTS\b"
+    r"|" + _alter_object + r"\s+(?:SET|UNSET|ALTER\s+COLUMN|CLUSTER\s+BY)\b)",
+    re.IGNORECASE
+)
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter.  The delay before retry `n` (starting at zero) is a
+    random number of seconds between zero and `min(max_delay, base_delay * 2 ** n)`.
+    """
+
+    def __init__(self, max_attempts: int = 5, base_delay: float = 0.5, max_delay: float = 30.0):
+        """
+        :param max_attempts: The total number of attempts, including the first
+        :param base_delay: The upper bound in seconds of the delay before the first retry
+        :param max_delay: The upper bound in seconds of any delay
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """
+        Returns true if the error is transient, for example a network reset, throttling or an
+        expired session.
+        """
+        type_names = {cls.__name__ for cls in type(error).__mro__}
+
+        if type_names & FATAL_ERROR_TYPES:
+            return False
+
+        if getattr(error, "errno", None) in RETRYABLE_ERROR_CODES:
+            return True
+
+        return len(type_names & RETRYABLE_ERROR_TYPES) > 0
+
+    def get_delay(self, retry: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** retry))
+
+
+class RetryStats:
+    """
+    Process-wide counters of retried statements.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.exhausted = 0
+        self.seconds_lost = 0.0
+
+    def record_retry(self, seconds_lost: float):
+        """
+        Records a retry, along with the time spent on the failed attempt and the backoff delay.
+        """
+        with self._lock:
+            self.retries += 1
+            self.seconds_lost += seconds_lost
+
+    def record_exhausted(self, seconds_lost: float):
+        """
+        Records a statement which still failed after its final attempt.
+        """
+        with self._lock:
+            self.exhausted += 1
+            self.seconds_lost += seconds_lost
+
+    def summary(self) -> str:
+        """
+        Describes the counters, for the log of an operation which was retried.
+        """
+        with self._lock:
+            return f"{self.retries} retries and {self.exhausted} exhausted statements in this " \
+                   f"process so far, {self.seconds_lost:.1f}s lost"
+
+    def reset(self):
+        with self._lock:
+            self.retries = 0
+            self.exhausted = 0
+            self.seconds_lost = 0.0
+
+
+retry_stats = RetryStats()
+
+
+def make_idempotent(statement: str) -> str:
+    """
+    Rewrites `CREATE` statements to `CREATE ... IF NOT EXISTS` and `DROP` statements to
+    `DROP ... IF EXISTS`, so that a statement which may already have been applied before a failure
+    can safely be executed again.  Other statements, and `CREATE OR REPLACE` statements, are
+    returned unchanged.
+    """
+    if _create_or_replace_regex.match(statement):
+        return statement
+
+    match = _create_regex.match(statement)
+    clause = "IF NOT EXISTS "
+
+    if match is None:
+        match = _drop_regex.match(statement)
+        clause = "IF EXISTS "
+
+    if match is None or _if_exists_regex.match(statement, match.end()):
+        return statement
+
+    return statement[:match.end()] + clause + statement[match.end():]
+
+
+def is_replayable(statement: str) -> bool:
+    """
+    Returns true if executing the statement again after it has already been applied leaves the
+    object unchanged and does not fail, as for the statements returned by `make_idempotent` and for
+    `ALTER` statements which only set or unset properties.  Statements such as `ALTER ... RENAME`
+    and `ALTER TABLE ... ADD COLUMN` are not replayable.
+    """
+    return _replayable_regex.match(statement) is not None
@@ -0,0 +1,77 @@
+import threading
+from typing import Any, Iterable, NamedTuple, Optional
+
+from pulumi import info
+
+"""
+This module writes the SQL plan of providers in render-only mode, in which statements are rendered
+as usual but never sent to Snowflake.  Each statement is appended to the plan file, terminated by a
+semicolon, or written to the Pulumi log if there is no plan file.
+"""
+
+_lock = threading.Lock()
+
+
+class RenderMode(NamedTuple):
+    """
+    Whether statements are written to the SQL plan instead of being executed, and where.
+    """
+
+    render_only: bool
+    """
+    Whether statements are rendered into the plan and never executed.
+    """
+
+    review_stack: bool
+    """
+    Whether operations are recorded in the stack state as if their statements had been executed.
+    """
+
+    plan_file: Optional[str]
+    """
+    The file the plan is appended to, or `None` to write it to the Pulumi log.
+    """
+
+    @staticmethod
+    def from_config(config) -> Optional["RenderMode"]:
+        """
+        Returns the render mode set in the config which Pulumi passes to a dynamic provider, or
+        `None` if `snowflakeRenderOnly` is not set there, which includes Pulumi versions that pass
+        no config at all.
+        """
+        render_only = config.get("snowflakeRenderOnly")
+
+        if render_only is None:
+            return None
+
+        return RenderMode(_to_bool(render_only),
+                          _to_bool(config.get("snowflakeRenderOnlyReviewStack")),
+                          config.get("snowflakeSqlPlanFile"))
+
+
+def _to_bool(value: Any) -> bool:
+    return value is True or str(value).lower() == "true"
+
+
+def write_sql_plan(chunks: Iterable[str], plan_file: Optional[str]):
+    """
+    Appends a statement, given as chunks which concatenate to the statement, to the plan file or
+    the Pulumi log.  The chunks are written to the file as they are produced, so that very large
+    statements are never held in memory.
+    """
+    if plan_file is None:
+        info(f"{''.join(chunks).rstrip()};")
+        return
+
+    # Resources are created concurrently, so statements are written under a lock to keep them from
+    # interleaving
+    with _lock, open(plan_file, "a", encoding="utf-8") as file:
+        # Each chunk is written once the next is produced, so that trailing whitespace can be
+        # stripped from the last
+        previous = ""
+
+        for chunk in filter(None, chunks):
+            file.write(previous)
+            previous = chunk
+
+        file.write(f"{previous.rstrip()};\n\n")
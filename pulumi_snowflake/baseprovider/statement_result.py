@@ -0,0 +1,22 @@
+from typing import NamedTuple, Optional
+
+
+class StatementResult(NamedTuple):
+    """
+    The outcome of a single statement executed by a dynamic provider.
+    """
+
+    statement: str
+    """
+    The SQL text of the statement.
+    """
+
+    query_id: Optional[str]
+    """
+    The Snowflake query ID of the statement.
+    """
+
+    rowcount: Optional[int]
+    """
+    The number of rows returned or affected by the statement, if known.
+    """
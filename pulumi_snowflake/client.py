@@ -1,12 +1,73 @@
-import snowflake.connector
+import hashlib
+import os
+import threading
+from typing import Optional, Tuple
+
 from pulumi import info
 
+from .async_executor import get_executor, AsyncExecutor, AsyncExecutorConnection, \
+    DEFAULT_MAX_IN_FLIGHT
+from .concurrency import get_limiter, ConcurrencyLimiter, LimitedConnection
+from .connection_pool import get_pool, ConnectionPool, DEFAULT_MAX_SIZE, DEFAULT_IDLE_TIMEOUT
+from .key_pair import load_private_key
 from .provider import Provider
+from .token_cache import TokenCache
+
+
+LIMITER_WAIT_REPORT_SECONDS = 1.0
+"""
+Waits for a concurrency slot at least this long are logged.
+"""
+
+DEFAULT_MAX_ADAPTIVE_CONCURRENCY = 32
+"""
+The highest limit reached by the adaptive concurrency limiter when `max_concurrency` is not set.
+"""
+
+TOKEN_CACHE_CONNECTOR_VERSION = (3, 1, 0)
+"""
+The first snowflake-connector-python release with `server_session_keep_alive`, which keeps cached
+sessions open when a connection is closed.
+"""
+
+ASYNC_EXECUTION_CONNECTOR_VERSION = (3, 12, 2)
+"""
+The first snowflake-connector-python release with the asynchronous query error handling which
+`AsyncExecutor` calls.
+"""
+
+
+def require_connector_version(option: str, minimum: Tuple[int, int, int]):
+    """
+    Raises an exception if the installed snowflake-connector-python is older than `minimum`.  The
+    package supports older releases, so options which need a newer one check it when they are used.
+    """
+    # Imported here rather than at module level, see `Client._connect`
+    from snowflake.connector.version import VERSION
+
+    installed = tuple(VERSION[:3])
+
+    if installed < minimum:
+        raise Exception(f"The {option} option requires snowflake-connector-python "
+                        f"{'.'.join(map(str, minimum))} or later, but "
+                        f"{'.'.join(map(str, installed))} is installed")
 
 
 class Client:
     """
-    Returns a connection to a Snowflake database.
+    Returns a connection to a Snowflake database.  Connections are borrowed from a process-wide
+    pool which is shared by every client with the same credentials, account, role, database and
+    schema, so that the login handshake is only paid once per session rather than once per
+    statement.
+
+    Connections authenticate with the provider's password, or with key-pair authentication if a
+    private key is given.  Session tokens may be cached so that new connections resume an existing
+    session (see `TokenCache`).  Tokens are cached for each slot of the pool, so that sessions
+    which are open at the same time are never the same server session.
+
+    When `async_execution` is enabled on the provider, the returned connection instead runs its
+    statements through a process-wide `AsyncExecutor`, which keeps many statements in flight on a
+    single session.
     """
 
     def __init__(self, provider: Provider):
@@ -16,16 +77,192 @@ class Client:
         self.provider = provider
 
     def get(self):
+        """
+        Returns a pooled connection.  Closing the connection returns it to the pool.
+
+        If the provider has a `max_concurrency` or `adaptive_concurrency`, this blocks until fewer
+        than the limit of connections to the account are in use, and closing the connection frees
+        its place.
+
+        The first call for each pool also starts the warm-up of its sessions (see `warm_up`), if
+        the dynamic provider did not already start it when it was configured.
+        """
+        self.warm_up()
+
+        limiter = self.get_limiter()
+        slot = limiter.acquire() if limiter is not None else None
+
+        try:
+            if self.provider.async_execution:
+                require_connector_version("async_execution", ASYNC_EXECUTION_CONNECTOR_VERSION)
+                connection = AsyncExecutorConnection(self.get_executor())
+            else:
+                connection = self.get_pool().acquire()
+        except BaseException:
+            if slot is not None:
+                slot.release()
+            raise
+
+        if slot is None:
+            return connection
+
+        if slot.wait_seconds >= LIMITER_WAIT_REPORT_SECONDS:
+            info(f"Waited {slot.wait_seconds:.1f}s for one of {limiter.limit} Snowflake statement "
+                 f"slots for account={self.provider.account_name} "
+                 f"({limiter.waiting} still waiting)")
+
+        return LimitedConnection(connection, slot)
+
+    def get_limiter(self) -> Optional[ConcurrencyLimiter]:
+        """
+        Returns the limiter shared by every client for the same account, or `None` if there is no
+        limit.
+        """
+        if not self.provider.max_concurrency and not self.provider.adaptive_concurrency:
+            return None
+
+        lock_dir = None
+
+        if self.provider.concurrency_lock_dir:
+            lock_dir = os.path.join(self.provider.concurrency_lock_dir,
+                                    self.provider.account_name or "default")
+
+        return get_limiter(
+            self.provider.account_name,
+            self.provider.max_concurrency or DEFAULT_MAX_ADAPTIVE_CONCURRENCY,
+            lock_dir,
+            adaptive=bool(self.provider.adaptive_concurrency)
+        )
+
+    def warm_up(self) -> Optional[threading.Thread]:
+        """
+        If the provider has `warm_up_connections`, opens that many pooled sessions in a background
+        thread, so that the statements which follow the first do not each pay for the DNS lookup,
+        TLS and OCSP handshakes and login.  Only the first call for each pool has any effect.
+        Returns the background thread, if one was started.
+
+        The option is read with a default, since provider parameters pickled by an earlier release
+        may not have it.
+        """
+        count = getattr(self.provider, "warm_up_connections", None)
+
+        if not count or getattr(self.provider, "async_execution", None):
+            return None
+
+        return self.get_pool().start_warm_up(count)
+
+    def get_executor(self) -> AsyncExecutor:
+        return get_executor(
+            self._get_pool_key(),
+            self.get_pool(),
+            max_in_flight=self.provider.max_in_flight or DEFAULT_MAX_IN_FLIGHT
+        )
+
+    def get_pool(self) -> ConnectionPool:
+        return get_pool(
+            self._get_pool_key(),
+            self._connect,
+            max_size=self.provider.pool_max_size or DEFAULT_MAX_SIZE,
+            idle_timeout=self.provider.pool_idle_timeout or DEFAULT_IDLE_TIMEOUT
+        )
+
+    def _get_pool_key(self):
+        return (
+            self.provider.username,
+            hashlib.sha256(self._get_secret()).hexdigest(),
+            self.provider.account_name,
+            self.provider.role,
+            self.provider.database,
+            self.provider.schema,
+            self.provider.host,
+            self.provider.port,
+            self.provider.protocol
+        )
+
+    def _get_secret(self) -> bytes:
+        """
+        Returns the private key or password which authenticates the connection.
+        """
+        if self._uses_key_pair():
+            return self._get_private_key()
+
+        return (self.provider.password or "").encode("utf-8")
+
+    def _uses_key_pair(self):
+        return bool(self.provider.private_key or self.provider.private_key_path)
+
+    def _get_private_key(self) -> bytes:
+        return load_private_key(
+            private_key=self.provider.private_key,
+            private_key_path=self.provider.private_key_path,
+            passphrase=self.provider.private_key_passphrase
+        )
+
+    def _get_connection_parameters(self):
+        parameters = {
+            "user": self.provider.username,
+            "account": self.provider.account_name,
+            "role": self.provider.role,
+            "database": self.provider.database,
+            "schema": self.provider.schema
+        }
+
+        if self.provider.ocsp_cache_file:
+            parameters["ocsp_response_cache_filename"] = self.provider.ocsp_cache_file
+
+        for name in ("host", "port", "protocol"):
+            if getattr(self.provider, name):
+                parameters[name] = getattr(self.provider, name)
+
+        if self._uses_key_pair():
+            parameters["authenticator"] = "SNOWFLAKE_JWT"
+            parameters["private_key"] = self._get_private_key()
+        else:
+            parameters["password"] = self.provider.password
+
+        return parameters
+
+    def _get_token_cache(self, slot: int) -> Optional[TokenCache]:
+        if not self.provider.token_cache:
+            return None
+
+        if self.provider.token_cache == "disk":
+            directory = self.provider.token_cache_dir or TokenCache.get_default_directory()
+        else:
+            directory = None
+
+        return TokenCache(f"{self.provider.stack}/{self._get_pool_key()}/{slot}",
+                          self._get_secret(), directory)
+
+    def _connect(self, slot: int = 0):
+        # Imported here rather than at module level since the connector and its dependencies are
+        # slow to import, and Pulumi programs import this module even when no connection is made
+        import snowflake.connector
 
         info(f"Creating Snowflake connection for account={self.provider.account_name} "
              f"user={self.provider.username} role={self.provider.role} "
              f"database={self.provider.database} schema={self.provider.schema}")
 
-        return snowflake.connector.connect(
-            user=self.provider.username,
-            password=self.provider.password,
-            account=self.provider.account_name,
-            role=self.provider.role,
-            database=self.provider.database,
-            schema=self.provider.schema
-        )
\ No newline at end of file
+        parameters = self._get_connection_parameters()
+        token_cache = self._get_token_cache(slot)
+
+        if token_cache is None:
+            return snowflake.connector.connect(**parameters)
+
+        # Sessions whose tokens are cached are shared between connections and later runs, so they
+        # must not be logged out when a connection is closed
+        require_connector_version("token_cache", TOKEN_CACHE_CONNECTOR_VERSION)
+        parameters["server_session_keep_alive"] = True
+        tokens = token_cache.get()
+
+        if tokens is not None:
+            try:
+                return snowflake.connector.connect(**parameters, **tokens)
+            except Exception:
+                info("Cached Snowflake session could not be resumed, logging in again")
+                token_cache.remove()
+
+        connection = snowflake.connector.connect(**parameters)
+        token_cache.put(connection.rest.token, connection.rest.master_token)
+
+        return connection
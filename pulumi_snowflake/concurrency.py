@@ -0,0 +1,305 @@
+import collections
+import os
+import threading
+import time
+from typing import Dict, Hashable, Optional
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+LOCK_POLL_INTERVAL = 0.05
+"""
+The number of seconds between attempts to take a cross-process slot when all slots are held by
+other processes.
+"""
+
+
+class ConcurrencySlot:
+    """
+    A slot held by one statement.  Releasing the slot allows another statement to run.
+    """
+
+    def __init__(self, limiter: 'ConcurrencyLimiter', wait_seconds: float, lock_file=None):
+        self.limiter = limiter
+        self.wait_seconds = wait_seconds
+        self.lock_file = lock_file
+        self.acquired_at = time.monotonic()
+        self._released = False
+
+    def release(self, failed: bool = False):
+        """
+        :param failed: Whether the statement run while holding the slot failed with a transient
+            error
+        """
+        if not self._released:
+            self._released = True
+            self.limiter._release(self, time.monotonic() - self.acquired_at, failed)
+
+
+class ConcurrencyLimiter:
+    """
+    Limits the number of Snowflake statements running at once, across every dynamic provider in the
+    process and, if a lock directory is given, across processes using file locks.  Pulumi runs many
+    provider operations in parallel, so without a limit they can exceed the account's session and
+    concurrency limits and be queued by Snowflake.  Time spent waiting for a slot is recorded so
+    that the limit can be tuned.
+    """
+
+    def __init__(self, limit: int, lock_dir: Optional[str] = None):
+        """
+        :param limit: The maximum number of statements running at once
+        :param lock_dir: A directory for slot lock files shared between processes, or `None` to
+            only limit within this process
+        """
+        if limit < 1:
+            raise Exception(f"Concurrency limit must be at least 1, got {limit}")
+
+        if lock_dir is not None and fcntl is None:
+            raise Exception("Cross-process concurrency limits are not supported on this platform")
+
+        self.limit = limit
+        self.lock_dir = lock_dir
+
+        self._condition = threading.Condition()
+        self.in_use = 0
+        self.waiting = 0
+
+        self.acquired = 0
+        self.waits = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def acquire(self) -> ConcurrencySlot:
+        """
+        Blocks until a slot is available and returns it.
+        """
+        start = time.monotonic()
+
+        with self._condition:
+            self.waiting += 1
+
+            try:
+                while self.in_use >= self.limit:
+                    self._condition.wait()
+            finally:
+                self.waiting -= 1
+
+            self.in_use += 1
+
+        try:
+            lock_file = self._acquire_lock_file() if self.lock_dir is not None else None
+        except BaseException:
+            with self._condition:
+                self.in_use -= 1
+                self._condition.notify()
+            raise
+
+        wait_seconds = time.monotonic() - start
+        self._record_wait(wait_seconds)
+
+        return ConcurrencySlot(self, wait_seconds, lock_file)
+
+    def _record_wait(self, wait_seconds):
+        with self._condition:
+            self.acquired += 1
+            self.total_wait_seconds += wait_seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+            if wait_seconds > 0.001:
+                self.waits += 1
+
+    def _release(self, slot: ConcurrencySlot, hold_seconds: float, failed: bool):
+        if slot.lock_file is not None:
+            fcntl.flock(slot.lock_file, fcntl.LOCK_UN)
+            slot.lock_file.close()
+
+        with self._condition:
+            self.in_use -= 1
+            self._on_release(hold_seconds, failed)
+            self._condition.notify_all()
+
+    def _on_release(self, hold_seconds: float, failed: bool):
+        """
+        Called with the lock held whenever a slot is released.  Subclasses may override this to
+        adjust the limit.
+        """
+        pass
+
+    def _acquire_lock_file(self):
+        """
+        Takes one of `limit` slot lock files in the lock directory, polling while all of them are
+        held.
+        """
+        os.makedirs(self.lock_dir, exist_ok=True)
+
+        while True:
+            for index in range(self.limit):
+                lock_file = open(os.path.join(self.lock_dir, f"slot-{index}.lock"), "a")
+
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    return lock_file
+                except OSError:
+                    lock_file.close()
+
+            time.sleep(LOCK_POLL_INTERVAL)
+
+
+class AdaptiveConcurrencyLimiter(ConcurrencyLimiter):
+    """
+    A limiter which adjusts its limit between `min_limit` and `max_limit` using additive increase
+    and multiplicative decrease (AIMD), based on the latency and errors of recently completed
+    statements.
+
+    Once per "round" of `limit` completed statements, the mean latency of the round is compared
+    with the baseline, the lowest latency seen in a longer rolling window, which approximates the
+    latency of a statement on an unloaded service.  If the round was no slower than
+    `latency_tolerance` times the baseline and its error rate was below `error_threshold`, the
+    limit grows by one.  Otherwise Snowflake is queueing statements (or failing them), so the limit
+    is multiplied by `backoff_ratio`.  Small DDL on a quiet account therefore runs with high
+    parallelism, while a slow metadata service quickly reduces the number of statements competing
+    for it.
+    """
+
+    def __init__(self,
+                 max_limit: int,
+                 min_limit: int = 1,
+                 initial_limit: Optional[int] = None,
+                 lock_dir: Optional[str] = None,
+                 latency_tolerance: float = 2.0,
+                 error_threshold: float = 0.1,
+                 backoff_ratio: float = 0.5,
+                 window_size: int = 200):
+        """
+        :param max_limit: The highest limit that may be reached
+        :param min_limit: The lowest limit that may be reached
+        :param initial_limit: The limit to start at, by default `min_limit`
+        :param lock_dir: A directory for slot lock files shared between processes, or `None` to
+            only limit within this process
+        :param latency_tolerance: How many times slower than the baseline a round may be before the
+            limit is reduced
+        :param error_threshold: The fraction of failed statements in a round above which the limit
+            is reduced
+        :param backoff_ratio: The factor by which the limit is multiplied when it is reduced
+        :param window_size: The number of recent latencies from which the baseline is taken
+        """
+        if max_limit < min_limit:
+            raise Exception(f"Maximum concurrency {max_limit} is less than the minimum "
+                            f"{min_limit}")
+
+        super().__init__(initial_limit or min_limit, lock_dir)
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.error_threshold = error_threshold
+        self.backoff_ratio = backoff_ratio
+
+        self._latencies = collections.deque(maxlen=window_size)
+        self._round_latency = 0.0
+        self._round_completed = 0
+        self._round_failed = 0
+
+        self.increases = 0
+        self.decreases = 0
+
+    @property
+    def baseline_latency(self) -> Optional[float]:
+        return min(self._latencies) if self._latencies else None
+
+    def _on_release(self, hold_seconds: float, failed: bool):
+        self._round_completed += 1
+
+        if failed:
+            self._round_failed += 1
+        else:
+            self._latencies.append(hold_seconds)
+            self._round_latency += hold_seconds
+
+        if self._round_completed < self.limit:
+            return
+
+        succeeded = self._round_completed - self._round_failed
+        mean_latency = self._round_latency / succeeded if succeeded else None
+        error_rate = self._round_failed / self._round_completed
+
+        self._round_latency = 0.0
+        self._round_completed = 0
+        self._round_failed = 0
+
+        if error_rate > self.error_threshold or mean_latency is None \
+                or mean_latency > self.baseline_latency * self.latency_tolerance:
+            new_limit = max(self.min_limit, int(self.limit * self.backoff_ratio))
+
+            if new_limit < self.limit:
+                self.limit = new_limit
+                self.decreases += 1
+        elif self.limit < self.max_limit:
+            self.limit += 1
+            self.increases += 1
+
+
+class LimitedConnection:
+    """
+    Wraps a connection so that closing or invalidating it also releases its concurrency slot.  Any
+    other attribute is delegated to the wrapped connection.
+    """
+
+    def __init__(self, connection, slot: ConcurrencySlot):
+        self._connection = connection
+        self._slot = slot
+
+    def cursor(self, *args, **kwargs):
+        return self._connection.cursor(*args, **kwargs)
+
+    def close(self):
+        try:
+            self._connection.close()
+        finally:
+            self._slot.release()
+
+    def invalidate(self):
+        try:
+            if hasattr(self._connection, "invalidate"):
+                self._connection.invalidate()
+            else:
+                self._connection.close()
+        finally:
+            self._slot.release(failed=True)
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+
+_limiters: Dict[Hashable, ConcurrencyLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(key: Hashable,
+                limit: int,
+                lock_dir: Optional[str] = None,
+                adaptive: bool = False) -> ConcurrencyLimiter:
+    """
+    Returns the process-wide limiter for the given key, usually the account name, creating it if
+    necessary.  If `adaptive` is true, the limiter is an `AdaptiveConcurrencyLimiter` with `limit`
+    as its maximum.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+
+        if limiter is None:
+            if adaptive:
+                limiter = AdaptiveConcurrencyLimiter(limit, lock_dir=lock_dir)
+            else:
+                limiter = ConcurrencyLimiter(limit, lock_dir)
+            _limiters[key] = limiter
+
+        return limiter
+
+
+def clear_limiters():
+    with _limiters_lock:
+        _limiters.clear()
@@ -0,0 +1,371 @@
+import atexit
+import itertools
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+DEFAULT_MAX_SIZE = 8
+"""
+The default maximum number of Snowflake sessions held open by a single pool.
+"""
+
+DEFAULT_IDLE_TIMEOUT = 300
+"""
+The default number of seconds after which an idle session is closed and evicted from the pool.
+"""
+
+DEFAULT_HEALTH_CHECK_INTERVAL = 60
+"""
+Sessions which have been idle for at least this many seconds are health checked before being handed
+out again.
+"""
+
+
+class PooledConnection:
+    """
+    A Snowflake connection which has been borrowed from a `ConnectionPool`.  Calling `close`
+    returns the session to the pool instead of logging it out, so existing callers which close
+    their connection after use work unchanged.  Any other attribute is delegated to the underlying
+    connector connection.
+    """
+
+    def __init__(self, pool: 'ConnectionPool', connection):
+        self._pool = pool
+        self._connection = connection
+        self._released = False
+
+    @property
+    def connection(self):
+        """
+        The underlying `snowflake.connector` connection.
+        """
+        return self._connection
+
+    def cursor(self, *args, **kwargs):
+        return self._connection.cursor(*args, **kwargs)
+
+    def close(self):
+        """
+        Returns the session to the pool.  Calling `close` more than once has no effect.
+        """
+        if not self._released:
+            self._released = True
+            self._pool._release(self._connection)
+
+    def invalidate(self):
+        """
+        Logs out the session and removes it from the pool, for example after a network error or
+        session expiry.
+        """
+        if not self._released:
+            self._released = True
+            self._pool._discard(self._connection)
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class ConnectionPool:
+    """
+    A thread-safe, size-capped pool of Snowflake sessions.  Idle sessions are reused
+    most-recently-used first so that the warmest sessions are preferred, sessions idle for longer
+    than `idle_timeout` are evicted, and sessions idle for longer than `health_check_interval` are
+    checked with a trivial query before being reused.
+
+    Each open session holds a slot, the lowest number from zero which no other open session holds,
+    which is passed to `connect`.  Sessions which are open at the same time therefore never share a
+    slot, so that `connect` can keep state per session, such as cached session tokens, which a
+    later session in the same slot reuses.
+    """
+
+    def __init__(self,
+                 connect: Callable[[], Any],
+                 max_size: int = DEFAULT_MAX_SIZE,
+                 idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+                 health_check_interval: float = DEFAULT_HEALTH_CHECK_INTERVAL):
+        """
+        :param connect: A callable which opens a new Snowflake session, given the session's slot
+        :param max_size: The maximum number of sessions, idle or in use, held by the pool
+        :param idle_timeout: The number of seconds after which an idle session is evicted
+        :param health_check_interval: The number of idle seconds after which a session is checked
+            before reuse
+        """
+        if max_size < 1:
+            raise Exception(f"Connection pool size must be at least 1, got {max_size}")
+
+        self.connect = connect
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+
+        self._condition = threading.Condition()
+        self._idle: List[Tuple[Any, float]] = []
+        self._size = 0
+        self._slots: Dict[Any, int] = {}
+        self._reserved_slots = set()
+
+        self._warm_up_started = False
+
+        self.created = 0
+        self.reused = 0
+        self.evicted = 0
+
+    @property
+    def size(self) -> int:
+        """
+        The number of open sessions, including those currently in use.
+        """
+        with self._condition:
+            return self._size
+
+    @property
+    def idle_count(self) -> int:
+        with self._condition:
+            return len(self._idle)
+
+    def acquire(self, timeout: Optional[float] = None) -> PooledConnection:
+        """
+        Borrows a session from the pool, opening a new one if no healthy idle session is available
+        and the pool is not full.  If the pool is full, blocks until a session is returned or
+        `timeout` seconds have passed.  Idle sessions which have exceeded the idle timeout are
+        evicted first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self.evict_idle()
+
+        while True:
+            connection, idle_for, slot = self._take_idle_or_reserve(deadline)
+
+            if connection is None:
+                return PooledConnection(self, self._open_reserved(slot))
+
+            if self._is_healthy(connection, idle_for):
+                with self._condition:
+                    self.reused += 1
+
+                return PooledConnection(self, connection)
+
+            self._discard(connection, evicted=idle_for >= self.idle_timeout)
+
+    def warm_up(self, count: int) -> int:
+        """
+        Opens new sessions until the pool holds `count` of them (or `max_size`), leaving them idle,
+        and returns the number opened.  The first session is opened on its own so that DNS, TLS and
+        OCSP results cached by the connector are reused by the rest, which are opened in parallel.
+        Sessions which fail to open are skipped, since the error will be reported again when a
+        statement needs the session.
+        """
+        target = min(count, self.max_size)
+        opened = []
+
+        def open_session():
+            with self._condition:
+                if self._size >= target:
+                    return
+
+                self._size += 1
+                slot = self._reserve_slot()
+
+            try:
+                connection = self._open_reserved(slot)
+            except Exception:
+                return
+
+            self._release(connection)
+            opened.append(connection)
+
+        open_session()
+
+        if not opened:
+            return 0
+
+        threads = [threading.Thread(target=open_session, daemon=True)
+                   for _ in range(target - self.size)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        return len(opened)
+
+    def start_warm_up(self, count: int) -> Optional[threading.Thread]:
+        """
+        Calls `warm_up` in a background thread, unless the pool has already been warmed up, and
+        returns the thread.
+        """
+        with self._condition:
+            if self._warm_up_started:
+                return None
+
+            self._warm_up_started = True
+
+        thread = threading.Thread(target=self.warm_up, args=(count,),
+                                  name="snowflake-pool-warm-up", daemon=True)
+        thread.start()
+
+        return thread
+
+    def evict_idle(self):
+        """
+        Closes every idle session which has exceeded the idle timeout.  Called whenever a session
+        is acquired or released, so that sessions at the bottom of the idle stack, which are reused
+        last, do not outlive the timeout while the pool is busy.
+        """
+        now = time.monotonic()
+
+        with self._condition:
+            expired = [connection for (connection, last_used) in self._idle
+                       if now - last_used >= self.idle_timeout]
+            self._idle = [(connection, last_used) for (connection, last_used) in self._idle
+                          if now - last_used < self.idle_timeout]
+
+        for connection in expired:
+            self._discard(connection, evicted=True)
+
+    def close(self):
+        """
+        Closes all idle sessions.  Sessions which are in use are closed when they are returned.
+        """
+        with self._condition:
+            idle = [connection for (connection, _) in self._idle]
+            self._idle = []
+
+        for connection in idle:
+            self._discard(connection)
+
+    def _take_idle_or_reserve(self, deadline):
+        """
+        Returns a tuple of an idle session, how long it has been idle and `None`, or
+        `(None, None, slot)` if a slot has been reserved for a new session.
+        """
+        with self._condition:
+            while True:
+                if self._idle:
+                    (connection, last_used) = self._idle.pop()
+                    return connection, time.monotonic() - last_used, None
+
+                if self._size < self.max_size:
+                    self._size += 1
+                    return None, None, self._reserve_slot()
+
+                remaining = None if deadline is None else deadline - time.monotonic()
+
+                if remaining is not None and remaining <= 0:
+                    raise Exception("Timed out waiting for a Snowflake connection, all "
+                                    f"{self.max_size} sessions in the pool are in use")
+
+                self._condition.wait(remaining)
+
+    def _reserve_slot(self) -> int:
+        # Called with the lock held
+        used = set(self._slots.values()) | self._reserved_slots
+        slot = next(slot for slot in itertools.count() if slot not in used)
+        self._reserved_slots.add(slot)
+
+        return slot
+
+    def _open_reserved(self, slot: int):
+        try:
+            connection = self.connect(slot)
+        except BaseException:
+            with self._condition:
+                self._size -= 1
+                self._reserved_slots.discard(slot)
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._reserved_slots.discard(slot)
+            self._slots[connection] = slot
+            self.created += 1
+
+        return connection
+
+    def _is_healthy(self, connection, idle_for: float) -> bool:
+        if idle_for >= self.idle_timeout:
+            return False
+
+        if connection.is_closed():
+            return False
+
+        if idle_for < self.health_check_interval:
+            return True
+
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.execute("SELECT 1")
+            finally:
+                cursor.close()
+        except Exception:
+            return False
+
+        return True
+
+    def _release(self, connection):
+        with self._condition:
+            self._idle.append((connection, time.monotonic()))
+            self._condition.notify()
+
+        self.evict_idle()
+
+    def _discard(self, connection, evicted: bool = False):
+        with self._condition:
+            self._size -= 1
+            self._slots.pop(connection, None)
+            self._condition.notify()
+
+            if evicted:
+                self.evicted += 1
+
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+_pools: Dict[Hashable, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(key: Hashable,
+             connect: Callable[[], Any],
+             max_size: int = DEFAULT_MAX_SIZE,
+             idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> ConnectionPool:
+    """
+    Returns the process-wide pool for the given key, creating it if necessary.  Dynamic providers
+    are deserialized afresh for every operation, so pools are held at module level to be shared
+    between them.
+    """
+    with _pools_lock:
+        pool = _pools.get(key)
+
+        if pool is None:
+            pool = ConnectionPool(connect, max_size=max_size, idle_timeout=idle_timeout)
+            _pools[key] = pool
+
+        return pool
+
+
+def close_all_pools():
+    """
+    Closes the idle sessions of every pool in the process and forgets the pools.
+    """
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_all_pools)
@@ -2,39 +2,49 @@ from pulumi_snowflake import Client
 
 from ..baseprovider import BaseDynamicProvider
 from ..provider import Provider
+from ..baseprovider.properties import ClauseBuilder, PropertyKind, PropertySpec
+from ..baseprovider.renames import record_database_rename
+
+
+PROPERTIES = ClauseBuilder(
+    PropertySpec("share", "FROM SHARE", PropertyKind.IDENTIFIER, separator=" "),
+    PropertySpec("data_retention_time_in_days", "DATA_RETENTION_TIME_IN_DAYS",
+                 PropertyKind.NUMBER),
+    PropertySpec("comment", "COMMENT", PropertyKind.STRING)
+)
+
+ALTER_PROPERTIES = ClauseBuilder(*[spec for spec in PROPERTIES.specs if spec.name != "share"])
+"""
+The properties which `ALTER DATABASE` can set.  A database created from a share cannot be changed
+to another share.
+"""
 
 
 class DatabaseProvider(BaseDynamicProvider):
     """
-    Dynamic provider for Snowflake Database resources.
+    Dynamic provider for Snowflake Database resources.  The name, data retention and comment are
+    changed in place with `ALTER DATABASE`, so that the objects in the database are kept.
     """
 
+    updatable_properties = frozenset({"name", "data_retention_time_in_days", "comment"})
+
     def __init__(self, provider_params: Provider, connection_provider: Client):
         super().__init__(provider_params, connection_provider, resource_type="Database")
 
     def generate_sql_create_statement(self, name, inputs, environment):
-        template = environment.from_string(
-"""CREATE{% if transient %} TRANSIENT{% endif %} {{ resource_type | upper }} {{ full_name }}
-{% if share %}FROM SHARE {{ share | sql_identifier }}
-{% endif %}
-{%- if data_retention_time_in_days %}DATA_RETENTION_TIME_IN_DAYS = {{ data_retention_time_in_days | sql }}
-{% endif %}
-{%- if comment %}COMMENT = {{ comment | sql }}
-{% endif %}
-""")
-
-        sql = template.render({
-            **inputs,
-            "full_name": self._get_full_object_name(inputs, name),
-            "resource_type": self.resource_type
-        })
+        transient = " TRANSIENT" if inputs.get("transient") else ""
+        full_name = self._get_full_object_name(inputs, name)
+        sql = f"CREATE{transient} {self.resource_type.upper()} {full_name}\n" \
+              f"{PROPERTIES.render(inputs)}"
 
         return sql
 
+    def generate_sql_update_statements(self, name, olds, news, environment):
+        full_name = self._get_full_object_name(news, name)
+        return self._generate_sql_alter_statements(full_name, ALTER_PROPERTIES, olds, news)
+
     def generate_sql_drop_statement(self, name, inputs, environment):
-        template = environment.from_string("DROP {{ resource_type | upper }} {{ full_name }}")
-        sql = template.render({
-            "full_name": self._get_full_object_name(inputs, name),
-            "resource_type": self.resource_type
-        })
-        return sql
+        return self._generate_sql_drop_statement(name, inputs)
+
+    def _record_rename(self, name, new_name, inputs):
+        record_database_rename(name, new_name)
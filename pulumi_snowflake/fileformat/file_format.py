@@ -13,6 +13,9 @@ class FileFormat(Resource):
     Represents a Snowflake File Format.  See
     https://docs.snowflake.net/manuals/sql-reference/sql/create-file-format.html
     for more details of parameters.
+
+    Options are changed in place, but removing any option other than the comment, or changing the
+    type, replaces the file format, since Snowflake cannot unset file format options.
     """
 
     name: Output[str]
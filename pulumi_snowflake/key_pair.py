@@ -0,0 +1,36 @@
+import functools
+from typing import Optional
+
+
+def load_private_key(private_key: Optional[str] = None,
+                     private_key_path: Optional[str] = None,
+                     passphrase: Optional[str] = None) -> bytes:
+    """
+    Loads a PEM encoded RSA private key, either given directly or read from a file, and returns it
+    as unencrypted DER bytes in the form expected by `snowflake.connector.connect`.  Decrypted keys
+    are cached for the life of the process, since decrypting a key protected by a passphrase is
+    deliberately slow.
+    """
+    if private_key is None:
+        with open(private_key_path, "rb") as key_file:
+            private_key = key_file.read().decode("utf-8")
+
+    return _load_pem_private_key(private_key, passphrase)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_pem_private_key(private_key: str, passphrase: Optional[str]) -> bytes:
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives import serialization
+
+    key = serialization.load_pem_private_key(
+        private_key.encode("utf-8"),
+        password=passphrase.encode("utf-8") if passphrase else None,
+        backend=default_backend()
+    )
+
+    return key.private_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption()
+    )
@@ -3,6 +3,15 @@ from typing import Tuple
 from .. import Client
 from ..baseprovider import BaseDynamicProvider
 from ..provider import Provider
+from ..baseprovider.properties import ClauseBuilder, PropertyKind, PropertySpec
+
+
+PROPERTIES = ClauseBuilder(
+    PropertySpec("auto_ingest", "AUTO_INGEST", PropertyKind.BOOL, emit_when_false=True),
+    PropertySpec("aws_sns_topic", "AWS_SNS_TOPIC", PropertyKind.STRING),
+    PropertySpec("integration", "INTEGRATION", PropertyKind.STRING),
+    PropertySpec("comment", "COMMENT", PropertyKind.STRING)
+)
 
 
 class PipeProvider(BaseDynamicProvider):
@@ -14,31 +23,12 @@ class PipeProvider(BaseDynamicProvider):
         super().__init__(provider_params, connection_provider, resource_type="Pipe")
 
     def generate_sql_create_statement(self, name, inputs, environment):
-        template = environment.from_string(
-"""CREATE {{ resource_type | upper }} {{ full_name }}
-{% if auto_ingest is boolean %}AUTO_INGEST = {{ auto_ingest | sql }}
-{% endif %}
-{%- if aws_sns_topic %}AWS_SNS_TOPIC = {{ aws_sns_topic | sql }}
-{% endif %}
-{%- if integration %}INTEGRATION = {{ integration | sql }}
-{% endif %}
-{%- if comment %}COMMENT = {{ comment | sql }}
-{% endif -%}
-AS {{ code }}
-""")
-
-        sql = template.render({
-            **inputs,
-            "full_name": self._get_full_object_name(inputs, name),
-            "resource_type": self.resource_type
-        })
+        full_name = self._get_full_object_name(inputs, name)
+        code = inputs["code"] if "code" in inputs else ""
+        sql = f"CREATE {self.resource_type.upper()} {full_name}\n" \
+              f"{PROPERTIES.render(inputs)}AS {code}"
 
         return sql
 
     def generate_sql_drop_statement(self, name, inputs, environment):
-        template = environment.from_string("DROP {{ resource_type | upper }} {{ full_name }}")
-        sql = template.render({
-            "full_name": self._get_full_object_name(inputs, name),
-            "resource_type": self.resource_type
-        })
-        return sql
+        return self._generate_sql_drop_statement(name, inputs)
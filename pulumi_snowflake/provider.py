@@ -1,20 +1,64 @@
 from typing import Optional
 
-from pulumi import Config
+from pulumi import Config, get_project, get_stack
 
 
 class Provider:
     """
-    Represents the parameters required to create Snowflake dynamic providers.  By default, parameters which are not
-    provided are fetched from config.
+    Represents the parameters required to create Snowflake dynamic providers.  By default,
+    parameters which are not provided are fetched from config.
+
+    Either a password or an RSA private key (for key-pair authentication) must be given.  If
+    `token_cache` is `memory`, session tokens are reused by new connections in the dynamic provider
+    process; if it is `disk`, they are also stored in an encrypted file scoped to the stack, so
+    that later runs can skip the login round-trip.
+
+    `host`, `port` and `protocol` override the address derived from the account name, for example
+    to connect through a proxy or to a local stand-in server (see
+    `pulumi_snowflake.testing.LocalSnowflakeServer`).
+
+    If `render_only` is true, resources render their SQL as usual but never execute it, and the
+    Snowflake connector is never imported.  Statements are appended to `sql_plan_file`, or written
+    to the Pulumi log if it is not set.  Since stack config is per stack, so is the plan file.
+    Unless `render_only_review_stack` is also true, creates and updates record placeholder results,
+    so that a later deployment still executes their statements, and deletes fail (see
+    `BaseDynamicProvider`).  In a dynamic provider process these options are only used if the
+    running stack's config does not set `snowflakeRenderOnly`, since objects are deleted with the
+    parameters pickled when they were last deployed.
     """
     username: str
-    password: str
+    password: Optional[str]
     account_name: str
     role: Optional[str]
     database: Optional[str]
     schema: Optional[str]
 
+    # Dynamic providers are pickled into the stack state together with these parameters, and
+    # resources are deleted with the provider stored when they were last updated.  Options added
+    # since the first release therefore default at class level, so that parameters pickled by an
+    # earlier release can still be used.
+    pool_max_size: Optional[int] = None
+    pool_idle_timeout: Optional[int] = None
+    async_execution: Optional[bool] = None
+    max_in_flight: Optional[int] = None
+    private_key: Optional[str] = None
+    private_key_path: Optional[str] = None
+    private_key_passphrase: Optional[str] = None
+    token_cache: Optional[str] = None
+    token_cache_dir: Optional[str] = None
+    stack: Optional[str] = None
+    max_concurrency: Optional[int] = None
+    concurrency_lock_dir: Optional[str] = None
+    adaptive_concurrency: Optional[bool] = None
+    warm_up_connections: Optional[int] = None
+    ocsp_cache_file: Optional[str] = None
+    host: Optional[str] = None
+    port: Optional[int] = None
+    protocol: Optional[str] = None
+    render_only: Optional[bool] = None
+    sql_plan_file: Optional[str] = None
+    render_only_review_stack: Optional[bool] = None
+
     def __init__(
             self,
             username: str = None,
@@ -22,12 +66,81 @@ class Provider:
             account_name: str = None,
             role: str = None,
             database: str = None,
-            schema: str = None
+            schema: str = None,
+            pool_max_size: int = None,
+            pool_idle_timeout: int = None,
+            async_execution: bool = None,
+            max_in_flight: int = None,
+            private_key: str = None,
+            private_key_path: str = None,
+            private_key_passphrase: str = None,
+            token_cache: str = None,
+            token_cache_dir: str = None,
+            max_concurrency: int = None,
+            concurrency_lock_dir: str = None,
+            adaptive_concurrency: bool = None,
+            warm_up_connections: int = None,
+            ocsp_cache_file: str = None,
+            host: str = None,
+            port: int = None,
+            protocol: str = None,
+            render_only: bool = None,
+            sql_plan_file: str = None,
+            render_only_review_stack: bool = None
     ):
         config = Config()
-        self.username = username if username else config.require('snowflakeUsername')
-        self.password = password if password else config.require('snowflakePassword')
+        self.render_only = render_only if render_only is not None \
+            else config.get_bool('snowflakeRenderOnly')
+
+        # Credentials are only required if statements are executed
+        get_credential = config.get if self.render_only else config.require
+
+        self.username = username if username else get_credential('snowflakeUsername')
+        self.private_key = private_key if private_key else config.get('snowflakePrivateKey')
+        self.private_key_path = private_key_path if private_key_path \
+            else config.get('snowflakePrivateKeyPath')
+        self.private_key_passphrase = private_key_passphrase if private_key_passphrase \
+            else config.get('snowflakePrivateKeyPassphrase')
+
+        if self.private_key or self.private_key_path:
+            self.password = password if password else config.get('snowflakePassword')
+        else:
+            self.password = password if password else get_credential('snowflakePassword')
+
         self.account_name = account_name if account_name else config.get('snowflakeAccountName')
         self.role = role if role else config.get('snowflakeRole')
         self.database = database if database else config.get('snowflakeDatabase')
         self.schema = schema if schema else config.get('snowflakeSchema')
+        self.pool_max_size = pool_max_size if pool_max_size \
+            else config.get_int('snowflakePoolMaxSize')
+        self.pool_idle_timeout = pool_idle_timeout if pool_idle_timeout \
+            else config.get_int('snowflakePoolIdleTimeout')
+        self.async_execution = async_execution if async_execution \
+            else config.get_bool('snowflakeAsyncExecution')
+        self.max_in_flight = max_in_flight if max_in_flight \
+            else config.get_int('snowflakeMaxInFlight')
+        self.token_cache = token_cache if token_cache else config.get('snowflakeTokenCache')
+        self.token_cache_dir = token_cache_dir if token_cache_dir \
+            else config.get('snowflakeTokenCacheDir')
+        self.max_concurrency = max_concurrency if max_concurrency \
+            else config.get_int('snowflakeMaxConcurrency')
+        self.concurrency_lock_dir = concurrency_lock_dir if concurrency_lock_dir \
+            else config.get('snowflakeConcurrencyLockDir')
+        self.adaptive_concurrency = adaptive_concurrency if adaptive_concurrency is not None \
+            else config.get_bool('snowflakeAdaptiveConcurrency')
+        self.warm_up_connections = warm_up_connections if warm_up_connections \
+            else config.get_int('snowflakeWarmUpConnections')
+        self.ocsp_cache_file = ocsp_cache_file if ocsp_cache_file \
+            else config.get('snowflakeOcspCacheFile')
+        self.host = host if host else config.get('snowflakeHost')
+        self.port = port if port else config.get_int('snowflakePort')
+        self.protocol = protocol if protocol else config.get('snowflakeProtocol')
+        self.sql_plan_file = sql_plan_file if sql_plan_file else config.get('snowflakeSqlPlanFile')
+        self.render_only_review_stack = render_only_review_stack \
+            if render_only_review_stack is not None \
+            else config.get_bool('snowflakeRenderOnlyReviewStack')
+        self.stack = f"{get_project()}/{get_stack()}"
+
+        if self.token_cache not in (None, "memory", "disk"):
+            raise Exception(f"Invalid token cache '{self.token_cache}', "
+                            "should be one of 'memory' or 'disk'")
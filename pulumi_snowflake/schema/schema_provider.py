@@ -2,40 +2,45 @@ from .. import Client
 from ..baseprovider import BaseDynamicProvider
 from ..provider import Provider
 from ..validation import Validation
+from ..baseprovider.properties import ClauseBuilder, PropertyKind, PropertySpec
+from ..baseprovider.renames import record_schema_rename
+
+
+PROPERTIES = ClauseBuilder(
+    PropertySpec("data_retention_time_in_days", "DATA_RETENTION_TIME_IN_DAYS",
+                 PropertyKind.NUMBER),
+    PropertySpec("comment", "COMMENT", PropertyKind.STRING)
+)
 
 
 class SchemaProvider(BaseDynamicProvider):
     """
-    Dynamic provider for Snowflake Schema resources.
+    Dynamic provider for Snowflake Schema resources.  The name, data retention and comment are
+    changed in place with `ALTER SCHEMA`, so that the objects in the schema are kept.
     """
 
+    updatable_properties = frozenset({"name", "data_retention_time_in_days", "comment"})
+
     def __init__(self, provider_params: Provider, connection_provider: Client):
         super().__init__(provider_params, connection_provider, resource_type="Schema")
 
     def generate_sql_create_statement(self, name, inputs, environment):
-        template = environment.from_string(
-"""CREATE{% if transient %} TRANSIENT{% endif %} {{ resource_type | upper }} {{ full_name }}
-{% if data_retention_time_in_days %}DATA_RETENTION_TIME_IN_DAYS = {{ data_retention_time_in_days | sql }}
-{% endif %}
-{%- if comment %}COMMENT = {{ comment | sql }}
-{% endif %}
-""")
-
-        sql = template.render({
-            **inputs,
-            "full_name": self._get_full_object_name(inputs, name),
-            "resource_type": self.resource_type,
-        })
+        transient = " TRANSIENT" if inputs.get("transient") else ""
+        full_name = self._get_full_object_name(inputs, name)
+        sql = f"CREATE{transient} {self.resource_type.upper()} {full_name}\n" \
+              f"{PROPERTIES.render(inputs)}"
 
         return sql
 
+    def generate_sql_update_statements(self, name, olds, news, environment):
+        full_name = self._get_full_object_name(news, name)
+        return self._generate_sql_alter_statements(full_name, PROPERTIES, olds, news)
+
     def generate_sql_drop_statement(self, name, inputs, environment):
-        template = environment.from_string("DROP {{ resource_type | upper }} {{ full_name }}")
-        sql = template.render({
-            "full_name": self._get_full_object_name(inputs, name),
-            "resource_type": self.resource_type
-        })
-        return sql
+        return self._generate_sql_drop_statement(name, inputs)
+
+    def _record_rename(self, name, new_name, inputs):
+        record_schema_rename(self._get_database_and_schema(inputs)[0], name, new_name)
 
     def _get_full_object_name(self, inputs, name):
         """
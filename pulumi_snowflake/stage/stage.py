@@ -12,6 +12,9 @@ class Stage(Resource):
     Represents a Snowflake Stage.  See
     https://docs.snowflake.net/manuals/sql-reference/sql/create-stage.html
     for more details of parameters.
+
+    Properties are changed in place, but removing any property other than the comment, or adding a
+    URL to an internal stage, replaces the stage and drops any files in an internal stage.
     """
 
     url: Output[Optional[str]]
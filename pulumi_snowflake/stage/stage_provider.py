@@ -1,46 +1,53 @@
 from ..client import Client
 from ..provider import Provider
 from ..baseprovider.base_dynamic_provider import BaseDynamicProvider
+from ..baseprovider.properties import ClauseBuilder, PropertyKind, PropertySpec
+
+
+PROPERTIES = ClauseBuilder(
+    PropertySpec("url", "URL", PropertyKind.STRING),
+    PropertySpec("storage_integration", "STORAGE_INTEGRATION", PropertyKind.STRING),
+    PropertySpec("credentials", "CREDENTIALS", PropertyKind.DICT),
+    PropertySpec("encryption", "ENCRYPTION", PropertyKind.DICT),
+    PropertySpec("file_format", "FILE_FORMAT", PropertyKind.DICT),
+    PropertySpec("copy_options", "COPY_OPTIONS", PropertyKind.DICT),
+    PropertySpec("comment", "COMMENT", PropertyKind.STRING)
+)
 
 
 class StageProvider(BaseDynamicProvider):
     """
-    Dynamic provider for Snowflake Stage resources.
+    Dynamic provider for Snowflake Stage resources.  Properties are changed in place with
+    `ALTER STAGE`, which keeps the stage's directory and the pipes which load from it.
+    `ALTER STAGE` cannot unset properties or turn an internal stage into an external one, so
+    removing a property other than the comment, or adding a URL, replaces the stage.
     """
 
+    updatable_properties = frozenset(spec.name for spec in PROPERTIES.specs)
+
     def __init__(self, provider_params: Provider, connection_provider: Client):
         super().__init__(provider_params, connection_provider, resource_type="Stage")
 
     def generate_sql_create_statement(self, name, inputs, environment):
-        template = environment.from_string(
-"""CREATE{% if temporary %} TEMPORARY{% endif %} {{ resource_type | upper }} {{ full_name }}
-{% if url %}URL = {{ url | sql }}
-{% endif %}
-{%- if storage_integration %}STORAGE_INTEGRATION = {{ storage_integration | sql }}
-{% endif %}
-{%- if credentials %}CREDENTIALS = {{ credentials | sql }}
-{% endif %}
-{%- if encryption %}ENCRYPTION = {{ encryption | sql }}
-{% endif %}
-{%- if file_format %}FILE_FORMAT = {{ file_format | sql }}
-{% endif %}
-{%- if copy_options %}COPY_OPTIONS = {{ copy_options | sql }}
-{% endif %}
-{%- if comment %}COMMENT = {{ comment | sql }}
-{% endif %}""")
-
-        sql = template.render({
-            **inputs,
-            "full_name": self._get_full_object_name(inputs, name),
-            "resource_type": self.resource_type,
-        })
+        temporary = " TEMPORARY" if inputs.get("temporary") else ""
+        full_name = self._get_full_object_name(inputs, name)
+        sql = f"CREATE{temporary} {self.resource_type.upper()} {full_name}\n" \
+              f"{PROPERTIES.render(inputs)}"
 
         return sql
 
     def generate_sql_drop_statement(self, name, inputs, environment):
-        template = environment.from_string("DROP {{ resource_type | upper }} {{ full_name }}")
-        sql = template.render({
-            "full_name": self._get_full_object_name(inputs, name),
-            "resource_type": self.resource_type
-        })
-        return sql
+        return self._generate_sql_drop_statement(name, inputs)
+
+    def generate_sql_update_statements(self, name, olds, news, environment):
+        full_name = self._get_full_object_name(news, name)
+        return self._generate_sql_alter_set_statements(full_name, PROPERTIES, olds, news)
+
+    def _is_replacement_required(self, field, olds, news):
+        if field == "url" and not olds.get("url"):
+            return True
+
+        if field in self.updatable_properties:
+            return self._is_property_removed(PROPERTIES, field, olds, news)
+
+        return super()._is_replacement_required(field, olds, news)
@@ -1,6 +1,19 @@
 from ..client import Client
 from ..provider import Provider
 from ..baseprovider.base_dynamic_provider import BaseDynamicProvider
+from ..baseprovider.properties import ClauseBuilder, PropertyKind, PropertySpec
+
+
+PROPERTIES = ClauseBuilder(
+    PropertySpec("type", "TYPE", PropertyKind.STRING),
+    PropertySpec("storage_provider", "STORAGE_PROVIDER", PropertyKind.STRING),
+    PropertySpec("storage_aws_role_arn", "STORAGE_AWS_ROLE_ARN", PropertyKind.STRING),
+    PropertySpec("enabled", "ENABLED", PropertyKind.BOOL, emit_when_false=True),
+    PropertySpec("storage_allowed_locations", "STORAGE_ALLOWED_LOCATIONS", PropertyKind.LIST),
+    PropertySpec("storage_blocked_locations", "STORAGE_BLOCKED_LOCATIONS", PropertyKind.LIST),
+    PropertySpec("azure_tenant_id", "AZURE_TENANT_ID", PropertyKind.STRING),
+    PropertySpec("comment", "COMMENT", PropertyKind.STRING)
+)
 
 
 class StorageIntegrationProvider(BaseDynamicProvider):
@@ -12,37 +25,10 @@ class StorageIntegrationProvider(BaseDynamicProvider):
         super().__init__(provider_params, connection_provider, resource_type="Storage Integration")
 
     def generate_sql_create_statement(self, name, inputs, environment):
-        template = environment.from_string(
-"""CREATE {{ resource_type | upper }} {{ full_name }}
-{% if type %}TYPE = {{ type | sql }}
-{% endif %}
-{%- if storage_provider %}STORAGE_PROVIDER = {{ storage_provider | sql }}
-{% endif %}
-{%- if storage_aws_role_arn %}STORAGE_AWS_ROLE_ARN = {{ storage_aws_role_arn | sql }}
-{% endif %}
-{%- if enabled is boolean %}ENABLED = {{ enabled | sql }}
-{% endif %}
-{%- if storage_allowed_locations %}STORAGE_ALLOWED_LOCATIONS = {{ storage_allowed_locations | sql }}
-{% endif %}
-{%- if storage_blocked_locations %}STORAGE_BLOCKED_LOCATIONS = {{ storage_blocked_locations | sql }}
-{% endif %}
-{%- if azure_tenant_id %}AZURE_TENANT_ID = {{ azure_tenant_id | sql }}
-{% endif %}
-{%- if comment %}COMMENT = {{ comment | sql }}
-{% endif %}""")
-
-        sql = template.render({
-            **inputs,
-            "full_name": self._get_full_object_name(inputs, name),
-            "resource_type": self.resource_type,
-        })
+        full_name = self._get_full_object_name(inputs, name)
+        sql = f"CREATE {self.resource_type.upper()} {full_name}\n{PROPERTIES.render(inputs)}"
 
         return sql
 
     def generate_sql_drop_statement(self, name, inputs, environment):
-        template = environment.from_string("DROP {{ resource_type | upper }} {{ full_name }}")
-        sql = template.render({
-            "full_name": self._get_full_object_name(inputs, name),
-            "resource_type": self.resource_type
-        })
-        return sql
+        return self._generate_sql_drop_statement(name, inputs)
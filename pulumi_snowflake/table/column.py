@@ -5,6 +5,10 @@ from typing import Optional
 class Column:
     """
     Represents a column in a Snowflake table.  Used by the `Table` resource constructor.
+
+    To rename a column in place, give it its new name and set `renamed_from` to its current name.
+    Columns are otherwise matched by name, so changing a name without `renamed_from` drops the
+    column and adds a new one.
     """
 
     def __init__(self,
@@ -15,7 +19,8 @@ class Column:
                  autoincrement: Input[Optional[bool]] = None,
                  not_null: Input[Optional[bool]] = None,
                  unique: Input[Optional[bool]] = None,
-                 primary_key: Input[Optional[bool]] = None
+                 primary_key: Input[Optional[bool]] = None,
+                 renamed_from: Input[Optional[str]] = None
                  ):
         self.dict = {
             "name": name,
@@ -26,6 +31,7 @@ class Column:
             "not_null": not_null,
             "unique": unique,
             "primary_key": primary_key,
+            "renamed_from": renamed_from,
         }
 
     def as_dict(self):
@@ -1,50 +1,277 @@
+import re
+from typing import List, Optional
+
 from ..client import Client
 from ..provider import Provider
 from ..baseprovider.base_dynamic_provider import BaseDynamicProvider
+from ..baseprovider.filters import to_identifier, to_sql
+from ..baseprovider.properties import ClauseBuilder, PropertyKind, PropertySpec
+
+
+PROPERTIES = ClauseBuilder(
+    PropertySpec("data_retention_time_in_days", "DATA_RETENTION_TIME_IN_DAYS",
+                 PropertyKind.NUMBER),
+    PropertySpec("comment", "COMMENT", PropertyKind.STRING)
+)
+
+COLUMN_CONSTRAINTS = [
+    ("autoincrement", " AUTOINCREMENT"),
+    ("not_null", " NOT NULL"),
+    ("unique", " UNIQUE"),
+    ("primary_key", " PRIMARY KEY"),
+]
+"""
+The flags of a column definition and the clauses they add, in the order in which they are emitted.
+"""
+
+REPLACED_COLUMN_ATTRIBUTES = ["collation", "autoincrement", "unique", "primary_key"]
+"""
+The column attributes which cannot be changed in place, so that changing them replaces the table.
+"""
+
+_type_separator_regex = re.compile(r"\s*([(),])\s*")
+_type_regex = re.compile(r"^([A-Z_ ]+?)(?:\((\d+)(?:,(\d+))?\))?$")
+_sequence_regex = re.compile(r"^\s*[\w$.\"]+\.NEXTVAL\s*$", re.IGNORECASE)
+
+_text_types = {"VARCHAR", "STRING", "TEXT", "CHAR", "CHARACTER"}
+_maximum_length_text_types = {"VARCHAR", "STRING", "TEXT"}
+_number_types = {"NUMBER", "DECIMAL", "NUMERIC"}
+
+MAX_TEXT_LENGTH = 16777216
+"""
+The length of a `VARCHAR`, `STRING` or `TEXT` column whose type does not give one.
+"""
+
+
+def _normalize_type(column_type) -> str:
+    return _type_separator_regex.sub(r"\1", " ".join(str(column_type or "").upper().split()))
+
+
+def _get_text_length(base: str, length: Optional[str]) -> int:
+    """
+    Returns the length of a text type, which defaults to the maximum, except for `CHAR` and
+    `CHARACTER`, which default to a length of 1.
+    """
+    if length is not None:
+        return int(length)
+
+    return MAX_TEXT_LENGTH if base in _maximum_length_text_types else 1
+
+
+def _is_type_widened(old_type: str, new_type: str) -> bool:
+    """
+    Returns whether a column's type can be changed in place, which Snowflake only allows for a
+    longer text type, or a number with more precision and the same scale.  Both types must be
+    normalized.
+    """
+    old_match = _type_regex.match(old_type)
+    new_match = _type_regex.match(new_type)
+
+    if old_match is None or new_match is None:
+        return False
+
+    (old_base, old_length, old_scale) = old_match.groups()
+    (new_base, new_length, new_scale) = new_match.groups()
+
+    if old_base in _text_types and new_base in _text_types:
+        return _get_text_length(new_base, new_length) >= _get_text_length(old_base, old_length)
+
+    if old_base in _number_types and new_base in _number_types:
+        return (old_scale or "0") == (new_scale or "0") \
+            and int(new_length or 38) >= int(old_length or 38)
+
+    return False
+
+
+def _is_sequence(default) -> bool:
+    """
+    Returns whether a column default is the next value of a sequence, the only kind of default
+    Snowflake can set on an existing column.
+    """
+    return default is not None and _sequence_regex.match(str(default)) is not None
 
 
 class TableProvider(BaseDynamicProvider):
     """
-    Dynamic provider for Snowflake Table resources.
+    Dynamic provider for Snowflake Table resources.  Columns, the clustering key, data retention
+    and comment are changed in place with `ALTER TABLE`, so that the data in the table is kept.
+    Columns are matched by name, and a column is only renamed if its new definition names the old
+    column in `renamed_from`.  Since Snowflake cannot reorder columns, a change to the order of the
+    columns alone is ignored.
     """
 
+    updatable_properties = frozenset({"columns", "cluster_by", "data_retention_time_in_days",
+                                      "comment"})
+
     def __init__(self, provider_params: Provider, connection_provider: Client):
         super().__init__(provider_params, connection_provider, resource_type="Table")
 
     def generate_sql_create_statement(self, name, inputs, environment):
-        template = environment.from_string(
-"""CREATE{% if temporary %} TEMPORARY{% endif %} {{ resource_type | upper }} {{ full_name }}
-(
-{% for column in columns %}  {{ column.name | sql_identifier }} {{ column.type }}
-  {%- if column.collation %} COLLATE {{ column.collation | sql }}{% endif %}
-  {%- if column.default %} DEFAULT {{ column.default }}{% endif %}
-  {%- if column.autoincrement %} AUTOINCREMENT{% endif %}
-  {%- if column.not_null %} NOT NULL{% endif %}
-  {%- if column.unique %} UNIQUE{% endif %}
-  {%- if column.primary_key %} PRIMARY KEY{% endif -%}
-  {{ "," if not loop.last }}
-{% endfor %})
-{% if cluster_by -%}
-CLUSTER BY ( {{ cluster_by | join(',') }} )
-{% endif %}
-{%- if data_retention_time_in_days %}DATA_RETENTION_TIME_IN_DAYS = {{ data_retention_time_in_days | sql }}
-{% endif %}
-{%- if comment %}COMMENT = {{ comment | sql }}
-{% endif %}
-""")
-
-        sql = template.render({
-            **inputs,
-            "full_name": self._get_full_object_name(inputs, name),
-            "resource_type": self.resource_type,
-        })
-
-        return sql
+        return "".join(self.generate_sql_create_chunks(name, inputs, environment))
+
+    def generate_sql_create_chunks(self, name, inputs, environment=None):
+        """
+        Yields the statement header, then each column definition, then the clauses that follow the
+        columns.  Only render-only mode and `write_sql_create_statement` consume the chunks as a
+        stream; `create` joins them into one string, since the connector sends each request as a
+        single string.
+        """
+        temporary = " TEMPORARY" if inputs.get("temporary") else ""
+        full_name = self._get_full_object_name(inputs, name)
+
+        yield f"CREATE{temporary} {self.resource_type.upper()} {full_name}\n(\n"
+
+        columns = inputs.get("columns") or []
+        last = len(columns) - 1
+
+        for (index, column) in enumerate(columns):
+            yield self._generate_column_definition(column) + (",\n" if index < last else "\n")
+
+        yield ")\n"
+
+        if inputs.get("cluster_by"):
+            yield f"CLUSTER BY ( {','.join(map(str, inputs['cluster_by']))} )\n"
+
+        yield PROPERTIES.render(inputs)
+
+    def _generate_column_definition(self, column):
+        column_type = column["type"] if "type" in column else ""
+        definition = f"  {to_identifier(column.get('name'))} {column_type}"
+
+        if column.get("collation"):
+            definition += f" COLLATE {to_sql(column['collation'])}"
+
+        if column.get("default"):
+            definition += f" DEFAULT {column['default']}"
+
+        for (key, clause) in COLUMN_CONSTRAINTS:
+            if column.get(key):
+                definition += clause
+
+        return definition
 
     def generate_sql_drop_statement(self, name, inputs, environment):
-        template = environment.from_string("DROP {{ resource_type | upper }} {{ full_name }}")
-        sql = template.render({
-            "full_name": self._get_full_object_name(inputs, name),
-            "resource_type": self.resource_type
-        })
-        return sql
+        return self._generate_sql_drop_statement(name, inputs)
+
+    def generate_sql_update_statements(self, name, olds, news, environment):
+        full_name = self._get_full_object_name(news, name)
+        actions = self._generate_column_changes(olds.get("columns") or [],
+                                                news.get("columns") or [])
+
+        if actions is None:
+            raise Exception(f"The columns of table {full_name} cannot be changed in place")
+
+        if (olds.get("cluster_by") or None) != (news.get("cluster_by") or None):
+            if news.get("cluster_by"):
+                actions.append(f"CLUSTER BY ( {','.join(map(str, news['cluster_by']))} )")
+            else:
+                actions.append("DROP CLUSTERING KEY")
+
+        return [f"ALTER TABLE {full_name} {action}" for action in actions] + \
+            self._generate_sql_alter_statements(full_name, PROPERTIES, olds, news)
+
+    def _is_changed(self, field, olds, news):
+        if field == "columns":
+            return self._generate_column_changes(olds.get("columns") or [],
+                                                 news.get("columns") or []) != []
+
+        return super()._is_changed(field, olds, news)
+
+    def _is_replacement_required(self, field, olds, news):
+        if field == "columns":
+            return self._generate_column_changes(olds.get("columns") or [],
+                                                 news.get("columns") or []) is None
+
+        return super()._is_replacement_required(field, olds, news)
+
+    def _generate_column_changes(self, old_columns, new_columns) -> Optional[List[str]]:
+        """
+        Returns the `ALTER TABLE` actions which change the old columns into the new ones, or `None`
+        if a change cannot be made in place, such as narrowing a column's type.  Columns are
+        matched by name, or by `renamed_from` for a column whose name is not among the old columns,
+        regardless of their order.  Columns are renamed first, then added, then dropped, so that
+        every column can be replaced without the table ever being left without columns.
+        """
+        old_columns_by_name = {column.get("name"): column for column in old_columns}
+        new_names = {column.get("name") for column in new_columns}
+        renames = []
+        added = []
+        matched = []
+
+        for column in new_columns:
+            old_column = old_columns_by_name.get(column.get("name"))
+            renamed_from = column.get("renamed_from")
+
+            # Once renamed, a column keeps `renamed_from` in its definition, and is matched by its
+            # new name
+            if old_column is None and renamed_from in old_columns_by_name and \
+                    renamed_from not in new_names and \
+                    renamed_from not in {old_name for (old_name, _) in renames}:
+                old_column = old_columns_by_name[renamed_from]
+                renames.append((renamed_from, column.get("name")))
+
+            if old_column is None:
+                added.append(column)
+            else:
+                matched.append((old_column, column))
+
+        matched_names = {old_column.get("name") for (old_column, _) in matched}
+        dropped = [column.get("name") for column in old_columns
+                   if column.get("name") not in matched_names]
+
+        actions = [f"RENAME COLUMN {to_identifier(old_name)} TO {to_identifier(new_name)}"
+                   for (old_name, new_name) in renames]
+
+        if added:
+            definitions = [self._generate_column_definition(column).strip() for column in added]
+            actions.append("ADD COLUMN " + ", ".join(definitions))
+
+        if dropped:
+            actions.append("DROP COLUMN " + ", ".join(to_identifier(name) for name in dropped))
+
+        for (old_column, column) in matched:
+            column_actions = self._generate_column_alterations(old_column, column)
+
+            if column_actions is None:
+                return None
+
+            actions.extend(f"ALTER COLUMN {to_identifier(column.get('name'))} {action}"
+                           for action in column_actions)
+
+        return actions
+
+    def _generate_column_alterations(self, old_column, new_column) -> Optional[List[str]]:
+        """
+        Returns the `ALTER COLUMN` actions which change a column's type, nullability and default,
+        or `None` if any other attribute has changed.  Snowflake can only drop a default, or change
+        one sequence default to another, so any other change to the default also returns `None`.
+        """
+        for key in REPLACED_COLUMN_ATTRIBUTES:
+            if (old_column.get(key) or None) != (new_column.get(key) or None):
+                return None
+
+        actions = []
+        (old_type, new_type) = (_normalize_type(old_column.get("type")),
+                                _normalize_type(new_column.get("type")))
+
+        if old_type != new_type:
+            if not _is_type_widened(old_type, new_type):
+                return None
+
+            actions.append(f"SET DATA TYPE {new_column['type']}")
+
+        if bool(old_column.get("not_null")) != bool(new_column.get("not_null")):
+            actions.append("SET NOT NULL" if new_column.get("not_null") else "DROP NOT NULL")
+
+        (old_default, new_default) = (old_column.get("default") or None,
+                                      new_column.get("default") or None)
+
+        if old_default != new_default:
+            if new_default is None:
+                actions.append("DROP DEFAULT")
+            elif _is_sequence(old_default) and _is_sequence(new_default):
+                actions.append(f"SET DEFAULT {new_default}")
+            else:
+                return None
+
+        return actions
@@ -0,0 +1,4 @@
+from .catalog import Catalog, CatalogObject, Result, Session
+from .errors import ProgrammingError
+from .fake_client import FakeClient, FakeConnection, FakeCursor
+from .local_server import LocalSnowflakeServer
@@ -0,0 +1,1021 @@
+import datetime
+import fnmatch
+import json
+import re
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from .errors import ProgrammingError, ALREADY_EXISTS, DOES_NOT_EXIST, INVALID_PROPERTY, \
+    NO_CURRENT_DATABASE, SYNTAX_ERROR
+from .sql_parser import StatementParser, parse_identifier_text
+
+DATABASE = "DATABASE"
+SCHEMA = "SCHEMA"
+TABLE = "TABLE"
+STAGE = "STAGE"
+PIPE = "PIPE"
+FILE_FORMAT = "FILE FORMAT"
+STORAGE_INTEGRATION = "STORAGE INTEGRATION"
+WAREHOUSE = "WAREHOUSE"
+
+ACCOUNT_KINDS = {DATABASE, STORAGE_INTEGRATION, WAREHOUSE}
+SCHEMA_KINDS = {TABLE, STAGE, PIPE, FILE_FORMAT}
+
+DEFAULT_SCHEMA = "PUBLIC"
+
+_kind_keywords = [
+    (("FILE", "FORMAT"), FILE_FORMAT),
+    (("STORAGE", "INTEGRATION"), STORAGE_INTEGRATION),
+    (("INTEGRATION",), STORAGE_INTEGRATION),
+    (("DATABASE",), DATABASE),
+    (("SCHEMA",), SCHEMA),
+    (("TABLE",), TABLE),
+    (("STAGE",), STAGE),
+    (("PIPE",), PIPE),
+    (("WAREHOUSE",), WAREHOUSE),
+]
+
+_plural_kind_keywords = [
+    (("FILE", "FORMATS"), FILE_FORMAT),
+    (("STORAGE", "INTEGRATIONS"), STORAGE_INTEGRATION),
+    (("INTEGRATIONS",), STORAGE_INTEGRATION),
+    (("DATABASES",), DATABASE),
+    (("SCHEMAS",), SCHEMA),
+    (("TABLES",), TABLE),
+    (("STAGES",), STAGE),
+    (("PIPES",), PIPE),
+    (("WAREHOUSES",), WAREHOUSE),
+]
+
+_modifiers = {"TRANSIENT": "TRANSIENT", "TEMPORARY": "TEMPORARY", "TEMP": "TEMPORARY",
+              "VOLATILE": "VOLATILE"}
+
+PROPERTIES = {
+    DATABASE: {"DATA_RETENTION_TIME_IN_DAYS", "MAX_DATA_EXTENSION_TIME_IN_DAYS",
+               "DEFAULT_DDL_COLLATION", "COMMENT"},
+    SCHEMA: {"DATA_RETENTION_TIME_IN_DAYS", "MAX_DATA_EXTENSION_TIME_IN_DAYS",
+             "DEFAULT_DDL_COLLATION", "COMMENT"},
+    TABLE: {"DATA_RETENTION_TIME_IN_DAYS", "MAX_DATA_EXTENSION_TIME_IN_DAYS", "CHANGE_TRACKING",
+            "DEFAULT_DDL_COLLATION", "STAGE_FILE_FORMAT", "STAGE_COPY_OPTIONS", "COMMENT"},
+    STAGE: {"URL", "STORAGE_INTEGRATION", "CREDENTIALS", "ENCRYPTION", "FILE_FORMAT",
+            "COPY_OPTIONS", "DIRECTORY", "COMMENT"},
+    PIPE: {"AUTO_INGEST", "AWS_SNS_TOPIC", "INTEGRATION", "ERROR_INTEGRATION",
+           "PIPE_EXECUTION_PAUSED", "COMMENT"},
+    FILE_FORMAT: {"TYPE", "COMPRESSION", "RECORD_DELIMITER", "FIELD_DELIMITER", "FILE_EXTENSION",
+                  "SKIP_HEADER", "SKIP_BLANK_LINES", "DATE_FORMAT", "TIME_FORMAT",
+                  "TIMESTAMP_FORMAT", "BINARY_FORMAT", "ESCAPE", "ESCAPE_UNENCLOSED_FIELD",
+                  "TRIM_SPACE", "FIELD_OPTIONALLY_ENCLOSED_BY", "NULL_IF",
+                  "ERROR_ON_COLUMN_COUNT_MISMATCH", "REPLACE_INVALID_CHARACTERS", "VALIDATE_UTF8",
+                  "EMPTY_FIELD_AS_NULL", "SKIP_BYTE_ORDER_MARK", "ENCODING", "ENABLE_OCTAL",
+                  "ALLOW_DUPLICATE", "STRIP_OUTER_ARRAY", "STRIP_NULL_VALUES",
+                  "IGNORE_UTF8_ERRORS", "BINARY_AS_TEXT", "SNAPPY_COMPRESSION", "PRESERVE_SPACE",
+                  "STRIP_OUTER_ELEMENT", "DISABLE_SNOWFLAKE_DATA", "DISABLE_AUTO_CONVERT",
+                  "COMMENT"},
+    STORAGE_INTEGRATION: {"TYPE", "STORAGE_PROVIDER", "STORAGE_AWS_ROLE_ARN",
+                          "STORAGE_AWS_OBJECT_ACL", "ENABLED", "STORAGE_ALLOWED_LOCATIONS",
+                          "STORAGE_BLOCKED_LOCATIONS", "AZURE_TENANT_ID", "COMMENT"},
+    WAREHOUSE: {"WAREHOUSE_SIZE", "WAREHOUSE_TYPE", "MAX_CLUSTER_COUNT", "MIN_CLUSTER_COUNT",
+                "SCALING_POLICY", "AUTO_SUSPEND", "AUTO_RESUME", "INITIALLY_SUSPENDED",
+                "RESOURCE_MONITOR", "MAX_CONCURRENCY_LEVEL", "STATEMENT_QUEUED_TIMEOUT_IN_SECONDS",
+                "STATEMENT_TIMEOUT_IN_SECONDS", "ENABLE_QUERY_ACCELERATION",
+                "QUERY_ACCELERATION_MAX_SCALE_FACTOR", "COMMENT"},
+}
+"""
+The properties accepted by `CREATE` and `ALTER ... SET` for each kind of object.
+"""
+
+_column_keywords = ("COLLATE", "DEFAULT", "AUTOINCREMENT", "IDENTITY", "NOT", "NULL", "UNIQUE",
+                    "PRIMARY", "COMMENT")
+
+_type_regex = re.compile(r"^\s*([A-Z_ ]+?)\s*(?:\(\s*(\d+)\s*(?:,\s*(\d+)\s*)?\))?\s*$")
+_sequence_regex = re.compile(r"^\s*[\w$.\"]+\.NEXTVAL\s*$", re.IGNORECASE)
+
+_text_types = {"VARCHAR", "STRING", "TEXT", "CHAR", "CHARACTER"}
+_number_types = {"NUMBER", "DECIMAL", "NUMERIC"}
+
+
+class Session:
+    """
+    The current database and schema of a fake connection.  Names are given as they would be written
+    in SQL.
+    """
+
+    def __init__(self, database: Optional[str] = None, schema: Optional[str] = None):
+        self.database = parse_identifier_text(database)[0] if database is not None else None
+
+        if schema is not None:
+            self.schema = parse_identifier_text(schema)[0]
+        else:
+            self.schema = DEFAULT_SCHEMA if database is not None else None
+
+
+class Result(NamedTuple):
+    """
+    The result set of one statement.
+    """
+
+    columns: List[str]
+    rows: List[tuple]
+
+
+class CatalogObject:
+    """
+    A database object held by the fake catalog.  Names are stored normalized, so unquoted
+    identifiers are upper case.
+    """
+
+    def __init__(self,
+                 kind: str,
+                 name: str,
+                 database: Optional[str] = None,
+                 schema: Optional[str] = None,
+                 modifier: Optional[str] = None):
+        self.kind = kind
+        self.name = name
+        self.database = database
+        self.schema = schema
+        self.modifier = modifier
+        self.properties: Dict[str, Any] = {}
+        self.columns: List[dict] = []
+        self.cluster_by: List[str] = []
+        self.definition: Optional[str] = None
+        self.state: Optional[str] = None
+        self.created_on = datetime.datetime.now()
+
+    @property
+    def key(self) -> Tuple[str, Optional[str], Optional[str], str]:
+        return self.kind, self.database, self.schema, self.name
+
+    @property
+    def full_name(self) -> str:
+        return ".".join(part for part in (self.database, self.schema, self.name)
+                        if part is not None)
+
+    def get_column(self, name: str) -> Optional[dict]:
+        return next((column for column in self.columns if column["name"] == name), None)
+
+    def __repr__(self):
+        return f"CatalogObject({self.kind} {self.full_name})"
+
+
+class Catalog:
+    """
+    An in-memory model of the objects in a Snowflake account, which executes the DDL generated by
+    the dynamic providers with Snowflake's rules: objects must not already exist when created, must
+    exist when altered or dropped, must be created inside an existing database and schema, and must
+    only reference integrations, file formats, tables and stages which exist.  Dropping a database
+    or schema drops everything in it.  `SHOW` and `DESCRIBE` return result sets with a subset of
+    Snowflake's columns.
+
+    Every statement executed is appended to `history`, so tests can assert on the order of
+    statements across all connections.  The catalog is safe to use from many threads.
+    """
+
+    def __init__(self):
+        self.objects: Dict[tuple, CatalogObject] = {}
+        self.history: List[str] = []
+        self._lock = threading.RLock()
+
+    def execute(self, statement: str, session: Optional[Session] = None) -> Result:
+        """
+        Executes a single statement and returns its result set, or raises `ProgrammingError` if
+        Snowflake would reject it.
+        """
+        session = session if session is not None else Session()
+        parser = StatementParser(statement)
+
+        with self._lock:
+            self.history.append(statement)
+
+            if parser.accept_keyword("CREATE"):
+                return self._create(parser, session)
+            elif parser.accept_keyword("DROP"):
+                return self._drop(parser, session)
+            elif parser.accept_keyword("ALTER"):
+                return self._alter(parser, session)
+            elif parser.accept_keyword("SHOW"):
+                return self._show(parser, session)
+            elif parser.accept_keyword("DESCRIBE") or parser.accept_keyword("DESC"):
+                return self._describe(parser, session)
+            elif parser.accept_keyword("USE"):
+                return self._use(parser, session)
+            elif parser.accept_keyword("SELECT"):
+                return self._select(parser)
+            elif parser.accept_keyword("BEGIN") or parser.accept_keyword("START") or \
+                    parser.accept_keyword("COMMIT") or parser.accept_keyword("ROLLBACK"):
+                # DDL statements commit implicitly, so transactions have no effect on the catalog
+                parser.accept_keyword("TRANSACTION")
+                parser.accept_keyword("WORK")
+                parser.expect_end()
+                return _status("Statement executed successfully.")
+
+            keyword = statement.split(None, 1)[0] if statement else ''
+            raise parser.error(f"unsupported statement '{keyword}'")
+
+    def get(self, kind: str, name: str,
+            session: Optional[Session] = None) -> Optional[CatalogObject]:
+        """
+        Looks up an object by kind and name, for example
+        `catalog.get(TABLE, "db.public.my_table")`.  Unqualified names are resolved against the
+        session.
+        """
+        parts = StatementParser(name).parse_name()
+
+        with self._lock:
+            return self.objects.get((kind, *self._resolve(kind, parts, session or Session())))
+
+    def list_objects(self, kind: str) -> List[CatalogObject]:
+        with self._lock:
+            return [obj for obj in self.objects.values() if obj.kind == kind]
+
+    # CREATE
+
+    def _create(self, parser: StatementParser, session: Session) -> Result:
+        or_replace = parser.accept_keyword("OR", "REPLACE")
+        modifier = self._parse_modifier(parser)
+        kind = self._parse_kind(parser)
+        if_not_exists = parser.accept_keyword("IF", "NOT", "EXISTS")
+        (database, schema, name) = self._resolve(kind, parser.parse_name(), session)
+
+        obj = CatalogObject(kind, name, database, schema, modifier)
+
+        if kind == DATABASE and parser.accept_keyword("FROM", "SHARE"):
+            obj.properties["SHARE"] = ".".join(parser.parse_name())
+
+        if kind == TABLE:
+            obj.columns = self._parse_column_definitions(parser)
+
+        properties = parser.parse_properties(stop_keywords=("CLUSTER", "AS"))
+
+        if kind == TABLE and parser.accept_keyword("CLUSTER", "BY"):
+            obj.cluster_by = parser.parse_parenthesized_text()
+            properties.update(parser.parse_properties())
+
+        if kind == PIPE:
+            parser.expect_keyword("AS")
+            obj.definition = parser.remaining_text().rstrip(";").strip()
+
+        parser.expect_end()
+
+        self._validate_properties(kind, properties)
+        obj.properties.update(properties)
+
+        if kind == WAREHOUSE:
+            obj.state = "SUSPENDED" if properties.get("INITIALLY_SUSPENDED") else "STARTED"
+
+        self._check_parent_exists(kind, database, schema)
+        self._check_references_exist(obj, properties, session)
+
+        existing = self.objects.get(obj.key)
+
+        if existing is not None:
+            if if_not_exists:
+                return _status(f"{obj.name} already exists, statement succeeded.")
+
+            if not or_replace:
+                raise ProgrammingError(f"SQL compilation error: Object '{obj.full_name}' already "
+                                       f"exists.", ALREADY_EXISTS)
+
+            self._remove(existing)
+
+        self.objects[obj.key] = obj
+
+        if kind == DATABASE:
+            public = CatalogObject(SCHEMA, DEFAULT_SCHEMA, name)
+            self.objects[public.key] = public
+
+        return _status(f"{kind.capitalize()} {obj.name} successfully created.")
+
+    def _parse_column_definitions(self, parser: StatementParser) -> List[dict]:
+        parser.expect_punct("(")
+        columns = []
+
+        while True:
+            columns.append(self._parse_column_definition(parser))
+
+            if parser.accept_punct(")"):
+                return columns
+
+            parser.expect_punct(",")
+
+    def _parse_column_definition(self, parser: StatementParser) -> dict:
+        column = {
+            "name": parser.parse_identifier(),
+            "type": _parse_text_until(parser, _column_keywords).upper(),
+            "collation": None,
+            "default": None,
+            "autoincrement": False,
+            "not_null": False,
+            "unique": False,
+            "primary_key": False,
+            "comment": None,
+        }
+
+        if not column["type"]:
+            raise parser.error(f"missing type for column '{column['name']}'")
+
+        while True:
+            if parser.accept_keyword("COLLATE"):
+                column["collation"] = parser.parse_value()
+            elif parser.accept_keyword("DEFAULT"):
+                column["default"] = _parse_text_until(parser, _column_keywords)
+            elif parser.accept_keyword("AUTOINCREMENT") or parser.accept_keyword("IDENTITY"):
+                column["autoincrement"] = True
+
+                if parser.is_punct("("):
+                    parser.parse_parenthesized_text()
+            elif parser.accept_keyword("NOT", "NULL"):
+                column["not_null"] = True
+            elif parser.accept_keyword("NULL"):
+                column["not_null"] = False
+            elif parser.accept_keyword("UNIQUE"):
+                column["unique"] = True
+            elif parser.accept_keyword("PRIMARY", "KEY"):
+                column["primary_key"] = True
+                column["not_null"] = True
+            elif parser.accept_keyword("COMMENT"):
+                column["comment"] = parser.parse_value()
+            else:
+                return column
+
+    # DROP
+
+    def _drop(self, parser: StatementParser, session: Session) -> Result:
+        kind = self._parse_kind(parser)
+        if_exists = parser.accept_keyword("IF", "EXISTS")
+        key = (kind, *self._resolve(kind, parser.parse_name(), session))
+        restrict = parser.accept_keyword("RESTRICT")
+        parser.accept_keyword("CASCADE")
+        parser.expect_end()
+
+        obj = self.objects.get(key)
+
+        if obj is None:
+            if if_exists:
+                return _status(f"Drop statement executed successfully ({key[-1]} already "
+                               f"dropped).")
+
+            raise _does_not_exist(kind, key)
+
+        if restrict and self._children(obj):
+            raise ProgrammingError(f"SQL execution error: Cannot drop {kind.lower()} "
+                                   f"'{obj.full_name}' because it is not empty.", SYNTAX_ERROR)
+
+        self._remove(obj)
+
+        return _status(f"{obj.name} successfully dropped.")
+
+    # ALTER
+
+    def _alter(self, parser: StatementParser, session: Session) -> Result:
+        kind = self._parse_kind(parser)
+        if_exists = parser.accept_keyword("IF", "EXISTS")
+        key = (kind, *self._resolve(kind, parser.parse_name(), session))
+        obj = self.objects.get(key)
+
+        if obj is None:
+            if if_exists:
+                return _status("Statement executed successfully.")
+
+            raise _does_not_exist(kind, key)
+
+        if parser.accept_keyword("RENAME", "TO"):
+            self._rename(obj, self._resolve(kind, parser.parse_name(), session))
+        elif parser.accept_keyword("SET"):
+            self._alter_set(obj, parser, session)
+        elif parser.accept_keyword("UNSET"):
+            self._alter_unset(obj, parser)
+        elif kind == WAREHOUSE and parser.accept_keyword("SUSPEND"):
+            obj.state = "SUSPENDED"
+        elif kind == WAREHOUSE and parser.accept_keyword("RESUME"):
+            parser.accept_keyword("IF", "SUSPENDED")
+            obj.state = "STARTED"
+        elif kind == TABLE:
+            self._alter_table(obj, parser)
+        else:
+            raise parser.error(f"unsupported ALTER {kind} action")
+
+        parser.expect_end()
+
+        return _status("Statement executed successfully.")
+
+    def _alter_set(self, obj: CatalogObject, parser: StatementParser, session: Session):
+        properties = parser.parse_properties()
+
+        if not properties:
+            raise parser.error("expected at least one property after SET")
+
+        if obj.kind == FILE_FORMAT and "TYPE" in properties \
+                and properties["TYPE"] != obj.properties.get("TYPE"):
+            raise ProgrammingError("SQL compilation error: The type of a file format cannot be "
+                                   "changed.", INVALID_PROPERTY)
+
+        self._validate_properties(obj.kind, properties)
+        self._check_references_exist(obj, properties, session)
+        obj.properties.update(properties)
+
+    def _alter_unset(self, obj: CatalogObject, parser: StatementParser):
+        if obj.kind == FILE_FORMAT:
+            raise parser.error("ALTER FILE FORMAT does not support UNSET")
+
+        names = [parser.parse_identifier()]
+
+        while parser.accept_punct(","):
+            names.append(parser.parse_identifier())
+
+        self._validate_properties(obj.kind, {name: None for name in names})
+
+        for name in names:
+            obj.properties.pop(name, None)
+
+    def _alter_table(self, obj: CatalogObject, parser: StatementParser):
+        if parser.accept_keyword("CLUSTER", "BY"):
+            obj.cluster_by = parser.parse_parenthesized_text()
+        elif parser.accept_keyword("DROP", "CLUSTERING", "KEY"):
+            obj.cluster_by = []
+        elif parser.accept_keyword("ADD"):
+            parser.accept_keyword("COLUMN")
+
+            while True:
+                column = self._parse_column_definition(parser)
+
+                if obj.get_column(column["name"]) is not None:
+                    raise ProgrammingError(f"SQL compilation error: column '{column['name']}' "
+                                           f"already exists", ALREADY_EXISTS)
+
+                if column["not_null"] and column["default"] is None \
+                        and not column["autoincrement"]:
+                    raise ProgrammingError(f"SQL compilation error: Non-nullable column "
+                                           f"'{column['name']}' cannot be added to non-empty "
+                                           f"table without a default", SYNTAX_ERROR)
+
+                obj.columns.append(column)
+
+                if not parser.accept_punct(","):
+                    break
+
+                parser.accept_keyword("COLUMN")
+        elif parser.is_keyword("DROP"):
+            parser.expect_keyword("DROP")
+            parser.accept_keyword("COLUMN")
+            names = [parser.parse_identifier()]
+
+            while parser.accept_punct(","):
+                names.append(parser.parse_identifier())
+
+            for name in names:
+                self._get_column(obj, name)
+
+            if len(names) >= len(obj.columns):
+                raise ProgrammingError("SQL compilation error: Cannot drop every column of a "
+                                       "table", SYNTAX_ERROR)
+
+            obj.columns = [column for column in obj.columns if column["name"] not in names]
+        elif parser.accept_keyword("RENAME", "COLUMN"):
+            column = self._get_column(obj, parser.parse_identifier())
+            parser.expect_keyword("TO")
+            new_name = parser.parse_identifier()
+
+            if obj.get_column(new_name) is not None:
+                raise ProgrammingError(f"SQL compilation error: column '{new_name}' already "
+                                       f"exists", ALREADY_EXISTS)
+
+            column["name"] = new_name
+        elif parser.accept_keyword("ALTER") or parser.accept_keyword("MODIFY"):
+            parser.accept_punct("(")
+
+            while True:
+                self._alter_column(obj, parser)
+
+                if not parser.accept_punct(","):
+                    break
+
+            parser.accept_punct(")")
+        else:
+            raise parser.error("unsupported ALTER TABLE action")
+
+    def _alter_column(self, obj: CatalogObject, parser: StatementParser):
+        parser.accept_keyword("COLUMN")
+        column = self._get_column(obj, parser.parse_identifier())
+
+        if parser.accept_keyword("SET", "NOT", "NULL"):
+            column["not_null"] = True
+        elif parser.accept_keyword("DROP", "NOT", "NULL"):
+            column["not_null"] = False
+        elif parser.accept_keyword("SET", "DEFAULT"):
+            default = _parse_text_until(parser, ())
+
+            if not (_is_sequence(column["default"]) and _is_sequence(default)):
+                raise ProgrammingError(f"SQL compilation error: cannot set the default of column "
+                                       f"{column['name']} to {default}, only a sequence default "
+                                       f"can be changed", SYNTAX_ERROR)
+
+            column["default"] = default
+        elif parser.accept_keyword("DROP", "DEFAULT"):
+            column["default"] = None
+        elif parser.accept_keyword("UNSET", "COMMENT"):
+            column["comment"] = None
+        elif parser.accept_keyword("COMMENT"):
+            column["comment"] = parser.parse_value()
+        elif parser.accept_keyword("SET", "DATA", "TYPE") or parser.accept_keyword("TYPE") or \
+                parser.accept_keyword("SET", "TYPE"):
+            new_type = _parse_text_until(parser, ()).upper()
+
+            if not _is_type_change_allowed(column["type"], new_type):
+                raise ProgrammingError(f"SQL compilation error: cannot change column "
+                                       f"{column['name']} from type {column['type']} to "
+                                       f"{new_type}", SYNTAX_ERROR)
+
+            column["type"] = new_type
+        else:
+            raise parser.error(f"unsupported ALTER COLUMN action for column '{column['name']}'")
+
+    def _get_column(self, obj: CatalogObject, name: str) -> dict:
+        column = obj.get_column(name)
+
+        if column is None:
+            raise ProgrammingError(f"SQL compilation error: error line 0 at position 0 invalid "
+                                   f"identifier '{name}'", DOES_NOT_EXIST)
+
+        return column
+
+    def _rename(self, obj: CatalogObject, new_name: Tuple[Optional[str], Optional[str], str]):
+        new_key = (obj.kind, *new_name)
+
+        if new_key in self.objects:
+            raise ProgrammingError(f"SQL compilation error: Object '{new_name[-1]}' already "
+                                   f"exists.", ALREADY_EXISTS)
+
+        (database, schema, name) = new_name
+        self._check_parent_exists(obj.kind, database, schema)
+
+        children = self._children(obj)
+        del self.objects[obj.key]
+
+        for child in children:
+            del self.objects[child.key]
+
+            if obj.kind == DATABASE:
+                child.database = name
+            else:
+                child.schema = name
+
+            self.objects[child.key] = child
+
+        (obj.database, obj.schema, obj.name) = (database, schema, name)
+        self.objects[obj.key] = obj
+
+    # SHOW and DESCRIBE
+
+    def _show(self, parser: StatementParser, session: Session) -> Result:
+        parser.accept_keyword("TERSE")
+        kind = self._parse_kind(parser, _plural_kind_keywords)
+        pattern = None
+
+        if parser.accept_keyword("LIKE"):
+            pattern = parser.parse_value()
+
+        (database, schema) = self._parse_show_scope(kind, parser, session)
+        parser.expect_end()
+
+        objects = [
+            obj for obj in self.objects.values()
+            if obj.kind == kind
+            if database is None or obj.database == database
+            if schema is None or obj.schema == schema
+            if pattern is None or _like(obj.name, pattern)
+        ]
+        objects.sort(key=lambda obj: (obj.database or "", obj.schema or "", obj.name))
+
+        columns = _show_columns[kind]
+
+        return Result([name for (name, _) in columns], [tuple(value(obj) for (_, value) in columns)
+                                                         for obj in objects])
+
+    def _parse_show_scope(self, kind: str, parser: StatementParser, session: Session):
+        if kind in ACCOUNT_KINDS:
+            parser.accept_keyword("IN", "ACCOUNT")
+            return None, None
+
+        if parser.accept_keyword("IN"):
+            if parser.accept_keyword("ACCOUNT"):
+                return None, None
+
+            if parser.accept_keyword("DATABASE"):
+                name = parser.parse_identifier() if not parser.at_end() else session.database
+                self._check_parent_exists(SCHEMA, name, None)
+                return name, None
+
+            parser.accept_keyword("SCHEMA")
+            parts = parser.parse_name() if not parser.at_end() else [session.schema]
+            (database, _, schema) = self._resolve(SCHEMA, parts, session)
+            self._check_parent_exists(TABLE, database, schema)
+            return database, schema
+
+        if session.database is None:
+            return None, None
+
+        return session.database, (session.schema if kind in SCHEMA_KINDS else None)
+
+    def _describe(self, parser: StatementParser, session: Session) -> Result:
+        kind = self._parse_kind(parser)
+        key = (kind, *self._resolve(kind, parser.parse_name(), session))
+        parser.expect_end()
+
+        obj = self.objects.get(key)
+
+        if obj is None:
+            raise _does_not_exist(kind, key)
+
+        if kind == TABLE:
+            return Result(
+                ["name", "type", "kind", "null?", "default", "primary key", "unique key",
+                 "comment"],
+                [(
+                    column["name"],
+                    column["type"],
+                    "COLUMN",
+                    "N" if column["not_null"] else "Y",
+                    column["default"],
+                    "Y" if column["primary_key"] else "N",
+                    "Y" if column["unique"] else "N",
+                    column["comment"],
+                ) for column in obj.columns]
+            )
+
+        return Result(
+            ["property", "property_type", "property_value", "property_default"],
+            [(name, _property_type(value), _format_value(value), "") for (name, value) in
+             sorted(obj.properties.items())]
+        )
+
+    # OTHER STATEMENTS
+
+    def _use(self, parser: StatementParser, session: Session) -> Result:
+        if parser.accept_keyword("WAREHOUSE"):
+            key = (WAREHOUSE, *self._resolve(WAREHOUSE, parser.parse_name(), session))
+
+            if key not in self.objects:
+                raise _does_not_exist(WAREHOUSE, key)
+        elif parser.accept_keyword("ROLE"):
+            parser.parse_name()
+        elif parser.accept_keyword("SCHEMA"):
+            (database, _, schema) = self._resolve(SCHEMA, parser.parse_name(), session)
+            self._check_parent_exists(TABLE, database, schema)
+            (session.database, session.schema) = (database, schema)
+        else:
+            parser.accept_keyword("DATABASE")
+            (_, _, database) = self._resolve(DATABASE, parser.parse_name(), session)
+            self._check_parent_exists(SCHEMA, database, None)
+            (session.database, session.schema) = (database, DEFAULT_SCHEMA)
+
+        parser.expect_end()
+
+        return _status("Statement executed successfully.")
+
+    def _select(self, parser: StatementParser) -> Result:
+        values = [parser.parse_value()]
+
+        while parser.accept_punct(","):
+            values.append(parser.parse_value())
+
+        parser.expect_end()
+
+        return Result([str(value) for value in values], [tuple(values)])
+
+    # HELPERS
+
+    def _parse_modifier(self, parser: StatementParser) -> Optional[str]:
+        for (keyword, modifier) in _modifiers.items():
+            if parser.accept_keyword(keyword):
+                return modifier
+
+        return None
+
+    def _parse_kind(self, parser: StatementParser, keywords=None) -> str:
+        for (words, kind) in keywords or _kind_keywords:
+            if parser.accept_keyword(*words):
+                return kind
+
+        found = parser.peek().value if parser.peek() is not None else "end of statement"
+        raise parser.error(f"unsupported object type '{found}'")
+
+    def _resolve(self, kind: str, parts: List[Optional[str]], session: Session):
+        """
+        Resolves a possibly qualified name against the session into a `(database, schema, name)`
+        tuple.
+        """
+        if kind in ACCOUNT_KINDS:
+            if len(parts) != 1:
+                raise ProgrammingError(f"SQL compilation error: invalid {kind.lower()} name "
+                                       f"'{'.'.join(part or '' for part in parts)}'", SYNTAX_ERROR)
+
+            return None, None, parts[0]
+
+        if kind == SCHEMA:
+            if len(parts) == 1:
+                return self._current_database(kind, session), None, parts[0]
+
+            if len(parts) == 2 and parts[0] is not None:
+                return parts[0], None, parts[1]
+        else:
+            if len(parts) == 1:
+                schema = session.schema or DEFAULT_SCHEMA
+                return self._current_database(kind, session), schema, parts[0]
+
+            if len(parts) == 2 and parts[0] is not None:
+                return self._current_database(kind, session), parts[0], parts[1]
+
+            if len(parts) == 3 and parts[0] is not None:
+                return parts[0], parts[1] or DEFAULT_SCHEMA, parts[2]
+
+        raise ProgrammingError(f"SQL compilation error: invalid {kind.lower()} name "
+                               f"'{'.'.join(part or '' for part in parts)}'", SYNTAX_ERROR)
+
+    def _current_database(self, kind: str, session: Session) -> str:
+        if session.database is None:
+            raise ProgrammingError(f"Cannot perform operation on {kind}. This session does not "
+                                   f"have a current database. Call 'USE DATABASE', or use a "
+                                   f"qualified name.", NO_CURRENT_DATABASE)
+
+        return session.database
+
+    def _validate_properties(self, kind: str, properties: dict):
+        allowed = PROPERTIES[kind] | ({"SHARE"} if kind == DATABASE else set())
+
+        for name in properties:
+            if name not in allowed:
+                raise ProgrammingError(f"SQL compilation error: invalid property '{name}' for "
+                                       f"'{kind.replace(' ', '_')}'", INVALID_PROPERTY)
+
+    def _check_parent_exists(self, kind: str, database: Optional[str], schema: Optional[str]):
+        if kind in ACCOUNT_KINDS:
+            return
+
+        if (DATABASE, None, None, database) not in self.objects:
+            raise ProgrammingError(f"SQL compilation error: Database '{database}' does not exist "
+                                   f"or not authorized.", DOES_NOT_EXIST)
+
+        if kind in SCHEMA_KINDS and (SCHEMA, database, None, schema) not in self.objects:
+            raise ProgrammingError(f"SQL compilation error: Schema '{database}.{schema}' does not "
+                                   f"exist or not authorized.", DOES_NOT_EXIST)
+
+    def _check_references_exist(self, obj: CatalogObject, properties: dict, session: Session):
+        """
+        Checks that integrations, file formats, tables and stages referenced by a new or altered
+        object exist.
+        """
+        references = []
+
+        if obj.kind == STAGE:
+            if properties.get("STORAGE_INTEGRATION"):
+                references.append((STORAGE_INTEGRATION,
+                                   parse_identifier_text(properties["STORAGE_INTEGRATION"])))
+
+            file_format = properties.get("FILE_FORMAT")
+
+            if isinstance(file_format, dict):
+                file_format = file_format.get("FORMAT_NAME")
+
+            if isinstance(file_format, str):
+                references.append((FILE_FORMAT, parse_identifier_text(file_format)))
+
+        if obj.kind == PIPE and obj.definition is not None:
+            references.extend(_parse_copy_references(obj.definition))
+
+        for (kind, parts) in references:
+            key = (kind, *self._resolve(kind, parts, session))
+
+            if key not in self.objects:
+                raise _does_not_exist(kind, key)
+
+    def _children(self, obj: CatalogObject) -> List[CatalogObject]:
+        if obj.kind == DATABASE:
+            return [child for child in self.objects.values()
+                    if child.database == obj.name and child is not obj]
+
+        if obj.kind == SCHEMA:
+            return [child for child in self.objects.values()
+                    if child.database == obj.database and child.schema == obj.name]
+
+        return []
+
+    def _remove(self, obj: CatalogObject):
+        for child in self._children(obj):
+            del self.objects[child.key]
+
+        del self.objects[obj.key]
+
+
+def _status(message: str) -> Result:
+    return Result(["status"], [(message,)])
+
+
+def _does_not_exist(kind: str, key: tuple) -> ProgrammingError:
+    name = ".".join(part for part in key[1:] if part is not None)
+    return ProgrammingError(f"SQL compilation error: {kind.capitalize()} '{name}' does not exist "
+                            f"or not authorized.", DOES_NOT_EXIST)
+
+
+def _parse_text_until(parser: StatementParser, stop_keywords) -> str:
+    """
+    Returns the text up to the next top-level comma, unbalanced closing parenthesis or one of the
+    given keywords.
+    """
+    start = parser.peek().start if parser.peek() is not None else len(parser.text)
+    end = start
+    depth = 0
+
+    while not parser.at_end():
+        token = parser.peek()
+
+        if token.kind == "punct" and token.value == "(":
+            depth += 1
+        elif token.kind == "punct" and token.value == ")":
+            if depth == 0:
+                break
+
+            depth -= 1
+        elif depth == 0 and token.kind == "punct" and token.value == ",":
+            break
+        elif depth == 0 and any(parser.is_keyword(keyword) for keyword in stop_keywords):
+            break
+
+        end = token.end
+        parser.next()
+
+    return parser.text[start:end].strip()
+
+
+def _parse_copy_references(definition: str) -> List[Tuple[str, List[str]]]:
+    """
+    Returns the table and stage referenced by a pipe's `COPY INTO <table> FROM @<stage>` statement.
+    """
+    parser = StatementParser(definition)
+    parser.expect_keyword("COPY", "INTO")
+    references = [(TABLE, parser.parse_name())]
+
+    while not parser.at_end():
+        if parser.accept_punct("@"):
+            references.append((STAGE, parser.parse_name()))
+            break
+
+        parser.next()
+
+    return references
+
+
+def _is_sequence(default: Optional[str]) -> bool:
+    return default is not None and _sequence_regex.match(default) is not None
+
+
+def _is_type_change_allowed(old_type: str, new_type: str) -> bool:
+    """
+    Snowflake only allows a column's type to be widened: a longer text type, or a number with more
+    precision and the same scale.
+    """
+    if old_type == new_type:
+        return True
+
+    old_match = _type_regex.match(old_type)
+    new_match = _type_regex.match(new_type)
+
+    if old_match is None or new_match is None:
+        return False
+
+    (old_base, old_length, old_scale) = old_match.groups()
+    (new_base, new_length, new_scale) = new_match.groups()
+
+    if old_base in _text_types and new_base in _text_types:
+        return new_length is None \
+            or (old_length is not None and int(new_length) >= int(old_length))
+
+    if old_base in _number_types and new_base in _number_types:
+        return (old_scale or "0") == (new_scale or "0") \
+            and int(new_length or 38) >= int(old_length or 38)
+
+    return False
+
+
+def _like(name: str, pattern: str) -> bool:
+    return fnmatch.fnmatchcase(name.upper(), pattern.upper().replace("%", "*").replace("_", "?"))
+
+
+def _format_value(value) -> str:
+    if value is None:
+        return ""
+    elif isinstance(value, bool):
+        return "true" if value else "false"
+    elif isinstance(value, list):
+        return ",".join(_format_value(item) for item in value)
+    elif isinstance(value, dict):
+        return json.dumps({key: _format_value(item) for (key, item) in value.items()})
+    else:
+        return str(value)
+
+
+def _property_type(value) -> str:
+    if isinstance(value, bool):
+        return "Boolean"
+    elif isinstance(value, int):
+        return "Integer"
+    elif isinstance(value, list):
+        return "List"
+    elif isinstance(value, dict):
+        return "Object"
+    else:
+        return "String"
+
+
+def _retention_time(obj: CatalogObject):
+    return obj.properties.get("DATA_RETENTION_TIME_IN_DAYS", 1)
+
+
+_show_columns = {
+    DATABASE: [
+        ("created_on", lambda obj: obj.created_on),
+        ("name", lambda obj: obj.name),
+        ("origin", lambda obj: obj.properties.get("SHARE", "")),
+        ("comment", lambda obj: obj.properties.get("COMMENT", "")),
+        ("options", lambda obj: obj.modifier or ""),
+        ("retention_time", _retention_time),
+    ],
+    SCHEMA: [
+        ("created_on", lambda obj: obj.created_on),
+        ("name", lambda obj: obj.name),
+        ("database_name", lambda obj: obj.database),
+        ("comment", lambda obj: obj.properties.get("COMMENT", "")),
+        ("options", lambda obj: obj.modifier or ""),
+        ("retention_time", _retention_time),
+    ],
+    TABLE: [
+        ("created_on", lambda obj: obj.created_on),
+        ("name", lambda obj: obj.name),
+        ("database_name", lambda obj: obj.database),
+        ("schema_name", lambda obj: obj.schema),
+        ("kind", lambda obj: obj.modifier or "TABLE"),
+        ("comment", lambda obj: obj.properties.get("COMMENT", "")),
+        ("cluster_by",
+         lambda obj: f"LINEAR({','.join(obj.cluster_by)})" if obj.cluster_by else ""),
+        ("rows", lambda obj: 0),
+        ("retention_time", _retention_time),
+    ],
+    STAGE: [
+        ("created_on", lambda obj: obj.created_on),
+        ("name", lambda obj: obj.name),
+        ("database_name", lambda obj: obj.database),
+        ("schema_name", lambda obj: obj.schema),
+        ("url", lambda obj: obj.properties.get("URL", "")),
+        ("has_credentials", lambda obj: "Y" if obj.properties.get("CREDENTIALS") else "N"),
+        ("has_encryption_key", lambda obj: "Y" if obj.properties.get("ENCRYPTION") else "N"),
+        ("comment", lambda obj: obj.properties.get("COMMENT", "")),
+        ("storage_integration", lambda obj: obj.properties.get("STORAGE_INTEGRATION")),
+        ("type", lambda obj: "EXTERNAL" if obj.properties.get("URL") else "INTERNAL"),
+    ],
+    PIPE: [
+        ("created_on", lambda obj: obj.created_on),
+        ("name", lambda obj: obj.name),
+        ("database_name", lambda obj: obj.database),
+        ("schema_name", lambda obj: obj.schema),
+        ("definition", lambda obj: obj.definition),
+        ("notification_channel", lambda obj: obj.properties.get("AWS_SNS_TOPIC")),
+        ("comment", lambda obj: obj.properties.get("COMMENT", "")),
+        ("integration", lambda obj: obj.properties.get("INTEGRATION")),
+    ],
+    FILE_FORMAT: [
+        ("created_on", lambda obj: obj.created_on),
+        ("name", lambda obj: obj.name),
+        ("database_name", lambda obj: obj.database),
+        ("schema_name", lambda obj: obj.schema),
+        ("type", lambda obj: obj.properties.get("TYPE", "CSV")),
+        ("comment", lambda obj: obj.properties.get("COMMENT", "")),
+        ("format_options",
+         lambda obj: _format_value({key: value for (key, value) in obj.properties.items()
+                                    if key not in ("TYPE", "COMMENT")})),
+    ],
+    STORAGE_INTEGRATION: [
+        ("name", lambda obj: obj.name),
+        ("type", lambda obj: obj.properties.get("TYPE", "EXTERNAL_STAGE")),
+        ("category", lambda obj: "STORAGE"),
+        ("enabled", lambda obj: obj.properties.get("ENABLED", False)),
+        ("comment", lambda obj: obj.properties.get("COMMENT")),
+        ("created_on", lambda obj: obj.created_on),
+    ],
+    WAREHOUSE: [
+        ("name", lambda obj: obj.name),
+        ("state", lambda obj: obj.state),
+        ("type", lambda obj: obj.properties.get("WAREHOUSE_TYPE", "STANDARD")),
+        ("size", lambda obj: obj.properties.get("WAREHOUSE_SIZE", "XSMALL")),
+        ("min_cluster_count", lambda obj: obj.properties.get("MIN_CLUSTER_COUNT", 1)),
+        ("max_cluster_count", lambda obj: obj.properties.get("MAX_CLUSTER_COUNT", 1)),
+        ("auto_suspend", lambda obj: obj.properties.get("AUTO_SUSPEND", 600)),
+        ("auto_resume", lambda obj: _format_value(obj.properties.get("AUTO_RESUME", True))),
+        ("comment", lambda obj: obj.properties.get("COMMENT", "")),
+        ("scaling_policy", lambda obj: obj.properties.get("SCALING_POLICY", "STANDARD")),
+        ("created_on", lambda obj: obj.created_on),
+    ],
+}
+"""
+The columns returned by `SHOW` for each kind of object, with a function which reads each column
+from an object.
+"""
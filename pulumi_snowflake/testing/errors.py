@@ -0,0 +1,25 @@
+"""
+Error codes raised by the fake catalog, matching the codes Snowflake returns for the same
+conditions.
+"""
+
+STATEMENT_COUNT_MISMATCH = 8
+SYNTAX_ERROR = 1003
+ALREADY_EXISTS = 2002
+DOES_NOT_EXIST = 2003
+INVALID_PROPERTY = 2029
+NO_CURRENT_DATABASE = 90105
+
+
+class ProgrammingError(Exception):
+    """
+    Raised for statements which Snowflake would reject.  The class name and attributes match
+    `snowflake.connector.errors.ProgrammingError`, so the retry policy treats these errors as
+    fatal, just as it would for a real connection.
+    """
+
+    def __init__(self, msg: str, errno: int):
+        super().__init__(f"{errno:06d}: {msg}")
+        self.msg = msg
+        self.errno = errno
+        self.sfqid = None
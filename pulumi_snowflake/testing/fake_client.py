@@ -0,0 +1,166 @@
+import time
+import uuid
+from typing import Callable, List, Optional, Union
+
+from .catalog import Catalog, Result, Session
+from .errors import ProgrammingError, STATEMENT_COUNT_MISMATCH, SYNTAX_ERROR
+from .sql_parser import split_statements
+
+
+class FakeClient:
+    """
+    Stands in for `Client` in tests and benchmarks.  Connections returned by `get` execute
+    statements against an in-memory `Catalog` rather than a Snowflake account, so dynamic providers
+    can be run end-to-end with no network.  Clients which share a catalog see the same objects.
+
+    `latency` is the number of seconds each statement takes, or a function which returns it for a
+    statement's text, so that benchmarks can model a slow metadata service.  Multi-statement
+    requests pay the latency of each statement.
+    """
+
+    def __init__(self,
+                 catalog: Optional[Catalog] = None,
+                 latency: Union[float, Callable[[str], float]] = 0.0,
+                 database: Optional[str] = None,
+                 schema: Optional[str] = None):
+        """
+        :param catalog: The catalog to execute statements against, by default a new empty catalog
+        :param latency: Seconds per statement, or a function of the statement text returning
+            seconds
+        :param database: The current database of new connections
+        :param schema: The current schema of new connections, `PUBLIC` if only a database is given
+        """
+        self.catalog = catalog if catalog is not None else Catalog()
+        self.latency = latency
+        self.database = database
+        self.schema = schema
+        self.connections_opened = 0
+
+    def get(self) -> 'FakeConnection':
+        self.connections_opened += 1
+        return FakeConnection(self)
+
+    def get_latency(self, statement: str) -> float:
+        return self.latency(statement) if callable(self.latency) else self.latency
+
+
+class FakeConnection:
+    """
+    A connection with its own current database and schema.
+    """
+
+    def __init__(self, client: FakeClient):
+        self.client = client
+        self.session = Session(client.database, client.schema)
+        self._closed = False
+
+    def cursor(self) -> 'FakeCursor':
+        if self._closed:
+            raise ProgrammingError("Connection is closed", SYNTAX_ERROR)
+
+        return FakeCursor(self)
+
+    def close(self):
+        self._closed = True
+
+    def is_closed(self) -> bool:
+        return self._closed
+
+
+class FakeCursor:
+    """
+    Implements the parts of the connector's cursor used by the dynamic providers: `execute`
+    (including multi-statement requests), `sfqid`, `rowcount`, `description`, `nextset` and the
+    fetch methods.
+    """
+
+    def __init__(self, connection: FakeConnection):
+        self.connection = connection
+        self._results: List[tuple] = []
+        self._result_index = 0
+        self._row_index = 0
+
+    def execute(self, command: str, _statement_params: Optional[dict] = None,
+                **kwargs) -> 'FakeCursor':
+        """
+        Executes one statement, or as many as the `MULTI_STATEMENT_COUNT` statement parameter
+        allows (zero meaning any number).  As in Snowflake, statements before a failing one in a
+        multi-statement request stay applied.
+        """
+        statements = split_statements(command)
+        expected_count = (_statement_params or {}).get("MULTI_STATEMENT_COUNT", 1)
+
+        if not statements:
+            raise ProgrammingError("SQL compilation error: Empty SQL statement.", SYNTAX_ERROR)
+
+        if expected_count != 0 and len(statements) != expected_count:
+            raise ProgrammingError(f"Actual statement count {len(statements)} did not match the "
+                                   f"desired statement count {expected_count}.",
+                                   STATEMENT_COUNT_MISMATCH)
+
+        client = self.connection.client
+        results = []
+
+        for statement in statements:
+            latency = client.get_latency(statement)
+
+            if latency > 0:
+                time.sleep(latency)
+
+            result = client.catalog.execute(statement, self.connection.session)
+            results.append((str(uuid.uuid4()), result))
+
+        self._results = results
+        self._select_result(0)
+
+        return self
+
+    @property
+    def sfqid(self) -> Optional[str]:
+        return self._results[self._result_index][0] if self._results else None
+
+    @property
+    def rowcount(self) -> Optional[int]:
+        return len(self._result.rows) if self._results else None
+
+    @property
+    def description(self):
+        if not self._results:
+            return None
+
+        return [(name, None, None, None, None, None, True) for name in self._result.columns]
+
+    def nextset(self) -> Optional['FakeCursor']:
+        if self._result_index + 1 >= len(self._results):
+            return None
+
+        self._select_result(self._result_index + 1)
+        return self
+
+    def fetchone(self) -> Optional[tuple]:
+        rows = self.fetchmany(1)
+        return rows[0] if rows else None
+
+    def fetchmany(self, size: int = 1) -> List[tuple]:
+        rows = self._result.rows[self._row_index:self._row_index + size]
+        self._row_index += len(rows)
+        return rows
+
+    def fetchall(self) -> List[tuple]:
+        rows = self._result.rows[self._row_index:]
+        self._row_index = len(self._result.rows)
+        return rows
+
+    def close(self):
+        self._results = []
+
+    def __iter__(self):
+        return iter(self.fetchall())
+
+    @property
+    def _result(self) -> Result:
+        return self._results[self._result_index][1]
+
+    def _select_result(self, index: int):
+        self._result_index = index
+        self._row_index = 0
@@ -0,0 +1,442 @@
+import gzip
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional, Union
+from urllib.parse import parse_qs, urlparse
+
+from .catalog import Catalog, Result, Session
+from .errors import ProgrammingError, STATEMENT_COUNT_MISMATCH, SYNTAX_ERROR
+from .sql_parser import split_statements
+
+SESSION_EXPIRED_CODE = "390112"
+LOGIN_FAILED_CODE = "390100"
+QUERY_IN_PROGRESS_ASYNC_CODE = "333334"
+
+_token_regex = re.compile(r'Snowflake Token="([^"]*)"')
+_result_scan_regex = re.compile(r"select \* from table\(result_scan\('([^']+)'\)\)", re.IGNORECASE)
+
+
+class LocalSnowflakeServer:
+    """
+    A local HTTP server which emulates the login, query-request and query-result endpoints of
+    Snowflake's REST API well enough for `snowflake.connector` to connect to it, so that the real
+    connector path of `Client` (pooling, retries, session token caching and asynchronous execution)
+    can be load tested on localhost.  Statements are executed against a `Catalog`, as with
+    `FakeClient`.
+
+    Point a `Provider` at the server with `host`, `port` and `protocol` set from
+    `connection_parameters`.  Latency can be added to logins and statements, and a fraction of
+    requests can fail with HTTP 503 (which the connector retries) or be throttled with HTTP 429.
+    """
+
+    def __init__(self,
+                 catalog: Optional[Catalog] = None,
+                 latency: Union[float, Callable[[str], float]] = 0.0,
+                 login_latency: float = 0.0,
+                 error_rate: float = 0.0,
+                 throttle_rate: float = 0.0,
+                 session_validity: int = 3600,
+                 username: Optional[str] = None,
+                 password: Optional[str] = None):
+        """
+        :param catalog: The catalog to execute statements against, by default a new empty catalog
+        :param latency: Seconds per statement, or a function of the statement text returning
+            seconds
+        :param login_latency: Seconds taken by each login, standing in for the TLS handshake and
+            authentication
+        :param error_rate: The fraction of requests which fail with HTTP 503 Service Unavailable
+        :param throttle_rate: The fraction of requests which fail with HTTP 429 Too Many Requests
+        :param session_validity: Seconds after which session tokens expire and must be renewed
+        :param username: If given, logins must use this user name and `password`
+        :param password: The password required when `username` is given
+        """
+        self.catalog = catalog if catalog is not None else Catalog()
+        self.latency = latency
+        self.login_latency = login_latency
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.session_validity = session_validity
+        self.username = username
+        self.password = password
+
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, tuple] = {}
+        self._master_tokens: Dict[str, Session] = {}
+        self._queries: Dict[str, dict] = {}
+        self._random = random.Random()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+        self.logins = 0
+        self.renewals = 0
+        self.queries = 0
+        self.failed_requests = 0
+        self.throttled_requests = 0
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    @property
+    def connection_parameters(self) -> dict:
+        """
+        Parameters for `snowflake.connector.connect` (or the matching `Provider` arguments) which
+        connect to this server.
+        """
+        return {"host": "127.0.0.1", "port": self.port, "protocol": "http"}
+
+    def start(self) -> 'LocalSnowflakeServer':
+        server = self
+
+        class Handler(_RequestHandler):
+            snowflake_server = server
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        name="local-snowflake-server", daemon=True)
+        self._thread.start()
+
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def expire_sessions(self):
+        """
+        Expires every session token, so the next request of each connection must renew its session.
+        """
+        with self._lock:
+            self._sessions.clear()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    # ENDPOINTS
+
+    def login(self, query: dict, body: dict) -> dict:
+        data = body.get("data", {})
+
+        if self.login_latency > 0:
+            time.sleep(self.login_latency)
+
+        credentials = (data.get("LOGIN_NAME"), data.get("PASSWORD"))
+
+        if self.username is not None and credentials != (self.username, self.password):
+            return _failure(LOGIN_FAILED_CODE, "Incorrect username or password was specified.")
+
+        session = Session(query.get("databaseName"), query.get("schemaName"))
+        (token, master_token) = (uuid.uuid4().hex, uuid.uuid4().hex)
+
+        with self._lock:
+            self.logins += 1
+            self._sessions[token] = (session, time.monotonic() + self.session_validity)
+            self._master_tokens[master_token] = session
+
+        return _success({
+            "token": token,
+            "masterToken": master_token,
+            "validityInSeconds": self.session_validity,
+            "masterValidityInSeconds": self.session_validity * 4,
+            "sessionId": random.randint(1, 2 ** 40),
+            "parameters": [],
+            "sessionInfo": {
+                "databaseName": session.database,
+                "schemaName": session.schema,
+                "warehouseName": None,
+                "roleName": query.get("roleName"),
+            },
+        })
+
+    def renew_session(self, master_token: str) -> dict:
+        with self._lock:
+            session = self._master_tokens.get(master_token)
+
+            if session is None:
+                return _failure(SESSION_EXPIRED_CODE, "Session no longer exists.")
+
+            token = uuid.uuid4().hex
+            self._sessions[token] = (session, time.monotonic() + self.session_validity)
+            self.renewals += 1
+
+        return _success({"sessionToken": token, "validityInSeconds": self.session_validity,
+                         "masterToken": master_token})
+
+    def close_session(self, token: str) -> dict:
+        with self._lock:
+            self._sessions.pop(token, None)
+
+        return _success(None)
+
+    def query(self, token: str, body: dict) -> dict:
+        session = self._get_session(token)
+
+        if session is None:
+            return _failure(SESSION_EXPIRED_CODE, "Session token expired.")
+
+        query_id = str(uuid.uuid4())
+        sql_text = body.get("sqlText", "")
+        result_scan = _result_scan_regex.fullmatch(sql_text.strip())
+
+        if result_scan is not None:
+            # The connector fetches the results of an asynchronous query by scanning them with a
+            # new query
+            return self._scan_result(query_id, token, result_scan.group(1))
+        expected_count = int((body.get("parameters") or {}).get("MULTI_STATEMENT_COUNT", 1))
+
+        with self._lock:
+            self.queries += 1
+            self._queries[query_id] = {"status": "RUNNING", "response": None}
+
+        if body.get("asyncExec"):
+            threading.Thread(target=self._run_query,
+                             args=(query_id, session, sql_text, expected_count),
+                             daemon=True).start()
+
+            return {"success": True, "code": QUERY_IN_PROGRESS_ASYNC_CODE,
+                    "message": "Query execution in progress",
+                    "data": {"queryId": query_id, "getResultUrl": f"/queries/{query_id}/result"}}
+
+        return self._run_query(query_id, session, sql_text, expected_count)
+
+    def query_status(self, token: str, query_id: str) -> dict:
+        if self._get_session(token) is None:
+            return _failure(SESSION_EXPIRED_CODE, "Session token expired.")
+
+        with self._lock:
+            query = self._queries.get(query_id)
+
+        if query is None:
+            return _success({"queries": []})
+
+        status = {"id": query_id, "status": query["status"]}
+        response = query["response"]
+
+        if query["status"] == "FAILED_WITH_ERROR":
+            status["errorCode"] = response["code"]
+            status["errorMessage"] = response["message"]
+        elif query["status"] == "SUCCESS":
+            status["stats"] = {"producedRows": response["data"]["total"]}
+
+        return _success({"queries": [status]})
+
+    def query_result(self, token: str, query_id: str) -> dict:
+        if self._get_session(token) is None:
+            return _failure(SESSION_EXPIRED_CODE, "Session token expired.")
+
+        with self._lock:
+            query = self._queries.get(query_id)
+
+        if query is None:
+            return _failure(str(SYNTAX_ERROR).zfill(6), f"Query {query_id} does not exist.")
+
+        while query["response"] is None:
+            time.sleep(0.005)
+
+        return query["response"]
+
+    def _scan_result(self, query_id: str, token: str, scanned_query_id: str) -> dict:
+        response = self.query_result(token, scanned_query_id)
+
+        if not response["success"]:
+            return response
+
+        return _success(dict(response["data"], queryId=query_id))
+
+    def inject_failure(self) -> Optional[int]:
+        """
+        Returns the HTTP status of an injected failure for the next request, if any.
+        """
+        roll = self._random.random()
+
+        with self._lock:
+            if roll < self.throttle_rate:
+                self.throttled_requests += 1
+                return 429
+
+            if roll < self.throttle_rate + self.error_rate:
+                self.failed_requests += 1
+                return 503
+
+        return None
+
+    # HELPERS
+
+    def _get_session(self, token: str) -> Optional[Session]:
+        with self._lock:
+            entry = self._sessions.get(token)
+
+        if entry is None or time.monotonic() >= entry[1]:
+            return None
+
+        return entry[0]
+
+    def _run_query(self, query_id: str, session: Session, sql_text: str,
+                   expected_count: int) -> dict:
+        try:
+            statements = split_statements(sql_text)
+
+            if expected_count != 0 and len(statements) != expected_count:
+                raise ProgrammingError(f"Actual statement count {len(statements)} did not match "
+                                       f"the desired statement count {expected_count}.",
+                                       STATEMENT_COUNT_MISMATCH)
+
+            if len(statements) == 1:
+                response = _result_response(query_id, self._execute(statements[0], session))
+            else:
+                child_ids = []
+
+                for statement in statements:
+                    child_id = str(uuid.uuid4())
+                    child_response = _result_response(child_id, self._execute(statement, session))
+
+                    with self._lock:
+                        self._queries[child_id] = {"status": "SUCCESS", "response": child_response}
+
+                    child_ids.append(child_id)
+
+                result = Result(["multiple statement execution"],
+                                [("Multiple statements executed successfully.",)])
+                response = _result_response(query_id, result)
+                response["data"]["resultIds"] = ",".join(child_ids)
+
+            status = "SUCCESS"
+        except ProgrammingError as error:
+            response = _failure(str(error.errno).zfill(6), error.msg, query_id)
+            status = "FAILED_WITH_ERROR"
+
+        with self._lock:
+            self._queries[query_id] = {"status": status, "response": response}
+
+        return response
+
+    def _execute(self, statement: str, session: Session) -> Result:
+        latency = self.latency(statement) if callable(self.latency) else self.latency
+
+        if latency > 0:
+            time.sleep(latency)
+
+        return self.catalog.execute(statement, session)
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    snowflake_server: LocalSnowflakeServer
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self._handle()
+
+    def do_GET(self):
+        self._handle()
+
+    def _handle(self):
+        server = self.snowflake_server
+        url = urlparse(self.path)
+        query = {key: values[0] for (key, values) in parse_qs(url.query).items()}
+        body = self._read_body()
+
+        failure_status = server.inject_failure()
+
+        if failure_status is not None:
+            return self._send(failure_status, {"success": False, "message": "Injected failure"})
+
+        token = self._get_token()
+
+        if url.path == "/session/v1/login-request":
+            response = server.login(query, body)
+        elif url.path == "/session/token-request":
+            response = server.renew_session(token)
+        elif url.path == "/session" and query.get("delete") == "true":
+            response = server.close_session(token)
+        elif url.path == "/queries/v1/query-request":
+            response = server.query(token, body)
+        elif url.path.startswith("/monitoring/queries/"):
+            response = server.query_status(token, url.path.rsplit("/", 1)[1])
+        elif url.path.startswith("/queries/") and url.path.endswith("/result"):
+            response = server.query_result(token, url.path.split("/")[2])
+        else:
+            # Heartbeats, telemetry and anything else the connector sends are acknowledged
+            response = _success(None)
+
+        self._send(200, response)
+
+    def _read_body(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+
+        if length == 0:
+            return {}
+
+        data = self.rfile.read(length)
+
+        if self.headers.get("Content-Encoding") == "gzip":
+            data = gzip.decompress(data)
+
+        return json.loads(data.decode("utf-8"))
+
+    def _get_token(self) -> Optional[str]:
+        match = _token_regex.search(self.headers.get("Authorization") or "")
+        return match.group(1) if match else None
+
+    def _send(self, status: int, response: dict):
+        data = json.dumps(response, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _success(data) -> dict:
+    return {"success": True, "code": None, "message": None, "data": data}
+
+
+def _failure(code: str, message: str, query_id: Optional[str] = None) -> dict:
+    return {
+        "success": False,
+        "code": code,
+        "message": message,
+        "data": {"queryId": query_id, "errorCode": code, "sqlState": "42000",
+                 "internalError": False},
+    }
+
+
+def _result_response(query_id: str, result: Result) -> dict:
+    """
+    Encodes a result set in the JSON result format, with every column typed as text.
+    """
+    return _success({
+        "queryId": query_id,
+        "rowtype": [{"name": column, "type": "text", "length": 16777216, "byteLength": 16777216,
+                     "nullable": True, "precision": None, "scale": None, "collation": None,
+                     "database": "", "schema": "", "table": ""}
+                    for column in result.columns],
+        "rowset": [[None if value is None else _format_value(value) for value in row]
+                   for row in result.rows],
+        "total": len(result.rows),
+        "returned": len(result.rows),
+        "queryResultFormat": "json",
+        "parameters": [],
+        "sendResultTime": int(time.time() * 1000),
+    })
+
+
+def _format_value(value) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+
+    return str(value)
@@ -0,0 +1,315 @@
+import re
+from typing import Any, List, NamedTuple, Optional
+
+from .errors import ProgrammingError, SYNTAX_ERROR
+
+"""
+This module provides a small tokenizer and parser for the subset of Snowflake SQL used by the
+dynamic providers.  It understands just enough of the grammar to drive `Catalog`: object names,
+property lists, column definitions and the raw text of clauses such as a pipe's `AS COPY INTO ...`.
+"""
+
+
+class Token(NamedTuple):
+    kind: str
+    """
+    One of `string`, `number`, `ident`, `qident` (a double quoted identifier) or `punct`.
+    """
+
+    value: str
+    """
+    The token's text, with quotes removed and escapes resolved for strings and quoted identifiers.
+    """
+
+    start: int
+    end: int
+
+
+_token_regex = re.compile(r"""
+    (?P<space>\s+|--[^\n]*)
+    | (?P<string>'(?:[^'\\]|\\.|'')*')
+    | (?P<qident>"(?:[^"]|"")*")
+    | (?P<number>\d+(?:\.\d+)?)
+    | (?P<ident>[A-Za-z_$][A-Za-z0-9_$]*)
+    | (?P<punct>\S)
+""", re.VERBOSE)
+
+_string_escape_regex = re.compile(r"\\(.)|''")
+
+
+def _unescape_string(text: str) -> str:
+    return _string_escape_regex.sub(
+        lambda match: match.group(1) if match.group(1) is not None else "'", text[1:-1])
+
+
+def tokenize(text: str) -> List[Token]:
+    tokens = []
+    position = 0
+
+    while position < len(text):
+        match = _token_regex.match(text, position)
+
+        if match is None:
+            raise ProgrammingError(f"SQL compilation error: unterminated literal at position "
+                                   f"{position}", SYNTAX_ERROR)
+
+        kind = match.lastgroup
+        value = match.group()
+
+        if kind == "string":
+            value = _unescape_string(value)
+        elif kind == "qident":
+            value = value[1:-1].replace('""', '"')
+
+        if kind != "space":
+            tokens.append(Token(kind, value, match.start(), match.end()))
+
+        position = match.end()
+
+    return tokens
+
+
+def split_statements(text: str) -> List[str]:
+    """
+    Splits the text of a multi-statement request on semicolons outside literals and parentheses.
+    Empty statements are dropped.
+    """
+    statements = []
+    depth = 0
+    start = 0
+
+    for token in tokenize(text):
+        if token.kind != "punct":
+            continue
+
+        if token.value == "(":
+            depth += 1
+        elif token.value == ")":
+            depth -= 1
+        elif token.value == ";" and depth == 0:
+            statements.append(text[start:token.start])
+            start = token.end
+
+    statements.append(text[start:])
+
+    return [statement.strip() for statement in statements if statement.strip()]
+
+
+def normalize_identifier(token: Token) -> str:
+    """
+    Unquoted identifiers are case-insensitive and stored in upper case, quoted identifiers are
+    stored as written.
+    """
+    return token.value if token.kind == "qident" else token.value.upper()
+
+
+def parse_identifier_text(text: str) -> List[str]:
+    """
+    Parses an identifier given inside a string literal, for example
+    `STORAGE_INTEGRATION = 'my_integration'`, into its normalized parts.
+    """
+    parser = StatementParser(text)
+    parts = parser.parse_name()
+    parser.expect_end()
+    return parts
+
+
+class StatementParser:
+    """
+    A cursor over the tokens of one statement.  Keyword matching is case-insensitive.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = tokenize(text)
+        self.position = 0
+
+    def peek(self, offset: int = 0) -> Optional[Token]:
+        index = self.position + offset
+        return self.tokens[index] if index < len(self.tokens) else None
+
+    def next(self) -> Token:
+        token = self.peek()
+
+        if token is None:
+            raise self.error("unexpected end of statement")
+
+        self.position += 1
+        return token
+
+    def at_end(self) -> bool:
+        return self.position >= len(self.tokens)
+
+    def expect_end(self):
+        if not self.at_end():
+            raise self.error(f"unexpected '{self.peek().value}'")
+
+    def is_keyword(self, *words: str) -> bool:
+        for (offset, word) in enumerate(words):
+            token = self.peek(offset)
+
+            if token is None or token.kind != "ident" or token.value.upper() != word:
+                return False
+
+        return True
+
+    def accept_keyword(self, *words: str) -> bool:
+        if self.is_keyword(*words):
+            self.position += len(words)
+            return True
+
+        return False
+
+    def expect_keyword(self, *words: str):
+        if not self.accept_keyword(*words):
+            found = self.peek().value if self.peek() is not None else "end of statement"
+            raise self.error(f"expected {' '.join(words)}, found '{found}'")
+
+    def is_punct(self, value: str) -> bool:
+        token = self.peek()
+        return token is not None and token.kind == "punct" and token.value == value
+
+    def accept_punct(self, value: str) -> bool:
+        if self.is_punct(value):
+            self.position += 1
+            return True
+
+        return False
+
+    def expect_punct(self, value: str):
+        if not self.accept_punct(value):
+            found = self.peek().value if self.peek() is not None else "end of statement"
+            raise self.error(f"expected '{value}', found '{found}'")
+
+    def parse_identifier(self) -> str:
+        token = self.next()
+
+        if token.kind not in ("ident", "qident"):
+            raise self.error(f"expected an identifier, found '{token.value}'")
+
+        return normalize_identifier(token)
+
+    def parse_name(self) -> List[str]:
+        """
+        Parses a possibly qualified object name into its parts.  An omitted schema, as in
+        `db..name`, is returned as `None`.
+        """
+        parts = [self.parse_identifier()]
+
+        while self.accept_punct("."):
+            if self.is_punct("."):
+                parts.append(None)
+                continue
+
+            parts.append(self.parse_identifier())
+
+        return parts
+
+    def parse_value(self) -> Any:
+        """
+        Parses a property value: a string, number, boolean, bare word, list of values or list of
+        `KEY = value` pairs (returned as a dict).
+        """
+        token = self.next()
+
+        if token.kind == "string":
+            return token.value
+
+        if token.kind == "number":
+            return float(token.value) if "." in token.value else int(token.value)
+
+        if token.kind == "punct" and token.value == "-" and self.peek() is not None \
+                and self.peek().kind == "number":
+            return -self.parse_value()
+
+        if token.kind == "ident" and token.value.upper() in ("TRUE", "FALSE"):
+            return token.value.upper() == "TRUE"
+
+        if token.kind == "ident" and token.value.upper() == "NULL":
+            return None
+
+        if token.kind in ("ident", "qident"):
+            self.position -= 1
+            return ".".join(part or "" for part in self.parse_name())
+
+        if token.kind == "punct" and token.value == "(":
+            return self._parse_parenthesized_value()
+
+        raise self.error(f"unexpected '{token.value}'")
+
+    def _parse_parenthesized_value(self):
+        if self.accept_punct(")"):
+            return []
+
+        first = self.peek()
+        second = self.peek(1)
+
+        if first.kind == "ident" and second is not None and second.kind == "punct" \
+                and second.value == "=":
+            options = {}
+
+            while not self.accept_punct(")"):
+                key = self.parse_identifier()
+                self.expect_punct("=")
+                options[key] = self.parse_value()
+                self.accept_punct(",")
+
+            return options
+
+        values = [self.parse_value()]
+
+        while self.accept_punct(","):
+            values.append(self.parse_value())
+
+        self.expect_punct(")")
+
+        return values
+
+    def parse_properties(self, stop_keywords=()) -> dict:
+        """
+        Parses `KEY = value` pairs, optionally separated by commas, until the end of the statement
+        or one of the given keywords.
+        """
+        properties = {}
+
+        while not self.at_end() and not any(self.is_keyword(keyword) for keyword in stop_keywords):
+            key = self.parse_identifier()
+            self.expect_punct("=")
+            properties[key] = self.parse_value()
+            self.accept_punct(",")
+
+        return properties
+
+    def parse_parenthesized_text(self) -> List[str]:
+        """
+        Parses a parenthesized, comma separated list and returns the text of each item, for example
+        the expressions of a `CLUSTER BY` clause.
+        """
+        self.expect_punct("(")
+        items = []
+        start = self.peek().start if self.peek() is not None else len(self.text)
+        depth = 0
+
+        while True:
+            token = self.next()
+
+            if token.kind == "punct" and token.value == "(":
+                depth += 1
+            elif token.kind == "punct" and token.value == ")" and depth > 0:
+                depth -= 1
+            elif token.kind == "punct" and token.value in (",", ")") and depth == 0:
+                items.append(self.text[start:token.start].strip())
+
+                if token.value == ")":
+                    return [item for item in items if item]
+
+                start = token.end
+
+    def remaining_text(self) -> str:
+        token = self.peek()
+        text = self.text[token.start:] if token is not None else ""
+        self.position = len(self.tokens)
+        return text.strip()
+
+    def error(self, message: str) -> ProgrammingError:
+        return ProgrammingError(f"SQL compilation error: syntax error, {message}", SYNTAX_ERROR)
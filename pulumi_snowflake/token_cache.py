@@ -0,0 +1,175 @@
+import base64
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from .user_cache import get_user_cache_dir
+
+
+DEFAULT_TOKEN_LIFETIME = 3600
+"""
+The number of seconds for which cached session tokens are reused, which matches Snowflake's default
+session token validity.
+"""
+
+FILE_HEADER = b"pulumi_snowflake token cache 2\n"
+"""
+Starts every token file, followed by the file's salt and the encrypted tokens.
+"""
+
+SALT_LENGTH = 16
+
+SCRYPT_PARAMETERS = {"n": 2 ** 14, "r": 8, "p": 1}
+"""
+The cost of deriving a file's encryption key, which makes guessing a password from a stolen file
+slow.  Deriving a key takes about 16 MiB of memory and tens of milliseconds, and is only done once
+per file read or write.
+"""
+
+_memory: Dict[str, Tuple[dict, float]] = {}
+_memory_lock = threading.Lock()
+
+
+class TokenCache:
+    """
+    Caches the session and master tokens of a Snowflake session so that new connections can resume
+    the session instead of logging in again.  Tokens are held in memory for the life of the dynamic
+    provider process and, if a directory is given, also written to a file so that later
+    `pulumi preview` and `pulumi up` runs can reuse them.
+
+    Files are encrypted with a key derived from the connection's secret (its private key or
+    password) and the stack name, so they can only be read by a process which already holds the
+    credentials for the same stack.  The key is derived with scrypt and a random salt stored in the
+    file, so that a password cannot be guessed quickly from a stolen file.
+    """
+
+    def __init__(self,
+                 scope: str,
+                 secret: bytes,
+                 directory: Optional[str] = None,
+                 lifetime: float = DEFAULT_TOKEN_LIFETIME):
+        """
+        :param scope: Identifies the stack and connection parameters which the tokens belong to
+        :param secret: The connection's private key or password, from which the encryption key is
+            derived
+        :param directory: The directory in which to store encrypted tokens, or `None` to only cache
+            in memory
+        :param lifetime: The number of seconds for which tokens are reused
+        """
+        self.key = hashlib.sha256(scope.encode("utf-8")).hexdigest()
+        self.directory = directory
+        self.lifetime = lifetime
+        self._key_material = secret + b"\0" + scope.encode("utf-8")
+
+    @staticmethod
+    def get_default_directory() -> str:
+        return get_user_cache_dir("tokens")
+
+    def get(self) -> Optional[dict]:
+        """
+        Returns the cached tokens as a dict with `session_token` and `master_token` keys, or `None`
+        if there are no unexpired tokens.
+        """
+        with _memory_lock:
+            entry = _memory.get(self.key)
+
+        if entry is None and self.directory is not None:
+            entry = self._read_file()
+
+            if entry is not None:
+                with _memory_lock:
+                    _memory[self.key] = entry
+
+        if entry is None:
+            return None
+
+        (tokens, expires_at) = entry
+
+        if time.time() >= expires_at:
+            self.remove()
+            return None
+
+        return tokens
+
+    def put(self, session_token: str, master_token: str):
+        entry = ({"session_token": session_token, "master_token": master_token},
+                 time.time() + self.lifetime)
+
+        with _memory_lock:
+            _memory[self.key] = entry
+
+        if self.directory is not None:
+            self._write_file(entry)
+
+    def remove(self):
+        with _memory_lock:
+            _memory.pop(self.key, None)
+
+        if self.directory is not None:
+            try:
+                os.remove(self._get_path())
+            except OSError:
+                pass
+
+    def _get_path(self):
+        return os.path.join(self.directory, f"{self.key}.token")
+
+    def _get_encryption_key(self, salt: bytes) -> bytes:
+        key = hashlib.scrypt(self._key_material, salt=salt, dklen=32, **SCRYPT_PARAMETERS)
+        return base64.urlsafe_b64encode(key)
+
+    def _read_file(self):
+        from cryptography.fernet import Fernet, InvalidToken
+
+        try:
+            with open(self._get_path(), "rb") as token_file:
+                content = token_file.read()
+        except OSError:
+            return None
+
+        # Files written by earlier releases have no header, and are ignored
+        if not content.startswith(FILE_HEADER):
+            return None
+
+        salt = content[len(FILE_HEADER):len(FILE_HEADER) + SALT_LENGTH]
+        encrypted = content[len(FILE_HEADER) + SALT_LENGTH:]
+
+        try:
+            data = Fernet(self._get_encryption_key(salt)).decrypt(encrypted)
+        except InvalidToken:
+            return None
+
+        content = json.loads(data.decode("utf-8"))
+        return content["tokens"], content["expires_at"]
+
+    def _write_file(self, entry):
+        from cryptography.fernet import Fernet
+
+        (tokens, expires_at) = entry
+        salt = os.urandom(SALT_LENGTH)
+        data = FILE_HEADER + salt + Fernet(self._get_encryption_key(salt)).encrypt(
+            json.dumps({"tokens": tokens, "expires_at": expires_at}).encode("utf-8")
+        )
+
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+
+            # Written to a temporary file and renamed so that concurrent provider processes never
+            # read a partial file
+            (handle, temporary_path) = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+
+            with os.fdopen(handle, "wb") as token_file:
+                token_file.write(data)
+
+            os.replace(temporary_path, self._get_path())
+        except OSError:
+            pass
+
+
+def clear_memory_cache():
+    with _memory_lock:
+        _memory.clear()
@@ -0,0 +1,18 @@
+import os
+import sys
+
+
+def get_user_cache_dir(*parts: str) -> str:
+    """
+    Returns a directory for pulumi_snowflake within the user's cache directory, following platform
+    conventions (`$XDG_CACHE_HOME` or `~/.cache` on Linux, `~/Library/Caches` on macOS and
+    `%LOCALAPPDATA%` on Windows).  The directory is not created.
+    """
+    if sys.platform == "win32":
+        root = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    elif sys.platform == "darwin":
+        root = os.path.expanduser("~/Library/Caches")
+    else:
+        root = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+
+    return os.path.join(root, "pulumi_snowflake", *parts)
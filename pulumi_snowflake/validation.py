@@ -1,10 +1,23 @@
+import functools
 import re
+from typing import Iterable, List
 
 
 class Validation:
 
     identifier_regex = re.compile("^[A-Za-z\\$\\_][A-Za-z0-9\\$\\_]+$")
 
+    string_regex = re.compile("^[^'\\\\]*(?:\\\\.[^'\\\\]*)*$")
+    """
+    Any characters except single quotes and backslashes, or backslash escapes, written as an
+    unrolled loop so that runs of ordinary characters are consumed at once.  `.` does not match a
+    newline, so a backslash can never escape the newline which separates the strings validated
+    together by `validate_strings`.
+    """
+
+    # Any printable character except double quote
+    enquoted_identifier_regex = re.compile("^[\x20-\x21\x23-\x7E]*$")
+
     @staticmethod
     def validate_string(string: str, allow_none: bool = True):
         """ Validates a Snowflake string.  Strings can contain any character except single quotes, although
@@ -12,26 +25,40 @@ class Validation:
         """
         if allow_none and string is None: return string
 
-        pattern = re.compile("^(?:[^'\\\\]|\\\\.)*$")
-
-        if not pattern.match(string):
+        if not Validation.string_regex.match(string):
             raise Exception(f'Invalid Snowflake string: {string}')
 
         return id
 
+    @staticmethod
+    def validate_strings(strings: Iterable[str]) -> List[str]:
+        """
+        Validates many Snowflake strings at once, with a single regular expression scan over the
+        strings joined by newlines, and returns them as a list.  Only if the scan fails are the
+        strings checked one by one, to report the first invalid string.
+        """
+        strings = list(strings)
+
+        if not Validation.string_regex.fullmatch("\n".join(strings)):
+            for string in strings:
+                Validation.validate_string(string, allow_none=False)
+
+        return strings
+
     @staticmethod
     def is_enquoted_identifier_valid(id: str):
         """
         Checks to see if the given identifier is valid even if it is enquoted in double quotes.  See
         https://docs.snowflake.net/manuals/sql-reference/identifiers-syntax.html
         """
-        pattern = re.compile("^[\x20-\x21\x23-\x7E]*$") # Any printable character except double quote
-        return pattern.match(id) is not None
+        return Validation.enquoted_identifier_regex.match(id) is not None
 
     @staticmethod
+    @functools.lru_cache(maxsize=65536)
     def enquote_identifier(id: str):
         """ Checks to see if the given identifier must be enclosed in double quotes, and if it does,
-            returns the identifier with the quotes.
+            returns the identifier with the quotes.  Results are memoized, since the same names,
+            databases and schemas are enquoted several times for every statement.
             https://docs.snowflake.net/manuals/sql-reference/identifiers-syntax.html
         """
 
@@ -43,3 +70,11 @@ class Validation:
             raise Exception(f"Invalid identifier: {id}")
         else:
             return f'"{id}"'
+
+    @staticmethod
+    def enquote_identifiers(ids: Iterable[str]) -> List[str]:
+        """
+        Enquotes each of the given identifiers, as `enquote_identifier`.
+        """
+        enquote = Validation.enquote_identifier
+        return [enquote(id) for id in ids]
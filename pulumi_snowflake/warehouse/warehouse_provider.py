@@ -2,48 +2,49 @@ from pulumi_snowflake import Client
 
 from ..baseprovider import BaseDynamicProvider
 from ..provider import Provider
+from ..baseprovider.properties import ClauseBuilder, PropertyKind, PropertySpec
+
+
+PROPERTIES = ClauseBuilder(
+    PropertySpec("warehouse_size", "WAREHOUSE_SIZE", PropertyKind.STRING),
+    PropertySpec("max_cluster_count", "MAX_CLUSTER_COUNT", PropertyKind.NUMBER),
+    PropertySpec("min_cluster_count", "MIN_CLUSTER_COUNT", PropertyKind.NUMBER),
+    PropertySpec("scaling_policy", "SCALING_POLICY", PropertyKind.STRING),
+    PropertySpec("auto_suspend", "AUTO_SUSPEND", PropertyKind.NUMBER),
+    PropertySpec("auto_resume", "AUTO_RESUME", PropertyKind.BOOL, emit_when_false=True),
+    PropertySpec("initially_suspended", "INITIALLY_SUSPENDED", PropertyKind.BOOL,
+                 emit_when_false=True),
+    PropertySpec("comment", "COMMENT", PropertyKind.STRING)
+)
+
+ALTER_PROPERTIES = ClauseBuilder(*[spec for spec in PROPERTIES.specs
+                                   if spec.name != "initially_suspended"])
+"""
+The properties which `ALTER WAREHOUSE` can set.  `INITIALLY_SUSPENDED` only applies when the
+warehouse is created, so changing it has no effect on an existing warehouse.
+"""
 
 
 class WarehouseProvider(BaseDynamicProvider):
     """
-    Dynamic provider for Snowflake Warehouse resources.
+    Dynamic provider for Snowflake Warehouse resources.  Changes to any property are applied with
+    `ALTER WAREHOUSE`, so that a resize keeps running queries and the warehouse cache.
     """
 
+    updatable_properties = frozenset(spec.name for spec in PROPERTIES.specs)
+
     def __init__(self, provider_params: Provider, connection_provider: Client):
         super().__init__(provider_params, connection_provider, resource_type="Warehouse")
 
     def generate_sql_create_statement(self, name, inputs, environment):
-        template = environment.from_string(
-"""CREATE {{ resource_type | upper }} {{ full_name }}
-{% if warehouse_size %}WAREHOUSE_SIZE = {{ warehouse_size | sql }}
-{% endif %}
-{%- if max_cluster_count %}MAX_CLUSTER_COUNT = {{ max_cluster_count | sql }}
-{% endif %}
-{%- if min_cluster_count %}MIN_CLUSTER_COUNT = {{ min_cluster_count | sql }}
-{% endif %}
-{%- if scaling_policy %}SCALING_POLICY = {{ scaling_policy | sql }}
-{% endif %}
-{%- if auto_suspend %}AUTO_SUSPEND = {{ auto_suspend | sql }}
-{% endif %}
-{%- if auto_resume is boolean %}AUTO_RESUME = {{ auto_resume | sql }}
-{% endif %}
-{%- if initially_suspended is boolean %}INITIALLY_SUSPENDED = {{ initially_suspended | sql }}
-{% endif %}
-{%- if comment %}COMMENT = {{ comment | sql }}
-{% endif %}""")
-
-        sql = template.render({
-            **inputs,
-            "full_name": self._get_full_object_name(inputs, name),
-            "resource_type": self.resource_type
-        })
+        full_name = self._get_full_object_name(inputs, name)
+        sql = f"CREATE {self.resource_type.upper()} {full_name}\n{PROPERTIES.render(inputs)}"
 
         return sql
 
     def generate_sql_drop_statement(self, name, inputs, environment):
-        template = environment.from_string("DROP {{ resource_type | upper }} {{ full_name }}")
-        sql = template.render({
-            "full_name": self._get_full_object_name(inputs, name),
-            "resource_type": self.resource_type
-        })
-        return sql
+        return self._generate_sql_drop_statement(name, inputs)
+
+    def generate_sql_update_statements(self, name, olds, news, environment):
+        full_name = self._get_full_object_name(news, name)
+        return self._generate_sql_alter_statements(full_name, ALTER_PROPERTIES, olds, news)
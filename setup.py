@@ -12,15 +12,17 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     # url="https://github.com/pypa/sampleproject",
     packages=['pulumi_snowflake'],
-    python_requires='>=3.6',
+    python_requires='>=3.7',
+    # Multi-statement requests need 2.9.0.  The token cache and asynchronous execution need later
+    # releases, which are checked when those options are used (see pulumi_snowflake/client.py)
     install_requires=[
         'pulumi>=1.0.0',
-        'snowflake-connector-python>=2.1.3',
+        'snowflake-connector-python>=2.9.0,<5',
         'Jinja2'
     ],
     tests_require=[
         'pulumi>=1.0.0',
-        'snowflake-connector-python>=2.1.3',
+        'snowflake-connector-python>=2.9.0,<5',
         'Jinja2'
     ],
     test_suite='test'
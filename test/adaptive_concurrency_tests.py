@@ -0,0 +1,179 @@
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from pulumi_snowflake import Client
+from pulumi_snowflake.baseprovider import BaseDynamicProvider
+from pulumi_snowflake.concurrency import AdaptiveConcurrencyLimiter, clear_limiters
+from pulumi_snowflake.connection_pool import close_all_pools
+
+from .providers import get_test_provider
+
+
+def knee_curve(knee, base_latency=0.1):
+    """
+    Latency which is flat up to `knee` concurrent statements and grows quadratically beyond it, as
+    when Snowflake starts queueing statements.
+    """
+    return lambda concurrency: base_latency * max(1.0, concurrency / knee) ** 2
+
+
+class AdaptiveConcurrencyLimiterTests(unittest.TestCase):
+
+    def test_when_latency_flat_then_limit_grows_to_maximum(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=16)
+
+        self.simulate(limiter, lambda concurrency: 0.1, rounds=40)
+
+        self.assertEqual(limiter.limit, 16)
+        self.assertEqual(limiter.decreases, 0)
+
+    def test_when_latency_grows_past_knee_then_limit_stays_near_knee(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=64)
+
+        limits = self.simulate(limiter, knee_curve(8), rounds=200)
+
+        # Additive increase past the knee is followed by a multiplicative decrease, so the limit
+        # saw-tooths around it
+        steady_state = limits[50:]
+        self.assertLessEqual(max(steady_state), 12)
+        self.assertGreaterEqual(min(steady_state), 5)
+        self.assertGreater(limiter.decreases, 0)
+
+    def test_when_latency_grows_past_knee_then_throughput_beats_fixed_limits(self):
+        curve = knee_curve(8)
+        limiter = AdaptiveConcurrencyLimiter(max_limit=64)
+
+        limits = self.simulate(limiter, curve, rounds=200)[50:]
+        adaptive_throughput = sum(limits) / sum(curve(limit) for limit in limits)
+
+        for fixed_limit in [1, 32, 64]:
+            self.assertGreater(adaptive_throughput, fixed_limit / curve(fixed_limit))
+
+    def test_when_metadata_service_slows_then_limit_reduced(self):
+        curves = [knee_curve(16), knee_curve(2)]
+        limiter = AdaptiveConcurrencyLimiter(max_limit=64)
+
+        self.simulate(limiter, curves[0], rounds=60)
+        limit_before = limiter.limit
+        limits_after = self.simulate(limiter, curves[1], rounds=60)
+
+        self.assertGreaterEqual(limit_before, 12)
+        self.assertLessEqual(max(limits_after[20:]), 3)
+
+    def test_when_statements_fail_at_high_concurrency_then_limit_reduced(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=64)
+
+        limits = self.simulate(limiter, lambda concurrency: 0.1, rounds=200,
+                               failures=lambda concurrency: 1 if concurrency > 6 else 0)
+
+        self.assertLessEqual(max(limits), 7)
+        self.assertGreater(limiter.decreases, 0)
+
+    def test_when_limit_reduced_then_not_below_minimum(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8, min_limit=2)
+
+        limits = self.simulate(limiter, lambda concurrency: 0.1, rounds=50,
+                               failures=lambda concurrency: concurrency)
+
+        self.assertEqual(min(limits), 2)
+
+    def test_when_max_limit_below_min_limit_then_error_raised(self):
+        self.assertRaises(Exception, AdaptiveConcurrencyLimiter, 1, 2)
+
+    def test_when_statements_run_through_execute_sql_then_concurrency_adapts_to_latency(self):
+        clear_limiters()
+        connections = FakeConnections(knee=4, base_latency=0.002)
+        provider_params = get_test_provider(pool_max_size=32, max_concurrency=32,
+                                            adaptive_concurrency=True)
+        provider = TestProvider(provider_params, Client(provider_params))
+
+        def run():
+            for index in range(20):
+                provider._execute_sql(f"CREATE TESTOBJECT test_{index}")
+
+        with patch("snowflake.connector.connect", side_effect=connections.connect):
+            threads = [threading.Thread(target=run) for _ in range(32)]
+
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+
+        limiter = provider.connection_provider.get_limiter()
+
+        self.assertEqual(connections.executed, 640)
+        self.assertLess(connections.peak_running, 32)
+        self.assertEqual(limiter.in_use, 0)
+        self.assertGreater(limiter.increases, 0)
+
+    # HELPERS
+
+    def simulate(self, limiter, latency_curve, rounds, failures=lambda concurrency: 0):
+        """
+        Runs `rounds` batches of `limit` concurrent statements, each completing with the latency
+        given by the curve for the batch's concurrency, and returns the limit in effect for each
+        batch.
+        """
+        limits = []
+
+        for _ in range(rounds):
+            concurrency = limiter.limit
+            limits.append(concurrency)
+            slots = [limiter.acquire() for _ in range(concurrency)]
+            failed = failures(concurrency)
+
+            for (index, slot) in enumerate(slots):
+                limiter._release(slot, latency_curve(concurrency), index < failed)
+
+        return limits
+
+    def tearDown(self):
+        clear_limiters()
+        close_all_pools()
+
+
+class TestProvider(BaseDynamicProvider):
+
+    def __init__(self, provider_params, connection_provider):
+        super().__init__(provider_params, connection_provider, "Test")
+
+
+class FakeConnections:
+    """
+    Creates fake connections whose statements sleep for a latency which depends on how many
+    statements are running across all connections.
+    """
+
+    def __init__(self, knee, base_latency):
+        self.latency_curve = knee_curve(knee, base_latency)
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak_running = 0
+        self.executed = 0
+
+    def connect(self, **kwargs):
+        connection = Mock()
+        connection.is_closed.return_value = False
+        connection.cursor.side_effect = lambda: self.create_cursor()
+        return connection
+
+    def create_cursor(self):
+        cursor = Mock()
+        cursor.nextset.return_value = None
+        cursor.execute.side_effect = self.execute
+        return cursor
+
+    def execute(self, statement, **kwargs):
+        with self.lock:
+            self.running += 1
+            self.peak_running = max(self.peak_running, self.running)
+            concurrency = self.running
+
+        time.sleep(self.latency_curve(concurrency))
+
+        with self.lock:
+            self.running -= 1
+            self.executed += 1
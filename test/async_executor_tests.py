@@ -0,0 +1,196 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+from pulumi_snowflake.async_executor import AsyncExecutor, AsyncExecutorConnection
+from pulumi_snowflake.connection_pool import ConnectionPool
+
+
+class FakeAsyncConnection:
+    """
+    Minimal stand-in for a connector connection whose asynchronous queries finish after a fixed
+    latency.
+    """
+
+    def __init__(self, latency=0.0, error=None):
+        self.latency = latency
+        self.error = error
+        self.statements = []
+        self.finish_times = {}
+        self.lock = threading.Lock()
+        self.closed = False
+        self.rest = Mock()
+        self.rest.request.side_effect = self.get_result
+
+    def cursor(self):
+        connection = self
+        cursor = Mock()
+
+        def execute_async(statement, **kwargs):
+            with connection.lock:
+                cursor.sfqid = f"query-{len(connection.statements)}"
+                connection.statements.append(statement)
+                connection.finish_times[cursor.sfqid] = time.monotonic() + connection.latency
+
+        cursor.execute_async.side_effect = execute_async
+        return cursor
+
+    def _get_query_status(self, query_id):
+        if self.error is not None:
+            return "FAILED_WITH_ERROR", {"data": {"queries": [{"id": query_id,
+                                                               "status": "FAILED_WITH_ERROR"}]}}
+
+        if time.monotonic() < self.finish_times.get(query_id, 0):
+            return "RUNNING", {"data": {"queries": [{"id": query_id, "status": "RUNNING"}]}}
+
+        return "SUCCESS", {"data": {"queries": [{"id": query_id, "status": "SUCCESS",
+                                                 "stats": {"producedRows": 1}}]}}
+
+    def get_result(self, url, method):
+        # Each statement of a multi-statement request has a query ID of its own
+        query_id = url.split("/")[2]
+        return {"data": {"queryId": query_id, "resultIds": f"{query_id}-a,{query_id}-b"}}
+
+    def _process_error_query_status(self, query_id, response):
+        raise self.error
+
+    @staticmethod
+    def is_an_error(status):
+        return status == "FAILED_WITH_ERROR"
+
+    @staticmethod
+    def is_still_running(status):
+        return status == "RUNNING"
+
+    def is_closed(self):
+        return False
+
+    def close(self):
+        self.closed = True
+
+
+class AsyncExecutorTests(unittest.TestCase):
+
+    def test_when_statement_executed_then_submitted_asynchronously(self):
+        connection = FakeAsyncConnection()
+        executor = self.create_executor(connection)
+
+        query_id = executor.execute("CREATE DATABASE test_db")
+        executor.close()
+
+        self.assertEqual(connection.statements, ["CREATE DATABASE test_db"])
+        self.assertEqual(query_id, "query-0")
+
+    def test_when_many_statements_submitted_then_one_session_is_used(self):
+        connection = FakeAsyncConnection(latency=0.05)
+        connect = Mock(return_value=connection)
+        executor = AsyncExecutor(ConnectionPool(connect), max_in_flight=50, poll_interval=0.01)
+
+        with ThreadPoolExecutor(max_workers=20) as threads:
+            list(threads.map(lambda i: executor.execute(f"CREATE DATABASE db_{i}"), range(20)))
+
+        executor.close()
+
+        self.assertEqual(connect.call_count, 1)
+        self.assertEqual(len(connection.statements), 20)
+        self.assertGreater(executor.peak_in_flight, 1)
+
+    def test_when_max_in_flight_reached_then_statements_wait(self):
+        connection = FakeAsyncConnection(latency=0.02)
+        executor = self.create_executor(connection, max_in_flight=2)
+
+        futures = [executor.submit(f"CREATE DATABASE db_{i}") for i in range(6)]
+        [future.result() for future in futures]
+        executor.close()
+
+        self.assertEqual(executor.peak_in_flight, 2)
+        self.assertEqual(executor.completed, 6)
+
+    def test_when_query_fails_then_error_is_raised(self):
+        connection = FakeAsyncConnection(error=Exception("SQL compilation error"))
+        executor = self.create_executor(connection)
+
+        self.assertRaises(Exception, executor.execute, "CREATE DATABASE test_db")
+        executor.close()
+
+    def test_when_cursor_executes_through_executor_connection_then_query_id_is_set(self):
+        connection = FakeAsyncConnection()
+        executor = self.create_executor(connection)
+
+        cursor = AsyncExecutorConnection(executor).cursor()
+        cursor.execute("CREATE DATABASE test_db")
+        cursor.close()
+        executor.close()
+
+        self.assertEqual(cursor.sfqid, "query-0")
+        self.assertEqual(connection.statements, ["CREATE DATABASE test_db"])
+
+    def test_when_cursor_executes_then_rowcount_taken_from_status_without_fetching_results(self):
+        connection = FakeAsyncConnection()
+        connection.cursor = Mock(wraps=connection.cursor)
+        executor = self.create_executor(connection)
+
+        cursor = AsyncExecutorConnection(executor).cursor()
+        cursor.execute("CREATE DATABASE test_db")
+        rowcount = cursor.rowcount
+        executor.close()
+
+        self.assertEqual(rowcount, 1)
+        self.assertEqual(connection.cursor.call_count, 1)
+
+    def test_when_multi_statement_executed_then_cursor_moves_through_statement_results(self):
+        connection = FakeAsyncConnection()
+        connection.cursor = Mock(wraps=connection.cursor)
+        executor = self.create_executor(connection)
+
+        cursor = AsyncExecutorConnection(executor).cursor()
+        cursor.execute("CREATE DATABASE db_a;\nCREATE DATABASE db_b",
+                       _statement_params={"MULTI_STATEMENT_COUNT": 2})
+        results = [(cursor.sfqid, cursor.rowcount)]
+
+        while cursor.nextset() is not None:
+            results.append((cursor.sfqid, cursor.rowcount))
+
+        executor.close()
+
+        self.assertEqual(results, [("query-0-a", 1), ("query-0-b", 1)])
+        self.assertEqual(connection.cursor.call_count, 1)
+
+    def test_when_single_statement_executed_then_results_not_requested(self):
+        connection = FakeAsyncConnection()
+        executor = self.create_executor(connection)
+
+        query = executor.execute_query("CREATE DATABASE test_db")
+        executor.close()
+
+        self.assertEqual(query.results, ())
+        connection.rest.request.assert_not_called()
+
+    def test_when_connection_invalidated_then_running_statements_finish_before_logout(self):
+        (first, second) = (FakeAsyncConnection(latency=0.1), FakeAsyncConnection())
+        executor = AsyncExecutor(ConnectionPool(Mock(side_effect=[first, second])),
+                                 poll_interval=0.005)
+
+        running = executor.submit("CREATE DATABASE slow_db")
+
+        while not first.statements:
+            time.sleep(0.001)
+
+        AsyncExecutorConnection(executor).invalidate()
+        executor.execute("CREATE DATABASE test_db")
+        closed_while_running = first.closed
+        running.result()
+        executor.close()
+
+        self.assertFalse(closed_while_running)
+        self.assertTrue(first.closed)
+        self.assertEqual(second.statements, ["CREATE DATABASE test_db"])
+
+    # HELPERS
+
+    def create_executor(self, connection, max_in_flight=10):
+        return AsyncExecutor(ConnectionPool(Mock(return_value=connection)),
+                             max_in_flight=max_in_flight,
+                             poll_interval=0.005)
@@ -0,0 +1,25 @@
+import unittest
+
+from benchmark import async_execution, templates
+
+
+class BenchmarkTests(unittest.TestCase):
+    """
+    Runs the benchmarks with small inputs, so that they keep working as the code they measure
+    changes.
+    """
+
+    def test_when_async_execution_benchmark_run_then_every_create_completes(self):
+        for async_execution_enabled in (False, True):
+            result = async_execution.run(count=5, latency=0.01, pool_size=2,
+                                         async_execution=async_execution_enabled)
+
+            self.assertEqual(result["creates"], 5)
+            self.assertGreater(result["sessions"], 0)
+
+    def test_when_templates_benchmark_run_then_every_provider_timed(self):
+        results = templates.run(iterations=1)
+
+        self.assertEqual(len(results), len(templates.CASES))
+        self.assertEqual(set(results["TableProvider"]),
+                         {"compiled_per_call", "precompiled", "property_specs"})
@@ -0,0 +1,243 @@
+import pickle
+import tempfile
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from pulumi.dynamic import Config, ConfigureRequest
+
+from pulumi_snowflake import Client, Provider
+from pulumi_snowflake.baseprovider import BaseDynamicProvider
+from pulumi_snowflake.connection_pool import close_all_pools
+from pulumi_snowflake.database import DatabaseProvider
+from pulumi_snowflake.token_cache import clear_memory_cache
+
+from .providers import get_test_provider
+
+
+class ClientTests(unittest.TestCase):
+
+    def setUp(self):
+        close_all_pools()
+        clear_memory_cache()
+
+    def tearDown(self):
+        close_all_pools()
+        clear_memory_cache()
+
+    @patch("snowflake.connector.connect")
+    def test_when_password_given_then_connects_with_password(self, mock_connect):
+        Client(get_test_provider()).get()
+
+        self.assertEqual(mock_connect.call_args[1]["password"], "test_password")
+        self.assertNotIn("private_key", mock_connect.call_args[1])
+
+    @patch("snowflake.connector.connect")
+    def test_when_private_key_given_then_connects_with_key_pair(self, mock_connect):
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048,
+                                       backend=default_backend())
+        provider = get_test_provider()
+        provider.password = None
+        provider.private_key = key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.BestAvailableEncryption(b"test_passphrase")
+        ).decode("utf-8")
+        provider.private_key_passphrase = "test_passphrase"
+
+        Client(provider).get()
+
+        parameters = mock_connect.call_args[1]
+        self.assertEqual(parameters["authenticator"], "SNOWFLAKE_JWT")
+        self.assertEqual(parameters["private_key"], key.private_bytes(
+            encoding=serialization.Encoding.DER,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption()
+        ))
+        self.assertNotIn("password", parameters)
+
+    @patch("snowflake.connector.connect")
+    def test_when_token_cache_enabled_then_new_connections_resume_session(self, mock_connect):
+        mock_connect.side_effect = lambda **kwargs: self.create_mock_connection()
+        provider = get_test_provider()
+        provider.token_cache = "memory"
+
+        Client(provider).get()
+        close_all_pools()
+        Client(provider).get()
+
+        first_call, second_call = mock_connect.call_args_list
+        self.assertNotIn("session_token", first_call[1])
+        self.assertEqual(second_call[1]["session_token"], "test_session_token")
+        self.assertEqual(second_call[1]["master_token"], "test_master_token")
+        self.assertTrue(second_call[1]["server_session_keep_alive"])
+
+    @patch("snowflake.connector.version.VERSION", (3, 0, 4, None))
+    @patch("snowflake.connector.connect")
+    def test_when_token_cache_enabled_on_older_connector_then_error_raised(self, mock_connect):
+        provider = get_test_provider(token_cache="memory")
+
+        with self.assertRaises(Exception) as context:
+            Client(provider).get()
+
+        self.assertIn("requires snowflake-connector-python 3.1.0 or later, but 3.0.4 is installed",
+                      str(context.exception))
+        mock_connect.assert_not_called()
+
+    @patch("snowflake.connector.version.VERSION", (3, 0, 4, None))
+    @patch("snowflake.connector.connect")
+    def test_when_async_execution_enabled_on_older_connector_then_error_raised(self,
+                                                                               mock_connect):
+        provider = get_test_provider(async_execution=True)
+
+        self.assertRaises(Exception, Client(provider).get)
+        mock_connect.assert_not_called()
+
+    @patch("snowflake.connector.version.VERSION", (2, 9, 0, None))
+    @patch("snowflake.connector.connect")
+    def test_when_opt_in_options_not_set_then_older_connector_used(self, mock_connect):
+        Client(get_test_provider()).get()
+
+        mock_connect.assert_called_once()
+
+    @patch("snowflake.connector.connect")
+    def test_when_token_cache_enabled_then_concurrent_sessions_not_shared(self, mock_connect):
+        tokens = iter(["first_session_token", "second_session_token", "third", "fourth"])
+        mock_connect.side_effect = lambda **kwargs: self.create_mock_connection(next(tokens))
+        provider = get_test_provider()
+        provider.token_cache = "memory"
+
+        client = Client(provider)
+        client.get()
+        client.get()
+        close_all_pools()
+        client.get()
+        client.get()
+
+        session_tokens = [call[1].get("session_token") for call in mock_connect.call_args_list]
+        self.assertEqual(session_tokens,
+                         [None, None, "first_session_token", "second_session_token"])
+
+    @patch("snowflake.connector.connect")
+    def test_when_disk_token_cache_enabled_then_later_processes_resume_session(self, mock_connect):
+        mock_connect.side_effect = lambda **kwargs: self.create_mock_connection()
+        provider = get_test_provider()
+        provider.token_cache = "disk"
+        provider.token_cache_dir = tempfile.mkdtemp()
+
+        Client(provider).get()
+        close_all_pools()
+        clear_memory_cache()
+        Client(provider).get()
+
+        self.assertEqual(mock_connect.call_args[1]["session_token"], "test_session_token")
+
+    @patch("snowflake.connector.connect")
+    def test_when_cached_session_cannot_be_resumed_then_logs_in(self, mock_connect):
+        provider = get_test_provider()
+        provider.token_cache = "memory"
+        mock_connect.side_effect = [self.create_mock_connection(), Exception("Session expired"),
+                                    self.create_mock_connection()]
+
+        Client(provider).get()
+        close_all_pools()
+        Client(provider).get()
+
+        self.assertEqual(mock_connect.call_count, 3)
+        self.assertNotIn("session_token", mock_connect.call_args[1])
+
+    @patch("snowflake.connector.connect")
+    def test_when_warm_up_configured_then_sessions_opened_on_first_connection(self, mock_connect):
+        mock_connect.side_effect = lambda **kwargs: self.create_mock_connection()
+        provider = get_test_provider(warm_up_connections=3)
+        dynamic_provider = BaseDynamicProvider(provider, Client(provider), "Test")
+
+        deserialized = pickle.loads(pickle.dumps(dynamic_provider))
+        connect_count_after_deserialization = mock_connect.call_count
+        deserialized.connection_provider.get().close()
+        pool = deserialized.connection_provider.get_pool()
+        deadline = time.monotonic() + 5
+
+        while pool.idle_count < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual(connect_count_after_deserialization, 0)
+        self.assertEqual(pool.idle_count, 3)
+        self.assertEqual(mock_connect.call_count, 3)
+
+    @patch("snowflake.connector.connect")
+    def test_when_dynamic_provider_configured_then_sessions_opened_before_first_connection(
+            self, mock_connect):
+        mock_connect.side_effect = lambda **kwargs: self.create_mock_connection()
+        provider = get_test_provider(warm_up_connections=2)
+        dynamic_provider = BaseDynamicProvider(provider, Client(provider), "Test")
+        deserialized = pickle.loads(pickle.dumps(dynamic_provider))
+
+        deserialized.configure(ConfigureRequest(Config({}, "test_project")))
+        pool = deserialized.connection_provider.get_pool()
+        deadline = time.monotonic() + 5
+
+        while pool.idle_count < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual(pool.idle_count, 2)
+        self.assertEqual(mock_connect.call_count, 2)
+
+    @patch("snowflake.connector.connect")
+    def test_when_render_only_dynamic_provider_configured_then_no_sessions_opened(self,
+                                                                                  mock_connect):
+        provider = get_test_provider(warm_up_connections=2)
+        dynamic_provider = BaseDynamicProvider(provider, Client(provider), "Test")
+        config = Config({"test_project:snowflakeRenderOnly": True}, "test_project")
+
+        dynamic_provider.configure(ConfigureRequest(config))
+
+        self.assertEqual(dynamic_provider.connection_provider.get_pool().idle_count, 0)
+        mock_connect.assert_not_called()
+
+    @patch("snowflake.connector.connect")
+    def test_when_warm_up_not_configured_then_no_sessions_opened(self, mock_connect):
+        self.assertIsNone(Client(get_test_provider()).warm_up())
+        mock_connect.assert_not_called()
+
+    @patch("snowflake.connector.connect")
+    def test_when_first_release_provider_then_resources_diffed_and_deleted(self, mock_connect):
+        connection = self.create_mock_connection()
+        mock_connect.return_value = connection
+
+        # Provider parameters pickled into the stack state by the first release only have these
+        # attributes
+        provider = Provider.__new__(Provider)
+        provider.__dict__.update(username="test_user", password="test_password",
+                                 account_name="test_account",
+                                 role="test_role", database=None, schema=None)
+
+        deserialized = pickle.loads(pickle.dumps(DatabaseProvider(provider, Client(provider))))
+        diff = deserialized.diff("test_db", {"name": "test_db", "transient": False},
+                                 {"name": "test_db", "transient": True})
+        deserialized.delete("test_db", {"name": "test_db"})
+
+        self.assertEqual(diff.replaces, ["transient"])
+        connection.cursor.return_value.execute.assert_called_once_with("DROP DATABASE test_db")
+
+    @patch("snowflake.connector.connect")
+    def test_when_ocsp_cache_file_given_then_passed_to_connector(self, mock_connect):
+        provider = get_test_provider()
+        provider.ocsp_cache_file = "/tmp/ocsp_cache.json"
+
+        Client(provider).get()
+
+        self.assertEqual(mock_connect.call_args[1]["ocsp_response_cache_filename"],
+                         "/tmp/ocsp_cache.json")
+
+    # HELPERS
+
+    def create_mock_connection(self, session_token="test_session_token"):
+        connection = Mock()
+        connection.is_closed.return_value = False
+        connection.rest.token = session_token
+        connection.rest.master_token = "test_master_token"
+        return connection
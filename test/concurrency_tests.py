@@ -0,0 +1,142 @@
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from pulumi_snowflake import Client
+from pulumi_snowflake.concurrency import ConcurrencyLimiter, LimitedConnection, clear_limiters
+from pulumi_snowflake.connection_pool import close_all_pools
+
+from .providers import get_test_provider
+
+
+class ConcurrencyLimiterTests(unittest.TestCase):
+
+    def tearDown(self):
+        clear_limiters()
+        close_all_pools()
+
+    def test_when_limit_reached_then_statements_wait(self):
+        limiter = ConcurrencyLimiter(2)
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def run():
+            slot = limiter.acquire()
+
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+
+            time.sleep(0.02)
+
+            with lock:
+                running[0] -= 1
+
+            slot.release()
+
+        threads = [threading.Thread(target=run) for _ in range(8)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(peak[0], 2)
+        self.assertEqual(limiter.acquired, 8)
+        self.assertEqual(limiter.in_use, 0)
+
+    def test_when_statement_waits_then_wait_time_recorded(self):
+        limiter = ConcurrencyLimiter(1)
+        slot = limiter.acquire()
+
+        threading.Timer(0.1, slot.release).start()
+        waiting_slot = limiter.acquire()
+
+        self.assertGreaterEqual(waiting_slot.wait_seconds, 0.05)
+        self.assertEqual(limiter.waits, 1)
+        self.assertGreaterEqual(limiter.max_wait_seconds, 0.05)
+
+    def test_when_slot_released_twice_then_only_released_once(self):
+        limiter = ConcurrencyLimiter(2)
+        limiter.acquire()
+        slot = limiter.acquire()
+
+        slot.release()
+        slot.release()
+
+        self.assertEqual(limiter.in_use, 1)
+
+    def test_when_limit_less_than_one_then_error_raised(self):
+        self.assertRaises(Exception, ConcurrencyLimiter, 0)
+
+    def test_when_connection_closed_then_slot_released(self):
+        limiter = ConcurrencyLimiter(1)
+        connection = Mock()
+
+        LimitedConnection(connection, limiter.acquire()).close()
+
+        connection.close.assert_called_once()
+        self.assertEqual(limiter.in_use, 0)
+
+    def test_when_connection_invalidated_then_slot_released(self):
+        limiter = ConcurrencyLimiter(1)
+        connection = Mock()
+
+        LimitedConnection(connection, limiter.acquire()).invalidate()
+
+        connection.invalidate.assert_called_once()
+        self.assertEqual(limiter.in_use, 0)
+
+    @unittest.skipIf(sys.platform == "win32", "File locks are only supported on POSIX")
+    def test_when_lock_dir_given_then_limit_shared_between_processes(self):
+        with tempfile.TemporaryDirectory() as lock_dir:
+            limiter = ConcurrencyLimiter(1, lock_dir)
+            slot = limiter.acquire()
+
+            # Another process holding the same lock directory must wait until this process releases
+            # its slot
+            code = (
+                "import sys, time; from pulumi_snowflake.concurrency import ConcurrencyLimiter; "
+                "start = time.monotonic(); ConcurrencyLimiter(1, sys.argv[1]).acquire(); "
+                "print(time.monotonic() - start)"
+            )
+            process = subprocess.Popen([sys.executable, "-c", code, lock_dir],
+                                       stdout=subprocess.PIPE, universal_newlines=True,
+                                       cwd=os.path.dirname(os.path.dirname(__file__)))
+
+            time.sleep(0.5)
+            slot.release()
+            (output, _) = process.communicate(timeout=10)
+
+            self.assertGreaterEqual(float(output), 0.4)
+
+    def test_when_max_concurrency_set_then_client_connections_limited(self):
+        clear_limiters()
+        provider = get_test_provider()
+        provider.max_concurrency = 1
+
+        with patch("snowflake.connector.connect", side_effect=self.create_mock_connection):
+            client = Client(provider)
+            connection = client.get()
+            limiter = client.get_limiter()
+
+            self.assertEqual(limiter.in_use, 1)
+            connection.close()
+            self.assertEqual(limiter.in_use, 0)
+
+    def test_when_max_concurrency_not_set_then_no_limiter(self):
+        self.assertIsNone(Client(get_test_provider()).get_limiter())
+
+    # HELPERS
+
+    def create_mock_connection(self, **kwargs):
+        connection = Mock()
+        connection.is_closed.return_value = False
+        return connection
@@ -0,0 +1,222 @@
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from pulumi_snowflake import Client
+from pulumi_snowflake.connection_pool import ConnectionPool, close_all_pools
+
+from .providers import get_test_provider
+
+
+class ConnectionPoolTests(unittest.TestCase):
+
+    def test_when_connection_closed_then_session_is_reused(self):
+        connect = Mock(side_effect=self.create_mock_connection)
+        pool = ConnectionPool(connect, max_size=2)
+
+        pool.acquire().close()
+        pool.acquire().close()
+
+        self.assertEqual(connect.call_count, 1)
+        self.assertEqual(pool.reused, 1)
+
+    def test_when_connection_closed_then_underlying_session_is_not_closed(self):
+        connection = self.create_mock_connection()
+        pool = ConnectionPool(Mock(return_value=connection))
+
+        pool.acquire().close()
+
+        connection.close.assert_not_called()
+
+    def test_when_connection_closed_twice_then_only_released_once(self):
+        pool = ConnectionPool(Mock(side_effect=self.create_mock_connection))
+
+        pooled_connection = pool.acquire()
+        pooled_connection.close()
+        pooled_connection.close()
+
+        self.assertEqual(pool.idle_count, 1)
+
+    def test_when_connections_in_use_then_new_sessions_are_opened(self):
+        connect = Mock(side_effect=self.create_mock_connection)
+        pool = ConnectionPool(connect, max_size=3)
+
+        pool.acquire()
+        pool.acquire()
+
+        self.assertEqual(connect.call_count, 2)
+        self.assertEqual(pool.size, 2)
+
+    def test_when_sessions_open_at_same_time_then_each_has_own_slot(self):
+        connect = Mock(side_effect=self.create_mock_connection)
+        pool = ConnectionPool(connect, max_size=3)
+
+        first = pool.acquire()
+        pool.acquire()
+        first.invalidate()
+        pool.acquire()
+
+        self.assertEqual([call[0][0] for call in connect.call_args_list], [0, 1, 0])
+
+    def test_when_pool_full_then_acquire_times_out(self):
+        pool = ConnectionPool(Mock(side_effect=self.create_mock_connection), max_size=1)
+
+        pool.acquire()
+
+        self.assertRaises(Exception, pool.acquire, 0.01)
+
+    def test_when_pool_full_then_acquire_waits_for_release(self):
+        pool = ConnectionPool(Mock(side_effect=self.create_mock_connection), max_size=1)
+        pooled_connection = pool.acquire()
+
+        timer = threading.Timer(0.05, pooled_connection.close)
+        timer.start()
+
+        second_connection = pool.acquire(timeout=5)
+
+        self.assertIs(second_connection.connection, pooled_connection.connection)
+
+    def test_when_warmed_up_then_sessions_opened_and_left_idle(self):
+        connect = Mock(side_effect=self.create_mock_connection)
+        pool = ConnectionPool(connect, max_size=8)
+
+        opened = pool.warm_up(4)
+        pool.acquire()
+
+        self.assertEqual(opened, 4)
+        self.assertEqual(connect.call_count, 4)
+        self.assertEqual(pool.reused, 1)
+
+    def test_when_warm_up_count_exceeds_max_size_then_limited_to_max_size(self):
+        pool = ConnectionPool(Mock(side_effect=self.create_mock_connection), max_size=2)
+
+        self.assertEqual(pool.warm_up(5), 2)
+        self.assertEqual(pool.idle_count, 2)
+
+    def test_when_first_warm_up_session_fails_then_no_more_opened(self):
+        connect = Mock(side_effect=Exception("Login failed"))
+        pool = ConnectionPool(connect)
+
+        self.assertEqual(pool.warm_up(4), 0)
+        self.assertEqual(connect.call_count, 1)
+        self.assertEqual(pool.size, 0)
+
+    def test_when_warm_up_started_twice_then_only_started_once(self):
+        connect = Mock(side_effect=self.create_mock_connection)
+        pool = ConnectionPool(connect)
+
+        pool.start_warm_up(2).join()
+
+        self.assertIsNone(pool.start_warm_up(2))
+        self.assertEqual(connect.call_count, 2)
+
+    def test_when_session_idle_longer_than_timeout_then_evicted(self):
+        connect = Mock(side_effect=self.create_mock_connection)
+        pool = ConnectionPool(connect, idle_timeout=0)
+
+        first_connection = pool.acquire()
+        first_connection.close()
+        pool.acquire()
+
+        first_connection.connection.close.assert_called_once()
+        self.assertEqual(connect.call_count, 2)
+        self.assertEqual(pool.evicted, 1)
+
+    def test_when_evict_idle_called_then_expired_sessions_closed(self):
+        pool = ConnectionPool(Mock(side_effect=self.create_mock_connection), idle_timeout=0)
+
+        pooled_connection = pool.acquire()
+        pooled_connection.close()
+        pool.evict_idle()
+
+        pooled_connection.connection.close.assert_called_once()
+        self.assertEqual(pool.size, 0)
+
+    def test_when_session_released_then_expired_idle_sessions_evicted(self):
+        pool = ConnectionPool(Mock(side_effect=self.create_mock_connection), max_size=2,
+                              idle_timeout=0.05)
+        first_connection = pool.acquire()
+        second_connection = pool.acquire()
+
+        first_connection.close()
+        time.sleep(0.1)
+        second_connection.close()
+
+        first_connection.connection.close.assert_called_once()
+        second_connection.connection.close.assert_not_called()
+        self.assertEqual(pool.idle_count, 1)
+        self.assertEqual(pool.evicted, 1)
+
+    def test_when_session_closed_by_server_then_replaced(self):
+        connect = Mock(side_effect=self.create_mock_connection)
+        pool = ConnectionPool(connect)
+
+        first_connection = pool.acquire()
+        first_connection.close()
+        first_connection.connection.is_closed.return_value = True
+
+        second_connection = pool.acquire()
+
+        self.assertIsNot(second_connection.connection, first_connection.connection)
+
+    def test_when_health_check_fails_then_session_replaced(self):
+        connect = Mock(side_effect=self.create_mock_connection)
+        pool = ConnectionPool(connect, health_check_interval=0)
+
+        first_connection = pool.acquire()
+        first_connection.close()
+        mock_cursor = first_connection.connection.cursor.return_value
+        mock_cursor.execute.side_effect = Exception("Session expired")
+
+        second_connection = pool.acquire()
+
+        self.assertIsNot(second_connection.connection, first_connection.connection)
+        self.assertEqual(pool.size, 1)
+
+    def test_when_connection_invalidated_then_session_closed_and_removed(self):
+        pool = ConnectionPool(Mock(side_effect=self.create_mock_connection))
+
+        pooled_connection = pool.acquire()
+        pooled_connection.invalidate()
+
+        pooled_connection.connection.close.assert_called_once()
+        self.assertEqual(pool.size, 0)
+
+    def test_when_connect_fails_then_slot_is_freed(self):
+        pool = ConnectionPool(Mock(side_effect=Exception("Login failed")), max_size=1)
+
+        self.assertRaises(Exception, pool.acquire)
+        self.assertEqual(pool.size, 0)
+
+    @patch("snowflake.connector.connect")
+    def test_when_clients_have_same_parameters_then_pool_is_shared(self, mock_connect):
+        close_all_pools()
+        mock_connect.side_effect = lambda **kwargs: self.create_mock_connection()
+
+        Client(get_test_provider()).get().close()
+        Client(get_test_provider()).get().close()
+
+        self.assertEqual(mock_connect.call_count, 1)
+        close_all_pools()
+
+    @patch("snowflake.connector.connect")
+    def test_when_clients_have_different_roles_then_pools_are_separate(self, mock_connect):
+        close_all_pools()
+        mock_connect.side_effect = lambda **kwargs: self.create_mock_connection()
+
+        other_provider = get_test_provider()
+        other_provider.role = "other_role"
+
+        Client(get_test_provider()).get().close()
+        Client(other_provider).get().close()
+
+        self.assertEqual(mock_connect.call_count, 2)
+        close_all_pools()
+
+    # HELPERS
+
+    def create_mock_connection(self, slot=0):
+        connection = Mock()
+        connection.is_closed.return_value = False
+        return connection
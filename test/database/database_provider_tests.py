@@ -2,11 +2,17 @@ import unittest
 
 from unittest.mock import Mock, call
 
+from pulumi_snowflake.baseprovider.renames import clear_renames
 from pulumi_snowflake.database.database_provider import DatabaseProvider
+from pulumi_snowflake.testing import FakeClient
+from pulumi_snowflake.testing.catalog import DATABASE, SCHEMA
 
 
 class DatabaseProviderTests(unittest.TestCase):
 
+    def tearDown(self):
+        clear_renames()
+
     def test_create_database_simple_args(self):
         mock_cursor = Mock()
         mock_connection_provider = self.get_mock_connection_provider(mock_cursor)
@@ -126,6 +132,76 @@ class DatabaseProviderTests(unittest.TestCase):
             ]))
         ])
 
+    def test_when_name_or_properties_changed_then_updated_without_replacement(self):
+        provider = DatabaseProvider(self.get_mock_provider(), Mock())
+
+        result = provider.diff("test_db", {
+            "name": "test_db",
+            "full_name": "test_db",
+            "comment": "test_comment"
+        }, {
+            "name": "test_db_renamed",
+            "data_retention_time_in_days": 7
+        })
+
+        self.assertTrue(result.changes)
+        self.assertEqual(result.replaces, [])
+
+    def test_when_transient_or_share_changed_then_replaced(self):
+        provider = DatabaseProvider(self.get_mock_provider(), Mock())
+
+        result = provider.diff("test_db", {"name": "test_db", "transient": False},
+                               {"name": "test_db", "transient": True, "share": "test_share"})
+
+        self.assertSetEqual(set(result.replaces), {"transient", "share"})
+
+    def test_when_database_renamed_then_rename_precedes_alter(self):
+        mock_cursor = Mock()
+        mock_connection_provider = self.get_mock_connection_provider(mock_cursor)
+
+        provider = DatabaseProvider(self.get_mock_provider(), mock_connection_provider)
+        result = provider.update("test_db", {
+            "name": "test_db",
+            "data_retention_time_in_days": 1,
+            "comment": "test_comment"
+        }, {
+            "name": "test_db_renamed",
+            "data_retention_time_in_days": 7
+        })
+
+        mock_cursor.execute.assert_called_once_with(";\n".join([
+            "ALTER DATABASE test_db RENAME TO test_db_renamed",
+            "ALTER DATABASE test_db_renamed SET\nDATA_RETENTION_TIME_IN_DAYS = 7",
+            "ALTER DATABASE test_db_renamed UNSET COMMENT"
+        ]), _statement_params={"MULTI_STATEMENT_COUNT": 3})
+        self.assertEqual(result.outs["name"], "test_db_renamed")
+
+    def test_when_renamed_database_deleted_then_current_name_dropped(self):
+        mock_cursor = Mock()
+        mock_connection_provider = self.get_mock_connection_provider(mock_cursor)
+
+        provider = DatabaseProvider(self.get_mock_provider(), mock_connection_provider)
+        provider.delete("test_db", {"name": "test_db_renamed"})
+
+        mock_cursor.execute.assert_called_once_with("DROP DATABASE test_db_renamed")
+
+    def test_when_database_renamed_then_catalog_keeps_contents(self):
+        client = FakeClient()
+        provider = DatabaseProvider(self.get_mock_provider(), client)
+        outputs = provider.create({"name": "test_db", "comment": "test_comment"}).outs
+        client.catalog.execute("CREATE SCHEMA test_db.test_schema")
+
+        outputs = provider.update("test_db", outputs,
+                                  {"name": "test_db_renamed", "comment": "new_comment"}).outs
+        outputs = provider.update("test_db", outputs, {"name": "test_db_renamed"}).outs
+
+        self.assertIsNone(client.catalog.get(DATABASE, "test_db"))
+        self.assertEqual(client.catalog.get(DATABASE, "test_db_renamed").properties, {})
+        self.assertIsNotNone(client.catalog.get(SCHEMA, "test_db_renamed.test_schema"))
+
+        provider.delete("test_db", outputs)
+
+        self.assertEqual(client.catalog.objects, {})
 
     # HELPERS
 
@@ -89,6 +89,67 @@ class FileFormatProviderTests(unittest.TestCase):
         self.assertTrue(result.changes)
         self.assertSetEqual(set(result.replaces), {"schema"})
 
+    def test_when_only_outputs_differ_then_no_change(self):
+        provider = FileFormatProvider(self.get_mock_provider(), Mock())
+        result = provider.diff("test_file_format", {
+            "type": "CSV",
+            "database": "database_name",
+            "schema": "schema_name",
+            "full_name": "database_name.schema_name.test_file_format",
+            "name": "test_file_format"
+        }, {
+            "type": "CSV",
+            "database": "database_name",
+            "schema": "schema_name"
+        })
+
+        self.assertFalse(result.changes)
+
+    def test_when_schema_comes_from_provider_then_no_change(self):
+        mock_provider = self.get_mock_provider()
+        mock_provider.schema = "provider_schema"
+        provider = FileFormatProvider(mock_provider, Mock())
+        result = provider.diff("test_file_format", {
+            "type": "CSV",
+            "database": "database_name",
+            "schema": "provider_schema",
+            "full_name": "database_name.provider_schema.test_file_format"
+        }, {
+            "type": "CSV",
+            "database": "database_name"
+        })
+
+        self.assertFalse(result.changes)
+
+    def test_when_option_changed_then_updated_without_replacement(self):
+        provider = FileFormatProvider(self.get_mock_provider(), Mock())
+        result = provider.diff("test_file_format", {
+            "type": "CSV",
+            "skip_header": 1,
+            "comment": "test_comment"
+        }, {
+            "type": "CSV",
+            "skip_header": 2,
+            "null_if": ["NULL"]
+        })
+
+        self.assertTrue(result.changes)
+        self.assertSetEqual(set(result.replaces), set())
+
+    def test_when_option_removed_then_needs_replacement(self):
+        provider = FileFormatProvider(self.get_mock_provider(), Mock())
+        result = provider.diff("test_file_format", {
+            "type": "CSV",
+            "skip_header": 1,
+            "trim_space": False
+        }, {
+            "type": "CSV",
+            "trim_space": True
+        })
+
+        self.assertTrue(result.changes)
+        self.assertSetEqual(set(result.replaces), {"skip_header"})
+
     # HELPERS
 
     def get_mock_provider(self):
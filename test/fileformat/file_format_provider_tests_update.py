@@ -0,0 +1,92 @@
+import unittest
+from unittest.mock import Mock
+
+from pulumi_snowflake.fileformat import FileFormatProvider
+from pulumi_snowflake.testing import FakeClient
+from pulumi_snowflake.testing.catalog import FILE_FORMAT
+
+
+class FileFormatProviderTests(unittest.TestCase):
+
+    def test_when_options_changed_then_set_in_one_statement(self):
+        mock_cursor = Mock()
+        mock_connection_provider = self.get_mock_connection_provider(mock_cursor)
+
+        provider = FileFormatProvider(self.get_mock_provider(), mock_connection_provider)
+        provider.update("test_file_format", {
+            **self.get_standard_inputs(),
+            "skip_header": 1,
+            "trim_space": True,
+            "null_if": ["NULL"],
+            "comment": "test_comment"
+        }, {
+            **self.get_standard_inputs(),
+            "skip_header": 2,
+            "trim_space": False,
+            "null_if": ["NULL"],
+            "field_delimiter": "|"
+        })
+
+        mock_cursor.execute.assert_called_once_with("\n".join([
+            "ALTER FILE FORMAT test_database_name..test_file_format SET",
+            "FIELD_DELIMITER = '|'",
+            "SKIP_HEADER = 2",
+            "TRIM_SPACE = FALSE",
+            "COMMENT = ''"
+        ]))
+
+    def test_when_nothing_changed_then_no_statement(self):
+        mock_connection_provider = Mock()
+
+        provider = FileFormatProvider(self.get_mock_provider(), mock_connection_provider)
+        provider.update("test_file_format", self.get_standard_inputs(), self.get_standard_inputs())
+
+        mock_connection_provider.get.assert_not_called()
+
+    def test_when_option_removed_then_update_raises(self):
+        provider = FileFormatProvider(self.get_mock_provider(), Mock())
+
+        self.assertRaises(Exception, provider.update, "test_file_format",
+                          {**self.get_standard_inputs(), "skip_header": 1},
+                          self.get_standard_inputs())
+
+    def test_when_file_format_updated_then_catalog_keeps_file_format(self):
+        client = FakeClient()
+        client.catalog.execute("CREATE DATABASE test_database_name")
+        provider = FileFormatProvider(self.get_mock_provider(), client)
+        inputs = {**self.get_standard_inputs(), "schema": "public", "skip_header": 1}
+        outputs = provider.create(inputs).outs
+        full_name = "test_database_name.public.test_file_format"
+        created_on = client.catalog.get(FILE_FORMAT, full_name).created_on
+
+        provider.update("test_file_format", outputs,
+                        {**inputs, "skip_header": 2, "null_if": ["", "NULL"]})
+
+        file_format = client.catalog.get(FILE_FORMAT, full_name)
+        self.assertEqual(file_format.created_on, created_on)
+        self.assertEqual(file_format.properties,
+                         {"TYPE": "CSV", "SKIP_HEADER": 2, "NULL_IF": ["", "NULL"]})
+
+    # HELPERS
+
+    def get_standard_inputs(self):
+        return {
+            'database': 'test_database_name',
+            'type': 'CSV',
+            'resource_name': 'pulumi_test_file_format',
+            'name': 'test_file_format',
+            'comment': None
+        }
+
+    def get_mock_connection_provider(self, mock_cursor):
+        mockConnection = Mock()
+        mockConnection.cursor.return_value = mock_cursor
+        mock_connection_provider = Mock()
+        mock_connection_provider.get.return_value = mockConnection
+        return mock_connection_provider
+
+    def get_mock_provider(self):
+        mock_provider = Mock()
+        mock_provider.database = None
+        mock_provider.schema = None
+        return mock_provider
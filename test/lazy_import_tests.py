@@ -0,0 +1,49 @@
+import subprocess
+import sys
+import unittest
+
+
+class LazyImportTests(unittest.TestCase):
+
+    def test_when_resource_packages_imported_then_connector_not_imported(self):
+        self.assertFalse(self.run_and_check_module_loaded(
+            "import pulumi_snowflake.database, pulumi_snowflake.table, pulumi_snowflake.warehouse",
+            "snowflake.connector"
+        ))
+
+    def test_when_package_imported_then_sub_packages_not_imported(self):
+        self.assertFalse(self.run_and_check_module_loaded("import pulumi_snowflake",
+                                                          "pulumi_snowflake.table"))
+
+    def test_when_sub_package_accessed_as_attribute_then_imported(self):
+        self.assertTrue(self.run_and_check_module_loaded(
+            "import pulumi_snowflake; pulumi_snowflake.table.TableProvider",
+            "pulumi_snowflake.table"
+        ))
+
+    def test_when_client_imported_from_package_then_available(self):
+        from pulumi_snowflake import Client
+        from pulumi_snowflake.client import Client as ModuleClient
+
+        self.assertIs(Client, ModuleClient)
+
+    def test_when_star_imported_then_only_exports_imported(self):
+        self.assertFalse(self.run_and_check_module_loaded(
+            "from pulumi_snowflake import *; Client, Provider", "pulumi_snowflake.table"
+        ))
+
+    def test_when_package_imported_then_module_docstring_set(self):
+        import pulumi_snowflake
+
+        self.assertIn("imported lazily", pulumi_snowflake.__doc__)
+
+    # HELPERS
+
+    def run_and_check_module_loaded(self, code, module):
+        process = subprocess.run(
+            [sys.executable, "-c", f"{code}; import sys; print({module!r} in sys.modules)"],
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+            check=True
+        )
+        return process.stdout.strip() == "True"
@@ -2,11 +2,21 @@ import unittest
 
 from unittest.mock import Mock, call
 
+from pulumi_snowflake.baseprovider.renames import clear_renames
+from pulumi_snowflake.database import DatabaseProvider
 from pulumi_snowflake.pipe import PipeProvider
+from pulumi_snowflake.testing import FakeClient
+from pulumi_snowflake.testing.catalog import PIPE
 
 
 class WarehouseProviderTests(unittest.TestCase):
 
+    def setUp(self):
+        clear_renames()
+
+    def tearDown(self):
+        clear_renames()
+
     def test_create_pipe_simple_args(self):
         mock_cursor = Mock()
         mock_connection_provider = self.get_mock_connection_provider(mock_cursor)
@@ -99,6 +109,49 @@ file_format = (type = 'JSON');'''
             call(f"DROP PIPE test_pipe")
         ])
 
+    def test_when_database_renamed_then_pipe_moved_without_replacement(self):
+        client = FakeClient()
+        database_provider = DatabaseProvider(self.get_mock_provider(), client)
+        provider = PipeProvider(self.get_mock_provider(), client)
+        database = database_provider.create({"name": "test_db"}).outs
+        client.catalog.execute("CREATE TABLE test_db.public.test_table (id INT)")
+        client.catalog.execute("CREATE STAGE test_db.public.test_stage")
+        inputs = {"name": "test_pipe", "database": "test_db", "schema": "public",
+                  "code": "COPY INTO test_db.public.test_table FROM @test_db.public.test_stage"}
+        pipe = provider.create(inputs).outs
+
+        database = database_provider.update("test_db", database, {"name": "new_db"}).outs
+        inputs = {**inputs, "database": database["name"]}
+        diff = provider.diff("test_pipe", pipe, inputs)
+        pipe = provider.update("test_pipe", pipe, inputs).outs
+
+        self.assertTrue(diff.changes)
+        self.assertEqual(diff.replaces, [])
+        self.assertEqual(pipe["full_name"], "new_db.public.test_pipe")
+        self.assertIsNotNone(client.catalog.get(PIPE, "new_db.public.test_pipe"))
+
+    def test_when_database_renamed_and_code_changed_then_pipe_replaced_in_new_database(self):
+        client = FakeClient()
+        database_provider = DatabaseProvider(self.get_mock_provider(), client)
+        provider = PipeProvider(self.get_mock_provider(), client)
+        database = database_provider.create({"name": "test_db"}).outs
+        client.catalog.execute("CREATE TABLE test_db.public.test_table (id INT)")
+        client.catalog.execute("CREATE STAGE test_db.public.test_stage")
+        inputs = {"name": "test_pipe", "database": "test_db", "schema": "public",
+                  "code": "COPY INTO test_db.public.test_table FROM @test_db.public.test_stage"}
+        pipe = provider.create(inputs).outs
+
+        database = database_provider.update("test_db", database, {"name": "new_db"}).outs
+        inputs = {**inputs, "database": database["name"],
+                  "code": "COPY INTO new_db.public.test_table FROM @new_db.public.test_stage"}
+        diff = provider.diff("test_pipe", pipe, inputs)
+        provider.delete("test_pipe", pipe)
+        provider.create(inputs)
+
+        self.assertEqual(diff.replaces, ["code"])
+        self.assertEqual(client.catalog.get(PIPE, "new_db.public.test_pipe").definition,
+                         inputs["code"])
+
     # HELPERS
 
     def get_mock_connection_provider(self, mock_cursor):
@@ -1,3 +1,4 @@
+import io
 import unittest
 from unittest.mock import Mock, call
 
@@ -410,6 +411,31 @@ class BaseDynamicProviderTests(unittest.TestCase):
             "database": "test_input_db"
         })
 
+    def test_when_create_statement_written_to_stream_then_default_chunks_contain_statement(self):
+        provider = TestProvider(self.get_mock_provider(), Mock())
+        stream = io.StringIO()
+
+        written = provider.write_sql_create_statement("test_name", {"database": "test_db"}, stream)
+
+        self.assertEqual(stream.getvalue(), "CREATE TESTOBJECT test_db..test_name")
+        self.assertEqual(written, len(stream.getvalue()))
+
+    def test_when_create_generates_multiple_statements_then_chunks_separate_them(self):
+        class TestMultiProvider(BaseDynamicProvider):
+            def __init__(self, provider_params, connection_provider):
+                super().__init__(provider_params, connection_provider, "TestMulti")
+
+            def generate_sql_create_statement(self, name, inputs, environment):
+                return [f"CREATE TESTOBJECT {name}",
+                        f"GRANT USAGE ON TESTOBJECT {name} TO ROLE test_role"]
+
+        provider = TestMultiProvider(self.get_mock_provider(), Mock())
+
+        chunks = list(provider.generate_sql_create_chunks("test_name", {}))
+
+        self.assertEqual(chunks, ["CREATE TESTOBJECT test_name;\n"
+                                  "GRANT USAGE ON TESTOBJECT test_name TO ROLE test_role"])
+
     # HELPERS
 
     def get_mock_provider(self):
@@ -0,0 +1,209 @@
+import unittest
+from unittest.mock import Mock, call, patch
+
+from pulumi_snowflake.baseprovider import BaseDynamicProvider
+from pulumi_snowflake.baseprovider.retry import RetryPolicy, retry_stats
+
+
+class OperationalError(Exception):
+    pass
+
+
+class TestProvider(BaseDynamicProvider):
+
+    retry_policy = RetryPolicy(max_attempts=3, base_delay=0)
+
+    def __init__(self, provider_params, connection_provider):
+        super().__init__(provider_params, connection_provider, "Test")
+
+    def generate_sql_create_statement(self, name, inputs, environment):
+        full_name = self._get_full_object_name(inputs, name)
+        return [
+            f"CREATE TESTOBJECT {full_name}",
+            f"GRANT USAGE ON TESTOBJECT {full_name} TO ROLE test_role"
+        ]
+
+    def generate_sql_drop_statement(self, name, inputs, environment):
+        return [f"DROP TESTOBJECT {self._get_full_object_name(inputs, name)}"]
+
+
+class BaseDynamicProviderExecuteTests(unittest.TestCase):
+
+    def test_when_create_returns_list_then_statements_sent_in_one_request(self):
+        mock_cursor = self.get_mock_cursor()
+        mock_connection_provider = self.get_mock_connection_provider(mock_cursor)
+
+        provider = TestProvider(self.get_mock_provider(), mock_connection_provider)
+        provider.create({
+            "name": "test_name",
+            "resource_name": "test_resource_name"
+        })
+
+        mock_cursor.execute.assert_called_once_with(
+            "CREATE TESTOBJECT test_name;\n"
+            "GRANT USAGE ON TESTOBJECT test_name TO ROLE test_role",
+            _statement_params={"MULTI_STATEMENT_COUNT": 2}
+        )
+        mock_connection_provider.get.assert_called_once()
+
+    def test_when_drop_returns_list_with_one_statement_then_executed_directly(self):
+        mock_cursor = self.get_mock_cursor()
+        mock_connection_provider = self.get_mock_connection_provider(mock_cursor)
+
+        provider = TestProvider(self.get_mock_provider(), mock_connection_provider)
+        provider.delete("test_name", {"name": "test_name"})
+
+        mock_cursor.execute.assert_called_once_with("DROP TESTOBJECT test_name")
+
+    def test_when_statements_executed_then_results_reported_per_statement(self):
+        mock_cursor = self.get_mock_cursor()
+        mock_cursor.sfqid = "query-1"
+
+        def next_set():
+            mock_cursor.sfqid = "query-2"
+            return mock_cursor
+
+        mock_cursor.nextset.side_effect = next_set
+
+        provider = TestProvider(self.get_mock_provider(),
+                                self.get_mock_connection_provider(mock_cursor))
+        results = provider._execute_sql(["CREATE TESTOBJECT a", "CREATE TESTOBJECT b"])
+
+        self.assertEqual([result.statement for result in results],
+                         ["CREATE TESTOBJECT a", "CREATE TESTOBJECT b"])
+        self.assertEqual([result.query_id for result in results], ["query-1", "query-2"])
+
+    def test_when_statement_fails_then_connection_closed(self):
+        mock_cursor = self.get_mock_cursor()
+        mock_cursor.execute.side_effect = Exception("Statement failed")
+        mock_connection_provider = self.get_mock_connection_provider(mock_cursor)
+
+        provider = TestProvider(self.get_mock_provider(), mock_connection_provider)
+
+        self.assertRaises(Exception, provider._execute_sql, "CREATE TESTOBJECT a")
+        mock_cursor.close.assert_called_once()
+        mock_connection_provider.get.return_value.close.assert_called_once()
+
+    def test_when_no_statements_then_nothing_executed(self):
+        mock_connection_provider = self.get_mock_connection_provider(self.get_mock_cursor())
+
+        provider = TestProvider(self.get_mock_provider(), mock_connection_provider)
+
+        self.assertEqual(provider._execute_sql([]), [])
+        mock_connection_provider.get.assert_not_called()
+
+    def test_when_transient_error_then_statement_retried_idempotently(self):
+        mock_cursor = self.get_mock_cursor()
+        mock_cursor.execute.side_effect = [OperationalError("Connection reset by peer"), None]
+        mock_connection_provider = self.get_mock_connection_provider(mock_cursor)
+
+        provider = TestProvider(self.get_mock_provider(), mock_connection_provider)
+        provider._execute_sql("CREATE TESTOBJECT test_name")
+
+        mock_cursor.execute.assert_has_calls([
+            call("CREATE TESTOBJECT test_name"),
+            call("CREATE TESTOBJECT IF NOT EXISTS test_name")
+        ])
+
+    def test_when_transient_error_then_session_invalidated(self):
+        mock_cursor = self.get_mock_cursor()
+        mock_cursor.execute.side_effect = [OperationalError("Session expired"), None]
+        mock_connection_provider = self.get_mock_connection_provider(mock_cursor)
+
+        provider = TestProvider(self.get_mock_provider(), mock_connection_provider)
+        provider._execute_sql("DROP TESTOBJECT test_name")
+
+        mock_connection_provider.get.return_value.invalidate.assert_called_once()
+
+    def test_when_transient_error_then_retry_recorded(self):
+        retry_stats.reset()
+        mock_cursor = self.get_mock_cursor()
+        mock_cursor.execute.side_effect = [OperationalError("Throttled"),
+                                           OperationalError("Throttled"), None]
+
+        provider = TestProvider(self.get_mock_provider(),
+                                self.get_mock_connection_provider(mock_cursor))
+        provider._execute_sql("DROP TESTOBJECT test_name")
+
+        self.assertEqual(retry_stats.retries, 2)
+        self.assertEqual(retry_stats.exhausted, 0)
+
+    @patch("pulumi_snowflake.baseprovider.base_dynamic_provider.info")
+    def test_when_retried_statement_succeeds_then_cumulative_retries_logged(self, mock_info):
+        retry_stats.reset()
+        mock_cursor = self.get_mock_cursor()
+        mock_cursor.execute.side_effect = [OperationalError("Throttled"), None]
+
+        provider = TestProvider(self.get_mock_provider(),
+                                self.get_mock_connection_provider(mock_cursor))
+        provider._execute_sql("DROP TESTOBJECT test_name")
+
+        mock_info.assert_called_with("Statement for Test succeeded after 2 attempts: 1 retries "
+                                     "and 0 exhausted statements in this process so far, "
+                                     "0.0s lost")
+
+    def test_when_transient_error_persists_then_raised_after_max_attempts(self):
+        retry_stats.reset()
+        mock_cursor = self.get_mock_cursor()
+        mock_cursor.execute.side_effect = OperationalError("Connection reset by peer")
+
+        provider = TestProvider(self.get_mock_provider(),
+                                self.get_mock_connection_provider(mock_cursor))
+
+        self.assertRaises(OperationalError, provider._execute_sql, "DROP TESTOBJECT test_name")
+        self.assertEqual(mock_cursor.execute.call_count, 3)
+        self.assertEqual(retry_stats.exhausted, 1)
+
+    def test_when_transient_error_after_non_replayable_statement_sent_then_not_retried(self):
+        mock_cursor = self.get_mock_cursor()
+        mock_cursor.execute.side_effect = [OperationalError("Connection reset by peer"), None]
+
+        provider = TestProvider(self.get_mock_provider(),
+                                self.get_mock_connection_provider(mock_cursor))
+
+        self.assertRaises(OperationalError, provider._execute_sql,
+                          ["ALTER TESTOBJECT test_name RENAME TO new_name",
+                           "ALTER TESTOBJECT new_name SET COMMENT = 'a'"])
+        self.assertEqual(mock_cursor.execute.call_count, 1)
+
+    def test_when_transient_error_before_non_replayable_statement_sent_then_retried(self):
+        mock_cursor = self.get_mock_cursor()
+        mock_connection_provider = self.get_mock_connection_provider(mock_cursor)
+        mock_connection_provider.get.side_effect = [OperationalError("Failed to connect"),
+                                                    mock_connection_provider.get.return_value]
+
+        provider = TestProvider(self.get_mock_provider(), mock_connection_provider)
+        provider._execute_sql("ALTER TESTOBJECT test_name RENAME TO new_name")
+
+        mock_cursor.execute.assert_called_once_with(
+            "ALTER TESTOBJECT test_name RENAME TO new_name")
+
+    def test_when_fatal_error_then_not_retried(self):
+        mock_cursor = self.get_mock_cursor()
+        mock_cursor.execute.side_effect = Exception("SQL compilation error")
+
+        provider = TestProvider(self.get_mock_provider(),
+                                self.get_mock_connection_provider(mock_cursor))
+
+        self.assertRaises(Exception, provider._execute_sql, "DROP TESTOBJECT test_name")
+        self.assertEqual(mock_cursor.execute.call_count, 1)
+
+    # HELPERS
+
+    def get_mock_cursor(self):
+        mock_cursor = Mock()
+        mock_cursor.nextset.return_value = None
+        return mock_cursor
+
+    def get_mock_provider(self):
+        mock_provider = Mock()
+        mock_provider.database = None
+        mock_provider.schema = None
+        return mock_provider
+
+    def get_mock_connection_provider(self, mock_cursor):
+        mock_connection = Mock()
+        mock_connection.cursor.return_value = mock_cursor
+        mock_connection_provider = Mock()
+        mock_connection_provider.get.return_value = mock_connection
+        return mock_connection_provider
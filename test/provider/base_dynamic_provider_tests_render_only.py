@@ -0,0 +1,183 @@
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from pulumi.dynamic import Config, ConfigureRequest
+
+from pulumi_snowflake.baseprovider import BaseDynamicProvider
+from pulumi_snowflake.table import TableProvider
+from pulumi_snowflake.table.column import Column
+from test.providers import get_test_provider
+
+
+class TestProvider(BaseDynamicProvider):
+
+    def __init__(self, provider_params, connection_provider):
+        super().__init__(provider_params, connection_provider, "Test")
+
+    def generate_sql_create_statement(self, name, inputs, environment):
+        return f"CREATE TESTOBJECT {self._get_full_object_name(inputs, name)}"
+
+    def generate_sql_drop_statement(self, name, inputs, environment):
+        return f"DROP TESTOBJECT {self._get_full_object_name(inputs, name)}"
+
+    def generate_sql_update_statements(self, name, olds, news, environment):
+        full_name = self._get_full_object_name(news, name)
+        return [f"ALTER TESTOBJECT {full_name} SET COMMENT = '{news['comment']}'"]
+
+
+class BaseDynamicProviderRenderOnlyTests(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.plan_file = os.path.join(directory.name, "plan.sql")
+
+    def test_when_render_only_then_operations_written_to_plan_file_and_placeholders_returned(self):
+        mock_connection_provider = Mock()
+        provider = TestProvider(self.get_mock_provider(self.plan_file), mock_connection_provider)
+        olds = {"name": "test_name", "database": "test_db"}
+
+        create_result = provider.create({"name": "test_name", "database": "test_db"})
+        update_result = provider.update("test_name", olds,
+                                        {"database": "test_db", "comment": "test"})
+
+        self.assertRaises(Exception, provider.delete, "test_name", {"database": "test_db"})
+        self.assertTrue(create_result.outs[BaseDynamicProvider.PLACEHOLDER_OUTPUT])
+        self.assertEqual(update_result.outs, olds)
+        self.assertEqual(self.read_plan_file(),
+                         "CREATE TESTOBJECT test_db..test_name;\n\n"
+                         "ALTER TESTOBJECT test_db..test_name SET COMMENT = 'test';\n\n"
+                         "DROP TESTOBJECT test_db..test_name;\n\n")
+        mock_connection_provider.get.assert_not_called()
+
+    def test_when_placeholder_deployed_then_replaced_without_drop(self):
+        render_only_provider = TestProvider(self.get_mock_provider(self.plan_file), Mock())
+        placeholder = render_only_provider.create({"name": "test_name"}).outs
+        mock_connection_provider = Mock()
+        provider = TestProvider(None, mock_connection_provider)
+
+        diff = provider.diff("test_name", placeholder, {"name": "test_name"})
+        provider.delete("test_name", placeholder)
+
+        self.assertEqual(diff.replaces, [BaseDynamicProvider.PLACEHOLDER_OUTPUT])
+        self.assertTrue(diff.delete_before_replace)
+        mock_connection_provider.get.assert_not_called()
+
+    def test_when_render_only_on_review_stack_then_operations_recorded(self):
+        mock_connection_provider = Mock()
+        provider = TestProvider(self.get_mock_provider(self.plan_file, review_stack=True),
+                                mock_connection_provider)
+
+        result = provider.create({"name": "test_name", "database": "test_db"})
+        provider.delete("test_name", {"database": "test_db"})
+
+        self.assertEqual(result.id, "test_name")
+        self.assertNotIn(BaseDynamicProvider.PLACEHOLDER_OUTPUT, result.outs)
+        self.assertEqual(self.read_plan_file(), "CREATE TESTOBJECT test_db..test_name;\n\n"
+                                                "DROP TESTOBJECT test_db..test_name;\n\n")
+        mock_connection_provider.get.assert_not_called()
+
+    def test_when_render_only_then_executed_statements_written_to_plan_file(self):
+        mock_connection_provider = Mock()
+        provider = TestProvider(self.get_mock_provider(self.plan_file), mock_connection_provider)
+
+        results = provider._execute_sql(["ALTER TESTOBJECT test_name SET COMMENT = 'a'",
+                                         "ALTER TESTOBJECT test_name UNSET TAG"])
+
+        self.assertEqual([result.query_id for result in results], [None, None])
+        self.assertEqual(self.read_plan_file(), "ALTER TESTOBJECT test_name SET COMMENT = 'a';\n\n"
+                                                "ALTER TESTOBJECT test_name UNSET TAG;\n\n")
+        mock_connection_provider.get.assert_not_called()
+
+    def test_when_render_only_then_table_create_streamed_to_plan_file(self):
+        provider = TableProvider(self.get_mock_provider(self.plan_file), Mock())
+        inputs = {"name": "test_table",
+                  "columns": [Column(f"col{index}", "INT").as_dict() for index in range(3)]}
+
+        provider.create(inputs)
+
+        statement = provider.generate_sql_create_statement("test_table", inputs, None)
+        self.assertEqual(self.read_plan_file(), statement.rstrip() + ";\n\n")
+
+    @patch("pulumi_snowflake.baseprovider.sql_plan.info")
+    def test_when_render_only_without_plan_file_then_statements_written_to_log(self, mock_info):
+        provider = TestProvider(self.get_mock_provider(None), Mock())
+
+        provider._execute_sql("DROP TESTOBJECT test_name")
+
+        mock_info.assert_called_with("DROP TESTOBJECT test_name;")
+
+    def test_when_stack_render_only_then_pickled_provider_which_is_not_does_not_execute(self):
+        mock_connection_provider = Mock()
+        provider = pickle.loads(pickle.dumps(TestProvider(get_test_provider(), None)))
+        provider.connection_provider = mock_connection_provider
+
+        provider.configure(self.get_configure_request({"snowflakeRenderOnly": "true",
+                                                       "snowflakeSqlPlanFile": self.plan_file}))
+
+        self.assertRaises(Exception, provider.delete, "test_name", {"database": "test_db"})
+        self.assertEqual(self.read_plan_file(), "DROP TESTOBJECT test_db..test_name;\n\n")
+        mock_connection_provider.get.assert_not_called()
+
+    def test_when_stack_not_render_only_then_pickled_render_only_provider_executes(self):
+        mock_connection_provider = Mock()
+        provider = TestProvider(self.get_mock_provider(self.plan_file), mock_connection_provider)
+
+        provider.configure(self.get_configure_request({"snowflakeRenderOnly": "false"}))
+        provider.delete("test_name", {"database": "test_db"})
+
+        self.assertFalse(os.path.exists(self.plan_file))
+        mock_connection_provider.get.return_value.cursor.return_value.execute \
+            .assert_called_once_with("DROP TESTOBJECT test_db..test_name")
+
+    def test_when_stack_config_has_no_render_only_then_provider_parameters_used(self):
+        provider = TestProvider(self.get_mock_provider(self.plan_file), Mock())
+
+        provider.configure(self.get_configure_request({}))
+        provider.create({"name": "test_name"})
+
+        self.assertEqual(self.read_plan_file(), "CREATE TESTOBJECT test_name;\n\n")
+
+    def test_when_render_only_then_connector_never_imported(self):
+        code = "\n".join([
+            "import pickle, sys",
+            "from pulumi_snowflake import Client, Provider",
+            "from pulumi_snowflake.database import DatabaseProvider",
+            f"params = Provider(account_name='test_account', render_only=True, "
+            f"sql_plan_file={self.plan_file!r})",
+            "provider = pickle.loads(pickle.dumps(DatabaseProvider(params, Client(params))))",
+            "provider.create({'name': 'test_db'})",
+            "provider._execute_sql('DROP DATABASE test_db')",
+            "print('snowflake.connector' in sys.modules)",
+        ])
+
+        process = subprocess.run([sys.executable, "-c", code], stdout=subprocess.PIPE,
+                                 universal_newlines=True, check=True)
+
+        self.assertEqual(process.stdout.strip(), "False")
+        self.assertEqual(self.read_plan_file(),
+                         "CREATE DATABASE test_db;\n\nDROP DATABASE test_db;\n\n")
+
+    # HELPERS
+
+    def get_mock_provider(self, plan_file, review_stack=False):
+        mock_provider = Mock()
+        mock_provider.database = None
+        mock_provider.schema = None
+        mock_provider.render_only = True
+        mock_provider.render_only_review_stack = review_stack
+        mock_provider.sql_plan_file = plan_file
+        return mock_provider
+
+    def get_configure_request(self, config):
+        raw_config = {f"test_project:{key}": value for (key, value) in config.items()}
+        return ConfigureRequest(Config(raw_config, "test_project"))
+
+    def read_plan_file(self):
+        with open(self.plan_file) as file:
+            return file.read()
@@ -0,0 +1,91 @@
+import collections
+import enum
+import random
+import unittest
+
+from pulumi_snowflake.baseprovider.filters import to_sql, list_to_sql, dict_to_sql
+from pulumi_snowflake.validation import Validation
+
+
+def previous_to_sql(value):
+    """
+    The conversion before the filters used a dispatch table and joined fast paths.
+    """
+    if value is None:
+        return None
+    elif isinstance(value, str):
+        Validation.validate_string(value)
+        return f"'{value}'"
+    elif isinstance(value, dict):
+        valid_keys = list(filter(lambda k: value[k] is not None, value.keys()))
+        return "(" + ",".join(f"{key.upper()} = {previous_to_sql(value[key])}"
+                              for key in valid_keys) + ")"
+    elif isinstance(value, list):
+        return "(" + ",".join(map(previous_to_sql, value)) + ")"
+    elif isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    elif isinstance(value, (int, float)):
+        return f"{int(value) if int(value) == value else value}"
+    else:
+        raise Exception(f"Cannot convert type '{type(value)}' to SQL representation")
+
+
+class Size(enum.IntEnum):
+    SMALL = 1
+
+
+class FiltersTests(unittest.TestCase):
+
+    def test_when_string_list_converted_then_quoted_and_joined(self):
+        self.assertEqual(list_to_sql(["", "NULL", "it\\'s"]), "('','NULL','it\\'s')")
+        self.assertEqual(list_to_sql([]), "()")
+
+    def test_when_string_list_contains_invalid_string_then_raises_exception(self):
+        with self.assertRaises(Exception) as context:
+            list_to_sql(["valid", "in'valid"])
+
+        self.assertEqual(str(context.exception), "Invalid Snowflake string: in'valid")
+
+    def test_when_string_list_item_ends_with_backslash_then_raises_exception(self):
+        self.assertRaises(Exception, list_to_sql, ["valid\\", "valid"])
+
+    def test_when_mixed_list_converted_then_each_item_converted_by_type(self):
+        self.assertEqual(list_to_sql(["a", 1, 2.0, True, ["b"], {"k": "v"}]),
+                         "('a',1,2,TRUE,('b'),(K = 'v'))")
+
+    def test_when_dict_converted_then_none_values_skipped(self):
+        self.assertEqual(dict_to_sql({"on_error": "CONTINUE", "purge": None, "size_limit": 10}),
+                         "(ON_ERROR = 'CONTINUE',SIZE_LIMIT = 10)")
+
+    def test_when_subclass_of_supported_type_converted_then_converted_as_base_type(self):
+        self.assertEqual(to_sql(collections.OrderedDict(a=1)), "(A = 1)")
+        self.assertEqual(to_sql(Size.SMALL), "1")
+
+    def test_when_unsupported_type_converted_then_raises_exception(self):
+        self.assertRaises(Exception, to_sql, object())
+
+    def test_when_random_values_converted_then_same_as_previous_conversion(self):
+        generator = random.Random(0)
+
+        def random_value(depth=0):
+            choice = generator.randrange(7 if depth < 2 else 4)
+
+            if choice == 0:
+                return generator.choice(["", "a", "it\\'s", "multi\nline", "s3://bucket/"])
+            elif choice == 1:
+                return generator.choice([0, 1, -5, 2.0, 2.5])
+            elif choice == 2:
+                return generator.choice([True, False])
+            elif choice == 3:
+                return [generator.choice(["x", "y\\'z", ""])
+                        for _ in range(generator.randrange(4))]
+            elif choice == 4:
+                return [random_value(depth + 1) for _ in range(generator.randrange(4))]
+            elif choice == 5:
+                return {f"key_{i}": random_value(depth + 1) for i in range(generator.randrange(4))}
+            else:
+                return {"ignored": None, "kept": random_value(depth + 1)}
+
+        for _ in range(2000):
+            value = random_value()
+            self.assertEqual(to_sql(value), previous_to_sql(value), value)
@@ -2,9 +2,19 @@ import unittest
 
 from jinja2.environment import Environment
 
+from pulumi_snowflake.baseprovider import BaseDynamicProvider
 from pulumi_snowflake.baseprovider.filters import to_sql, to_identifier
 
 
+class CountingProvider(BaseDynamicProvider):
+
+    created_environments = 0
+
+    def _create_jinja_environment(self):
+        CountingProvider.created_environments += 1
+        return super()._create_jinja_environment()
+
+
 class JinjaEnvironmentTests(unittest.TestCase):
 
     def test_when_str_converted_to_sql_then_is_correct_syntax(self):
@@ -80,6 +90,15 @@ class JinjaEnvironmentTests(unittest.TestCase):
 
         self.assertEqual(sql, "(ITEM1 = 'val1',ITEM2 = (SUB1 = 'v2'),ITEM3 = ('l1','l2'),ITEM4 = 45)")
 
+    def test_when_providers_of_a_class_get_environment_then_created_once_and_shared(self):
+        first = CountingProvider(None, None, "Test")
+        second = CountingProvider(None, None, "Test")
+
+        environment = first._get_jinja_environment()
+
+        self.assertIs(second._get_jinja_environment(), environment)
+        self.assertIs(environment.filters["sql"], to_sql)
+        self.assertEqual(CountingProvider.created_environments, 1)
 
     # HELPERS
 
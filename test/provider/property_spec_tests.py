@@ -0,0 +1,117 @@
+import random
+import unittest
+
+from pulumi_snowflake.baseprovider.properties import ClauseBuilder, PropertyKind, PropertySpec
+from pulumi_snowflake.database import database_provider, DatabaseProvider
+from pulumi_snowflake.fileformat import file_format_provider, FileFormatProvider
+from pulumi_snowflake.pipe import pipe_provider, PipeProvider
+from pulumi_snowflake.schema import schema_provider, SchemaProvider
+from pulumi_snowflake.stage import stage_provider, StageProvider
+from pulumi_snowflake.storageintegration import storage_integration_provider, \
+    StorageIntegrationProvider
+from pulumi_snowflake.table import table_provider, TableProvider
+from pulumi_snowflake.warehouse import warehouse_provider, WarehouseProvider
+
+from .reference_templates import CREATE_TEMPLATES
+
+SAMPLE_VALUES = {
+    PropertyKind.STRING: ["test_value", "", "it\\'s", 7],
+    PropertyKind.NUMBER: [0, 1, 2.0, 2.5, "60"],
+    PropertyKind.BOOL: [True, False, "true"],
+    PropertyKind.LIST: [["a", "b"], [], ["", 1, True]],
+    PropertyKind.DICT: [{"on_error": "CONTINUE", "size_limit": 10, "purge": None}, {},
+                        {"type": "CSV"}],
+    PropertyKind.IDENTIFIER: ["test_share", "test share"],
+}
+
+
+class PropertySpecTests(unittest.TestCase):
+
+    def test_when_value_false_then_emitted_only_if_emit_when_false(self):
+        builder = ClauseBuilder(
+            PropertySpec("enabled", "ENABLED", PropertyKind.BOOL, emit_when_false=True),
+            PropertySpec("count", "COUNT", PropertyKind.NUMBER)
+        )
+
+        self.assertEqual(builder.render({"enabled": False, "count": 0}), "ENABLED = FALSE\n")
+        self.assertEqual(builder.render({"enabled": "true", "count": 3}), "COUNT = 3\n")
+
+    def test_when_value_not_of_expected_kind_then_converted_by_type(self):
+        builder = ClauseBuilder(PropertySpec("value", "VALUE", PropertyKind.STRING))
+
+        self.assertEqual(builder.render({"value": ["a", 1]}), "VALUE = ('a',1)\n")
+
+    def test_when_kind_invalid_then_error_raised(self):
+        self.assertRaises(Exception, ClauseBuilder, PropertySpec("value", "VALUE", "unknown"))
+
+    def test_when_properties_compared_then_changed_set_and_removed_unset(self):
+        builder = ClauseBuilder(
+            PropertySpec("enabled", "ENABLED", PropertyKind.BOOL, emit_when_false=True),
+            PropertySpec("count", "COUNT", PropertyKind.NUMBER),
+            PropertySpec("comment", "COMMENT", PropertyKind.STRING),
+            PropertySpec("size", "SIZE", PropertyKind.STRING)
+        )
+
+        (clauses, keywords) = builder.render_changes(
+            {"enabled": True, "count": 1, "comment": "test", "size": "SMALL"},
+            {"enabled": False, "count": 1, "size": "LARGE"}
+        )
+
+        self.assertEqual(clauses, ["ENABLED = FALSE", "SIZE = 'LARGE'"])
+        self.assertEqual(keywords, ["COMMENT"])
+
+    def test_when_number_changed_to_zero_then_set_rather_than_unset(self):
+        builder = ClauseBuilder(PropertySpec("count", "COUNT", PropertyKind.NUMBER))
+
+        self.assertEqual(builder.render_changes({"count": 1}, {"count": 0}), (["COUNT = 0"], []))
+        self.assertEqual(builder.render_changes({"count": 0}, {}), ([], ["COUNT"]))
+
+    def test_when_properties_rendered_then_identical_to_templates(self):
+        cases = [
+            (DatabaseProvider, database_provider, {"transient": [True, False]}),
+            (SchemaProvider, schema_provider,
+             {"transient": [True, False], "database": ["test_db"]}),
+            (FileFormatProvider, file_format_provider,
+             {"database": ["test_db"], "schema": ["test_schema"]}),
+            (StageProvider, stage_provider, {"temporary": [True, None], "database": ["test_db"]}),
+            (StorageIntegrationProvider, storage_integration_provider, {}),
+            (PipeProvider, pipe_provider, {"code": ["COPY INTO t FROM @s", None]}),
+            (WarehouseProvider, warehouse_provider, {}),
+            (TableProvider, table_provider, {
+                "temporary": [True, False],
+                "cluster_by": [["a", "b"], [], "c"],
+                "columns": [
+                    [],
+                    [{"name": "id", "type": "NUMBER(38,0)"}],
+                    [{"name": "id", "type": "INT", "autoincrement": True, "primary_key": True},
+                     {"name": "name col", "type": "VARCHAR", "collation": "en-ci",
+                      "default": "'x'", "not_null": True, "unique": True},
+                     {"name": "data", "type": None, "default": ""}],
+                ],
+            }),
+        ]
+        generator = random.Random(0)
+
+        for (provider_class, module, extra_values) in cases:
+            provider = provider_class(None, None)
+            environment = provider._create_jinja_environment()
+            template = environment.from_string(CREATE_TEMPLATES[provider_class])
+            value_choices = {spec.name: SAMPLE_VALUES[spec.kind]
+                             for spec in module.PROPERTIES.specs}
+            value_choices.update(extra_values)
+
+            for _ in range(200):
+                inputs = {
+                    name: generator.choice(choices)
+                    for (name, choices) in value_choices.items()
+                    if generator.random() < 0.6
+                }
+
+                expected = template.render({
+                    **inputs,
+                    "full_name": provider._get_full_object_name(inputs, "test_name"),
+                    "resource_type": provider.resource_type
+                })
+
+                self.assertEqual(provider.generate_sql_create_statement("test_name", inputs, None),
+                                 expected, f"{provider_class.__name__} inputs: {inputs}")
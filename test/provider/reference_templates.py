@@ -0,0 +1,208 @@
+"""
+The Jinja templates from which the built-in providers used to render their CREATE statements.
+Providers now render them from property specs (see `pulumi_snowflake.baseprovider.properties`), and
+these templates are kept only as the reference which that output is tested against.  Each template
+is rendered with the resource inputs, `full_name` and `resource_type`, in an environment with the
+SQL filters (see `BaseDynamicProvider._create_jinja_environment`).
+"""
+from pulumi_snowflake.database import DatabaseProvider
+from pulumi_snowflake.fileformat import FileFormatProvider
+from pulumi_snowflake.pipe import PipeProvider
+from pulumi_snowflake.schema import SchemaProvider
+from pulumi_snowflake.stage import StageProvider
+from pulumi_snowflake.storageintegration import StorageIntegrationProvider
+from pulumi_snowflake.table import TableProvider
+from pulumi_snowflake.warehouse import WarehouseProvider
+
+
+DATABASE_TEMPLATE = """CREATE{% if transient %} TRANSIENT{% endif %} {{ resource_type | upper }} {{ full_name }}
+{% if share %}FROM SHARE {{ share | sql_identifier }}
+{% endif %}
+{%- if data_retention_time_in_days %}DATA_RETENTION_TIME_IN_DAYS = {{ data_retention_time_in_days | sql }}
+{% endif %}
+{%- if comment %}COMMENT = {{ comment | sql }}
+{% endif %}
+"""  # noqa: E501
+
+
+SCHEMA_TEMPLATE = """CREATE{% if transient %} TRANSIENT{% endif %} {{ resource_type | upper }} {{ full_name }}
+{% if data_retention_time_in_days %}DATA_RETENTION_TIME_IN_DAYS = {{ data_retention_time_in_days | sql }}
+{% endif %}
+{%- if comment %}COMMENT = {{ comment | sql }}
+{% endif %}
+"""  # noqa: E501
+
+
+FILE_FORMAT_TEMPLATE = """CREATE {{ resource_type | upper }} {{ full_name }}
+{% if type %}TYPE = {{ type | sql }}
+{% endif %}
+{%- if compression %}COMPRESSION = {{ compression | sql }}
+{% endif %}
+{%- if record_delimiter %}RECORD_DELIMITER = {{ record_delimiter | sql }}
+{% endif %}
+{%- if field_delimiter %}FIELD_DELIMITER = {{ field_delimiter | sql }}
+{% endif %}
+{%- if file_extension %}FILE_EXTENSION = {{ file_extension | sql }}
+{% endif %}
+{%- if skip_header %}SKIP_HEADER = {{ skip_header | sql }}
+{% endif %}
+{%- if skip_blank_lines is boolean %}SKIP_BLANK_LINES = {{ skip_blank_lines | sql }}
+{% endif %}
+{%- if date_format %}DATE_FORMAT = {{ date_format | sql }}
+{% endif %}
+{%- if time_format %}TIME_FORMAT = {{ time_format | sql }}
+{% endif %}
+{%- if timestamp_format %}TIMESTAMP_FORMAT = {{ timestamp_format | sql }}
+{% endif %}
+{%- if binary_format %}BINARY_FORMAT = {{ binary_format | sql }}
+{% endif %}
+{%- if escape %}ESCAPE = {{ escape | sql }}
+{% endif %}
+{%- if escape_unenclosed_field %}ESCAPE_UNENCLOSED_FIELD = {{ escape_unenclosed_field | sql }}
+{% endif %}
+{%- if trim_space is boolean %}TRIM_SPACE = {{ trim_space | sql }}
+{% endif %}
+{%- if field_optionally_enclosed_by %}FIELD_OPTIONALLY_ENCLOSED_BY = {{ field_optionally_enclosed_by | sql }}
+{% endif %}
+{%- if null_if %}NULL_IF = {{ null_if | sql }}
+{% endif %}
+{%- if error_on_column_count_mismatch is boolean %}ERROR_ON_COLUMN_COUNT_MISMATCH = {{ error_on_column_count_mismatch | sql }}
+{% endif %}
+{%- if replace_invalid_characters is boolean %}REPLACE_INVALID_CHARACTERS = {{ replace_invalid_characters | sql }}
+{% endif %}
+{%- if validate_utf8 is boolean %}VALIDATE_UTF8 = {{ validate_utf8 | sql }}
+{% endif %}
+{%- if empty_field_as_null is boolean %}EMPTY_FIELD_AS_NULL = {{ empty_field_as_null | sql }}
+{% endif %}
+{%- if skip_byte_order_mark is boolean %}SKIP_BYTE_ORDER_MARK = {{ skip_byte_order_mark | sql }}
+{% endif %}
+{%- if encoding %}ENCODING = {{ encoding | sql }}
+{% endif %}
+{%- if enable_octal is boolean %}ENABLE_OCTAL = {{ enable_octal | sql }}
+{% endif %}
+{%- if allow_duplicate is boolean %}ALLOW_DUPLICATE = {{ allow_duplicate | sql }}
+{% endif %}
+{%- if strip_outer_array is boolean %}STRIP_OUTER_ARRAY = {{ strip_outer_array | sql }}
+{% endif %}
+{%- if strip_null_values is boolean %}STRIP_NULL_VALUES = {{ strip_null_values | sql }}
+{% endif %}
+{%- if ignore_utf8_errors is boolean %}IGNORE_UTF8_ERRORS = {{ ignore_utf8_errors | sql }}
+{% endif %}
+{%- if binary_as_text is boolean %}BINARY_AS_TEXT = {{ binary_as_text | sql }}
+{% endif %}
+{%- if snappy_compression is boolean %}SNAPPY_COMPRESSION = {{ snappy_compression | sql }}
+{% endif %}
+{%- if preserve_space is boolean %}PRESERVE_SPACE = {{ preserve_space | sql }}
+{% endif %}
+{%- if strip_outer_element is boolean %}STRIP_OUTER_ELEMENT = {{ strip_outer_element | sql }}
+{% endif %}
+{%- if disable_snowflake_data is boolean %}DISABLE_SNOWFLAKE_DATA = {{ disable_snowflake_data | sql }}
+{% endif %}
+{%- if disable_auto_convert is boolean %}DISABLE_AUTO_CONVERT = {{ disable_auto_convert | sql }}
+{% endif %}
+{%- if comment %}COMMENT = {{ comment | sql }}
+{% endif %}"""  # noqa: E501
+
+
+STAGE_TEMPLATE = """CREATE{% if temporary %} TEMPORARY{% endif %} {{ resource_type | upper }} {{ full_name }}
+{% if url %}URL = {{ url | sql }}
+{% endif %}
+{%- if storage_integration %}STORAGE_INTEGRATION = {{ storage_integration | sql }}
+{% endif %}
+{%- if credentials %}CREDENTIALS = {{ credentials | sql }}
+{% endif %}
+{%- if encryption %}ENCRYPTION = {{ encryption | sql }}
+{% endif %}
+{%- if file_format %}FILE_FORMAT = {{ file_format | sql }}
+{% endif %}
+{%- if copy_options %}COPY_OPTIONS = {{ copy_options | sql }}
+{% endif %}
+{%- if comment %}COMMENT = {{ comment | sql }}
+{% endif %}"""  # noqa: E501
+
+
+STORAGE_INTEGRATION_TEMPLATE = """CREATE {{ resource_type | upper }} {{ full_name }}
+{% if type %}TYPE = {{ type | sql }}
+{% endif %}
+{%- if storage_provider %}STORAGE_PROVIDER = {{ storage_provider | sql }}
+{% endif %}
+{%- if storage_aws_role_arn %}STORAGE_AWS_ROLE_ARN = {{ storage_aws_role_arn | sql }}
+{% endif %}
+{%- if enabled is boolean %}ENABLED = {{ enabled | sql }}
+{% endif %}
+{%- if storage_allowed_locations %}STORAGE_ALLOWED_LOCATIONS = {{ storage_allowed_locations | sql }}
+{% endif %}
+{%- if storage_blocked_locations %}STORAGE_BLOCKED_LOCATIONS = {{ storage_blocked_locations | sql }}
+{% endif %}
+{%- if azure_tenant_id %}AZURE_TENANT_ID = {{ azure_tenant_id | sql }}
+{% endif %}
+{%- if comment %}COMMENT = {{ comment | sql }}
+{% endif %}"""  # noqa: E501
+
+
+TABLE_TEMPLATE = """CREATE{% if temporary %} TEMPORARY{% endif %} {{ resource_type | upper }} {{ full_name }}
+(
+{% for column in columns %}  {{ column.name | sql_identifier }} {{ column.type }}
+  {%- if column.collation %} COLLATE {{ column.collation | sql }}{% endif %}
+  {%- if column.default %} DEFAULT {{ column.default }}{% endif %}
+  {%- if column.autoincrement %} AUTOINCREMENT{% endif %}
+  {%- if column.not_null %} NOT NULL{% endif %}
+  {%- if column.unique %} UNIQUE{% endif %}
+  {%- if column.primary_key %} PRIMARY KEY{% endif -%}
+  {{ "," if not loop.last }}
+{% endfor %})
+{% if cluster_by -%}
+CLUSTER BY ( {{ cluster_by | join(',') }} )
+{% endif %}
+{%- if data_retention_time_in_days %}DATA_RETENTION_TIME_IN_DAYS = {{ data_retention_time_in_days | sql }}
+{% endif %}
+{%- if comment %}COMMENT = {{ comment | sql }}
+{% endif %}
+"""  # noqa: E501
+
+
+PIPE_TEMPLATE = """CREATE {{ resource_type | upper }} {{ full_name }}
+{% if auto_ingest is boolean %}AUTO_INGEST = {{ auto_ingest | sql }}
+{% endif %}
+{%- if aws_sns_topic %}AWS_SNS_TOPIC = {{ aws_sns_topic | sql }}
+{% endif %}
+{%- if integration %}INTEGRATION = {{ integration | sql }}
+{% endif %}
+{%- if comment %}COMMENT = {{ comment | sql }}
+{% endif -%}
+AS {{ code }}
+"""
+
+
+WAREHOUSE_TEMPLATE = """CREATE {{ resource_type | upper }} {{ full_name }}
+{% if warehouse_size %}WAREHOUSE_SIZE = {{ warehouse_size | sql }}
+{% endif %}
+{%- if max_cluster_count %}MAX_CLUSTER_COUNT = {{ max_cluster_count | sql }}
+{% endif %}
+{%- if min_cluster_count %}MIN_CLUSTER_COUNT = {{ min_cluster_count | sql }}
+{% endif %}
+{%- if scaling_policy %}SCALING_POLICY = {{ scaling_policy | sql }}
+{% endif %}
+{%- if auto_suspend %}AUTO_SUSPEND = {{ auto_suspend | sql }}
+{% endif %}
+{%- if auto_resume is boolean %}AUTO_RESUME = {{ auto_resume | sql }}
+{% endif %}
+{%- if initially_suspended is boolean %}INITIALLY_SUSPENDED = {{ initially_suspended | sql }}
+{% endif %}
+{%- if comment %}COMMENT = {{ comment | sql }}
+{% endif %}"""
+
+
+CREATE_TEMPLATES = {
+    DatabaseProvider: DATABASE_TEMPLATE,
+    SchemaProvider: SCHEMA_TEMPLATE,
+    FileFormatProvider: FILE_FORMAT_TEMPLATE,
+    StageProvider: STAGE_TEMPLATE,
+    StorageIntegrationProvider: STORAGE_INTEGRATION_TEMPLATE,
+    TableProvider: TABLE_TEMPLATE,
+    PipeProvider: PIPE_TEMPLATE,
+    WarehouseProvider: WAREHOUSE_TEMPLATE,
+}
+"""
+The reference CREATE template of each built-in provider class.
+"""
@@ -0,0 +1,110 @@
+import unittest
+
+from pulumi_snowflake.baseprovider.retry import RetryPolicy, make_idempotent, is_replayable
+
+
+class DatabaseError(Exception):
+    def __init__(self, message, errno=None):
+        super().__init__(message)
+        self.errno = errno
+
+
+class OperationalError(DatabaseError):
+    pass
+
+
+class ProgrammingError(DatabaseError):
+    pass
+
+
+class NonRetryableTlsError(OperationalError):
+    pass
+
+
+class RetryPolicyTests(unittest.TestCase):
+
+    def test_when_operational_error_then_retryable(self):
+        self.assertTrue(RetryPolicy().is_retryable(OperationalError("Connection reset")))
+
+    def test_when_programming_error_then_not_retryable(self):
+        self.assertFalse(RetryPolicy().is_retryable(ProgrammingError("SQL compilation error")))
+
+    def test_when_session_expired_error_code_then_retryable(self):
+        self.assertTrue(RetryPolicy().is_retryable(DatabaseError("Session expired", errno=390112)))
+
+    def test_when_fatal_subclass_of_retryable_error_then_not_retryable(self):
+        self.assertFalse(RetryPolicy().is_retryable(NonRetryableTlsError("Certificate revoked")))
+
+    def test_when_builtin_connection_error_then_retryable(self):
+        self.assertTrue(RetryPolicy().is_retryable(ConnectionResetError()))
+
+    def test_when_generic_exception_then_not_retryable(self):
+        self.assertFalse(RetryPolicy().is_retryable(Exception("Invalid identifier")))
+
+    def test_when_delay_calculated_then_within_exponential_bound(self):
+        policy = RetryPolicy(base_delay=1, max_delay=5)
+
+        for retry in range(6):
+            delay = policy.get_delay(retry)
+            self.assertGreaterEqual(delay, 0)
+            self.assertLessEqual(delay, min(5, 2 ** retry))
+
+
+class MakeIdempotentTests(unittest.TestCase):
+
+    def test_when_create_statement_then_if_not_exists_added(self):
+        self.assertEqual(make_idempotent("CREATE DATABASE test_db\nCOMMENT = 'test'"),
+                         "CREATE DATABASE IF NOT EXISTS test_db\nCOMMENT = 'test'")
+
+    def test_when_create_statement_has_modifier_then_if_not_exists_after_object_type(self):
+        self.assertEqual(make_idempotent("CREATE TRANSIENT SCHEMA test_db.test_schema"),
+                         "CREATE TRANSIENT SCHEMA IF NOT EXISTS test_db.test_schema")
+
+    def test_when_object_type_has_two_words_then_if_not_exists_after_object_type(self):
+        self.assertEqual(make_idempotent("CREATE FILE FORMAT test_db.test_schema.test_ff"),
+                         "CREATE FILE FORMAT IF NOT EXISTS test_db.test_schema.test_ff")
+
+    def test_when_drop_statement_then_if_exists_added(self):
+        self.assertEqual(make_idempotent("DROP STORAGE INTEGRATION test_integration"),
+                         "DROP STORAGE INTEGRATION IF EXISTS test_integration")
+
+    def test_when_already_idempotent_then_unchanged(self):
+        for statement in [
+            "CREATE TRANSIENT DATABASE IF NOT EXISTS test_db",
+            "DROP TABLE IF EXISTS test_table"
+        ]:
+            self.assertEqual(make_idempotent(statement), statement)
+
+    def test_when_create_or_replace_then_unchanged(self):
+        self.assertEqual(make_idempotent("CREATE OR REPLACE TABLE test_table"),
+                         "CREATE OR REPLACE TABLE test_table")
+
+    def test_when_other_statement_then_unchanged(self):
+        self.assertEqual(make_idempotent("ALTER WAREHOUSE test_wh SET WAREHOUSE_SIZE = 'SMALL'"),
+                         "ALTER WAREHOUSE test_wh SET WAREHOUSE_SIZE = 'SMALL'")
+
+
+class IsReplayableTests(unittest.TestCase):
+
+    def test_when_statement_idempotent_or_only_sets_properties_then_replayable(self):
+        for statement in [
+            "CREATE DATABASE IF NOT EXISTS test_db",
+            "DROP FILE FORMAT IF EXISTS test_db.test_schema.test_ff",
+            "ALTER WAREHOUSE test_wh SET\nWAREHOUSE_SIZE = 'XSMALL'",
+            "ALTER SCHEMA test_db.test_schema UNSET COMMENT",
+            "ALTER TABLE \"test db\".test_schema.test_table ALTER COLUMN id SET DATA TYPE "
+            "NUMBER(38,0)",
+            "COMMIT"
+        ]:
+            self.assertTrue(is_replayable(statement), statement)
+
+    def test_when_statement_changes_structure_then_not_replayable(self):
+        for statement in [
+            "ALTER DATABASE test_db RENAME TO new_db",
+            "ALTER TABLE test_table RENAME COLUMN a TO b",
+            "ALTER TABLE test_table ADD COLUMN a INT",
+            "ALTER TABLE test_table DROP COLUMN a",
+            "CREATE DATABASE test_db",
+            "GRANT USAGE ON DATABASE test_db TO ROLE test_role"
+        ]:
+            self.assertFalse(is_replayable(statement), statement)
@@ -0,0 +1,23 @@
+from pulumi_snowflake import Provider
+
+
+def get_test_provider(**parameters) -> Provider:
+    """
+    Returns provider parameters for a client which logs in to a test account with a password.  The
+    parameters are built without reading stack config, so every other option keeps its class-level
+    default unless it is given as a keyword argument, and options which `Provider` does not define
+    raise `AttributeError` as they would in a real dynamic provider process.
+    """
+    provider = Provider.__new__(Provider)
+    provider.username = "test_user"
+    provider.password = "test_password"
+    provider.account_name = "test_account"
+    provider.role = "test_role"
+    provider.database = None
+    provider.schema = None
+    provider.stack = "test_project/test_stack"
+
+    for (name, value) in parameters.items():
+        setattr(provider, name, value)
+
+    return provider
@@ -2,11 +2,23 @@ import unittest
 
 from unittest.mock import Mock, call
 
+from pulumi_snowflake.baseprovider.renames import clear_renames
+from pulumi_snowflake.database import DatabaseProvider
 from pulumi_snowflake.schema import SchemaProvider
+from pulumi_snowflake.table import TableProvider
+from pulumi_snowflake.table.column import Column
+from pulumi_snowflake.testing import FakeClient
+from pulumi_snowflake.testing.catalog import DATABASE, SCHEMA, TABLE
 
 
 class SchemaProviderTests(unittest.TestCase):
 
+    def setUp(self):
+        clear_renames()
+
+    def tearDown(self):
+        clear_renames()
+
     def test_create_schema_simple_args(self):
         mock_cursor = Mock()
         mock_connection_provider = self.get_mock_connection_provider(mock_cursor)
@@ -122,6 +134,97 @@ class SchemaProviderTests(unittest.TestCase):
             ]))
         ])
 
+    def test_when_schema_renamed_then_rename_within_database(self):
+        mock_cursor = Mock()
+        mock_connection_provider = self.get_mock_connection_provider(mock_cursor)
+
+        provider = SchemaProvider(self.get_mock_provider(), mock_connection_provider)
+        provider.update("test_schema", {
+            "name": "test_schema",
+            "database": "test_db"
+        }, {
+            "name": "test_schema_renamed",
+            "database": "test_db",
+            "comment": "test_comment"
+        })
+
+        mock_cursor.execute.assert_called_once_with(";\n".join([
+            "ALTER SCHEMA test_db.test_schema RENAME TO test_db.test_schema_renamed",
+            "ALTER SCHEMA test_db.test_schema_renamed SET\nCOMMENT = 'test_comment'"
+        ]), _statement_params={"MULTI_STATEMENT_COUNT": 2})
+
+    def test_when_database_changed_then_schema_replaced(self):
+        provider = SchemaProvider(self.get_mock_provider(), Mock())
+
+        olds = {"name": "test_schema", "database": "test_db", "comment": "a"}
+
+        result = provider.diff("test_schema", olds,
+                               {"name": "test_schema", "database": "other_db", "comment": "b"})
+
+        self.assertEqual(result.replaces, ["database"])
+
+    def test_when_schema_updated_then_catalog_keeps_tables(self):
+        client = FakeClient()
+        client.catalog.execute("CREATE DATABASE test_db")
+        provider = SchemaProvider(self.get_mock_provider(), client)
+        outputs = provider.create({"name": "test_schema", "database": "test_db"}).outs
+        client.catalog.execute("CREATE TABLE test_db.test_schema.test_table (id INT)")
+
+        provider.update("test_schema", outputs, {"name": "test_schema", "database": "test_db",
+                                                 "data_retention_time_in_days": 7})
+
+        self.assertEqual(client.catalog.get(SCHEMA, "test_db.test_schema").properties,
+                         {"DATA_RETENTION_TIME_IN_DAYS": 7})
+        self.assertIsNotNone(client.catalog.get(TABLE, "test_db.test_schema.test_table"))
+
+    def test_when_database_renamed_then_schema_moved_without_replacement(self):
+        client = FakeClient()
+        database_provider = DatabaseProvider(self.get_mock_provider(), client)
+        schema_provider = SchemaProvider(self.get_mock_provider(), client)
+        database = database_provider.create({"name": "test_db"}).outs
+        schema = schema_provider.create({"name": "test_schema", "database": "test_db"}).outs
+        client.catalog.execute("CREATE TABLE test_db.test_schema.test_table (id INT)")
+
+        database_diff = database_provider.diff("test_db", database, {"name": "new_db"})
+        database = database_provider.update("test_db", database, {"name": "new_db"}).outs
+        schema_inputs = {"name": "test_schema", "database": database["name"]}
+        schema_diff = schema_provider.diff("test_schema", schema, schema_inputs)
+        schema = schema_provider.update("test_schema", schema, schema_inputs).outs
+        table = client.catalog.get(TABLE, "new_db.test_schema.test_table")
+        schema_provider.delete("test_schema", schema)
+        database_provider.delete("test_db", database)
+
+        self.assertEqual(database_diff.replaces, [])
+        self.assertTrue(schema_diff.changes)
+        self.assertEqual(schema_diff.replaces, [])
+        self.assertEqual(schema["database"], "new_db")
+        self.assertIsNotNone(table)
+        self.assertIsNone(client.catalog.get(SCHEMA, "new_db.test_schema"))
+        self.assertIsNone(client.catalog.get(DATABASE, "new_db"))
+
+    def test_when_database_and_schema_renamed_then_table_moved_without_replacement(self):
+        client = FakeClient()
+        database_provider = DatabaseProvider(self.get_mock_provider(), client)
+        schema_provider = SchemaProvider(self.get_mock_provider(), client)
+        table_provider = TableProvider(self.get_mock_provider(), client)
+        database = database_provider.create({"name": "test_db"}).outs
+        schema = schema_provider.create({"name": "test_schema", "database": "test_db"}).outs
+        table_inputs = {"name": "test_table", "database": "test_db", "schema": "test_schema",
+                        "columns": [Column("id", "INT").as_dict()]}
+        table = table_provider.create(table_inputs).outs
+
+        database = database_provider.update("test_db", database, {"name": "new_db"}).outs
+        schema_inputs = {"name": "new_schema", "database": database["name"]}
+        schema = schema_provider.update("test_schema", schema, schema_inputs).outs
+        table_inputs = {**table_inputs, "database": database["name"], "schema": schema["name"]}
+        table_diff = table_provider.diff("test_table", table, table_inputs)
+        table = table_provider.update("test_table", table, table_inputs).outs
+        table_provider.delete("test_table", table)
+
+        self.assertEqual(table_diff.replaces, [])
+        self.assertIsNotNone(client.catalog.get(SCHEMA, "new_db.new_schema"))
+        self.assertIsNone(client.catalog.get(TABLE, "new_db.new_schema.test_table"))
+
     # HELPERS
 
     def get_mock_connection_provider(self, mock_cursor):
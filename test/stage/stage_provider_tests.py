@@ -1,11 +1,21 @@
 import unittest
 from unittest.mock import Mock, call
 
+from pulumi_snowflake.baseprovider.renames import clear_renames
+from pulumi_snowflake.database import DatabaseProvider
 from pulumi_snowflake.stage import StageProvider
+from pulumi_snowflake.testing import FakeClient
+from pulumi_snowflake.testing.catalog import STAGE
 
 
 class StageProviderTests(unittest.TestCase):
 
+    def setUp(self):
+        clear_renames()
+
+    def tearDown(self):
+        clear_renames()
+
     def test_create_stage(self):
 
         mock_cursor = Mock()
@@ -265,6 +275,121 @@ class StageProviderTests(unittest.TestCase):
             ]))
         ])
 
+    def test_when_stage_properties_changed_then_updated_without_replacement(self):
+        provider = StageProvider(self.get_mock_provider(), Mock())
+
+        result = provider.diff("test_stage", {
+            "url": "s3://bucket/path/",
+            "copy_options": {"on_error": "CONTINUE"},
+            "comment": "test_comment"
+        }, {
+            "url": "s3://bucket/other_path/",
+            "copy_options": {"on_error": "SKIP_FILE"},
+            "file_format": {"format_name": "test_format"}
+        })
+
+        self.assertTrue(result.changes)
+        self.assertEqual(result.replaces, [])
+
+    def test_when_url_added_or_property_removed_then_stage_replaced(self):
+        provider = StageProvider(self.get_mock_provider(), Mock())
+
+        result = provider.diff("test_stage", {
+            "copy_options": {"on_error": "CONTINUE"},
+            "temporary": False
+        }, {
+            "url": "s3://bucket/path/",
+            "temporary": True
+        })
+
+        self.assertSetEqual(set(result.replaces), {"url", "copy_options", "temporary"})
+
+    def test_when_stage_updated_then_set_in_one_statement(self):
+        mock_cursor = Mock()
+        mock_connection_provider = self.get_mock_connection_provider(mock_cursor)
+
+        provider = StageProvider(self.get_mock_provider(), mock_connection_provider)
+        provider.update("test_stage", {
+            "database": "test_db",
+            "url": "s3://bucket/path/",
+            "storage_integration": "test_integration",
+            "copy_options": {"on_error": "CONTINUE"},
+            "comment": "test_comment"
+        }, {
+            "database": "test_db",
+            "url": "s3://bucket/other_path/",
+            "storage_integration": "test_integration",
+            "file_format": {"format_name": "test_format"},
+            "copy_options": {"on_error": "SKIP_FILE", "purge": True}
+        })
+
+        mock_cursor.execute.assert_called_once_with("\n".join([
+            "ALTER STAGE test_db..test_stage SET",
+            "URL = 's3://bucket/other_path/'",
+            "FILE_FORMAT = (FORMAT_NAME = 'test_format')",
+            "COPY_OPTIONS = (ON_ERROR = 'SKIP_FILE',PURGE = TRUE)",
+            "COMMENT = ''"
+        ]))
+
+    def test_when_stage_updated_then_catalog_keeps_stage(self):
+        client = FakeClient()
+        client.catalog.execute("CREATE DATABASE test_db")
+        client.catalog.execute("CREATE FILE FORMAT test_db.public.test_format TYPE = 'CSV'")
+        provider = StageProvider(self.get_mock_provider(), client)
+        inputs = {"name": "test_stage", "database": "test_db", "schema": "public",
+                  "url": "s3://bucket/path/"}
+        outputs = provider.create(inputs).outs
+        created_on = client.catalog.get(STAGE, "test_db.public.test_stage").created_on
+
+        provider.update("test_stage", outputs, {
+            **inputs,
+            "file_format": {"format_name": "test_db.public.test_format"},
+            "copy_options": {"on_error": "CONTINUE"}
+        })
+
+        stage = client.catalog.get(STAGE, "test_db.public.test_stage")
+        self.assertEqual(stage.created_on, created_on)
+        self.assertEqual(stage.properties["COPY_OPTIONS"], {"ON_ERROR": "CONTINUE"})
+
+    def test_when_database_renamed_then_stage_moved_without_replacement(self):
+        client = FakeClient()
+        database_provider = DatabaseProvider(self.get_mock_provider(), client)
+        provider = StageProvider(self.get_mock_provider(), client)
+        database = database_provider.create({"name": "test_db"}).outs
+        inputs = {"name": "test_stage", "database": "test_db", "schema": "public",
+                  "url": "s3://bucket/path/"}
+        stage = provider.create(inputs).outs
+        created_on = client.catalog.get(STAGE, "test_db.public.test_stage").created_on
+
+        database = database_provider.update("test_db", database, {"name": "new_db"}).outs
+        inputs = {**inputs, "database": database["name"]}
+        diff = provider.diff("test_stage", stage, inputs)
+        history_length = len(client.catalog.history)
+        stage = provider.update("test_stage", stage, inputs).outs
+
+        self.assertEqual(diff.replaces, [])
+        self.assertEqual(client.catalog.history[history_length:], [])
+        self.assertEqual(stage["full_name"], "new_db.public.test_stage")
+        self.assertEqual(client.catalog.get(STAGE, "new_db.public.test_stage").created_on,
+                         created_on)
+
+    def test_when_database_renamed_and_url_added_then_stage_replaced_in_new_database(self):
+        client = FakeClient()
+        database_provider = DatabaseProvider(self.get_mock_provider(), client)
+        provider = StageProvider(self.get_mock_provider(), client)
+        database = database_provider.create({"name": "test_db"}).outs
+        inputs = {"name": "test_stage", "database": "test_db", "schema": "public"}
+        stage = provider.create(inputs).outs
+
+        database = database_provider.update("test_db", database, {"name": "new_db"}).outs
+        inputs = {**inputs, "database": database["name"], "url": "s3://bucket/path/"}
+        diff = provider.diff("test_stage", stage, inputs)
+        provider.delete("test_stage", stage)
+        provider.create(inputs)
+
+        self.assertEqual(diff.replaces, ["url"])
+        self.assertEqual(client.catalog.get(STAGE, "new_db.public.test_stage").properties["URL"],
+                         "s3://bucket/path/")
 
     # HELPERS
 
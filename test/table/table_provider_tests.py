@@ -1,9 +1,12 @@
+import io
 import unittest
 
 from unittest.mock import Mock, call
 
 from pulumi_snowflake.table import TableProvider
 from pulumi_snowflake.table.column import Column
+from pulumi_snowflake.testing import FakeClient
+from pulumi_snowflake.testing.catalog import TABLE
 
 
 class TableProviderTests(unittest.TestCase):
@@ -149,6 +152,251 @@ class TableProviderTests(unittest.TestCase):
             call(f"DROP TABLE test_table")
         ])
 
+    def test_when_create_chunks_are_joined_then_they_equal_the_create_statement(self):
+        provider = TableProvider(self.get_mock_provider(), Mock())
+        inputs = {
+            "database": "test_db",
+            "cluster_by": ["test_col1"],
+            "comment": "test_comment",
+            "columns": [Column(f"test_col{index}", "INT", not_null=index % 2 == 0).as_dict()
+                        for index in range(100)]
+        }
+
+        chunks = list(provider.generate_sql_create_chunks("test_table", inputs))
+
+        self.assertEqual(len(chunks), 104)
+        self.assertEqual("".join(chunks),
+                         provider.generate_sql_create_statement("test_table", inputs, None))
+
+    def test_when_create_statement_is_written_to_stream_then_stream_contains_statement(self):
+        provider = TableProvider(self.get_mock_provider(), Mock())
+        inputs = {"columns": [Column("test_col1", "INT").as_dict(),
+                              Column("test_col2", "INT").as_dict()]}
+        stream = io.StringIO()
+
+        written = provider.write_sql_create_statement("test_table", inputs, stream)
+
+        self.assertEqual(stream.getvalue(), "\n".join([
+            "CREATE TABLE test_table",
+            "(",
+            "  test_col1 INT,",
+            "  test_col2 INT",
+            ")",
+            ""
+        ]))
+        self.assertEqual(written, len(stream.getvalue()))
+
+    def test_when_table_has_no_columns_then_create_chunks_render_empty_column_list(self):
+        provider = TableProvider(self.get_mock_provider(), Mock())
+
+        sql = "".join(provider.generate_sql_create_chunks("test_table", {}))
+
+        self.assertEqual(sql, "CREATE TABLE test_table\n(\n)\n")
+
+    def test_when_column_added_then_updated_without_replacement(self):
+        provider = TableProvider(self.get_mock_provider(), Mock())
+
+        result = provider.diff("test_table", {
+            "name": "test_table",
+            "columns": [Column("id", "INT").as_dict()]
+        }, {
+            "name": "test_table",
+            "columns": [Column("id", "INT").as_dict(), Column("value", "VARCHAR(10)").as_dict()]
+        })
+
+        self.assertTrue(result.changes)
+        self.assertEqual(result.replaces, [])
+
+    def test_when_column_type_narrowed_then_replaced(self):
+        provider = TableProvider(self.get_mock_provider(), Mock())
+
+        result = provider.diff("test_table", {
+            "name": "test_table",
+            "columns": [Column("value", "VARCHAR(100)").as_dict()]
+        }, {
+            "name": "test_table",
+            "columns": [Column("value", "VARCHAR(10)").as_dict()]
+        })
+
+        self.assertEqual(result.replaces, ["columns"])
+
+    def test_when_column_type_changed_to_char_without_length_then_replaced(self):
+        provider = TableProvider(self.get_mock_provider(), Mock())
+
+        narrowed = provider.diff("test_table", {
+            "name": "test_table",
+            "columns": [Column("value", "VARCHAR(10)").as_dict()]
+        }, {
+            "name": "test_table",
+            "columns": [Column("value", "CHAR").as_dict()]
+        })
+        widened = provider.diff("test_table", {
+            "name": "test_table",
+            "columns": [Column("value", "CHARACTER").as_dict()]
+        }, {
+            "name": "test_table",
+            "columns": [Column("value", "VARCHAR").as_dict()]
+        })
+
+        self.assertEqual(narrowed.replaces, ["columns"])
+        self.assertEqual(widened.replaces, [])
+
+    def test_when_column_constraint_or_temporary_changed_then_replaced(self):
+        provider = TableProvider(self.get_mock_provider(), Mock())
+
+        result = provider.diff("test_table", {
+            "name": "test_table",
+            "columns": [Column("id", "INT").as_dict()]
+        }, {
+            "name": "test_table",
+            "temporary": True,
+            "columns": [Column("id", "INT", unique=True).as_dict()]
+        })
+
+        self.assertSetEqual(set(result.replaces), {"columns", "temporary"})
+
+    def test_when_table_updated_then_alter_statements_sent_in_one_request(self):
+        mock_cursor = Mock()
+        mock_connection_provider = self.get_mock_connection_provider(mock_cursor)
+
+        provider = TableProvider(self.get_mock_provider(), mock_connection_provider)
+        provider.update("test_table", {
+            "name": "test_table",
+            "cluster_by": ["id"],
+            "comment": "test_comment",
+            "columns": [
+                Column("id", "NUMBER(10,0)").as_dict(),
+                Column("old_name", "VARCHAR(10)").as_dict(),
+                Column("dropped", "INT").as_dict(),
+                Column("value", "INT", not_null=True, default="0").as_dict()
+            ]
+        }, {
+            "name": "test_table",
+            "data_retention_time_in_days": 7,
+            "columns": [
+                Column("id", "NUMBER(20, 0)", not_null=True).as_dict(),
+                Column("new_name", "varchar(10)", renamed_from="old_name").as_dict(),
+                Column("value", "INT").as_dict(),
+                Column("added", "INT", default="1").as_dict()
+            ]
+        })
+
+        mock_cursor.execute.assert_called_once_with(";\n".join([
+            "ALTER TABLE test_table RENAME COLUMN old_name TO new_name",
+            "ALTER TABLE test_table ADD COLUMN added INT DEFAULT 1",
+            "ALTER TABLE test_table DROP COLUMN dropped",
+            "ALTER TABLE test_table ALTER COLUMN id SET DATA TYPE NUMBER(20, 0)",
+            "ALTER TABLE test_table ALTER COLUMN id SET NOT NULL",
+            "ALTER TABLE test_table ALTER COLUMN value DROP NOT NULL",
+            "ALTER TABLE test_table ALTER COLUMN value DROP DEFAULT",
+            "ALTER TABLE test_table DROP CLUSTERING KEY",
+            "ALTER TABLE test_table SET\nDATA_RETENTION_TIME_IN_DAYS = 7",
+            "ALTER TABLE test_table UNSET COMMENT"
+        ]), _statement_params={"MULTI_STATEMENT_COUNT": 10})
+
+    def test_when_table_updated_then_catalog_table_keeps_identity(self):
+        client = FakeClient()
+        client.catalog.execute("CREATE DATABASE test_db")
+        provider = TableProvider(self.get_mock_provider(), client)
+        inputs = {
+            "name": "test_table",
+            "database": "test_db",
+            "schema": "public",
+            "columns": [Column("id", "NUMBER(10,0)").as_dict(),
+                        Column("name", "VARCHAR(10)").as_dict()]
+        }
+        outputs = provider.create(inputs).outs
+        created_on = client.catalog.get(TABLE, "test_db.public.test_table").created_on
+
+        provider.update("test_table", outputs, {
+            **inputs,
+            "cluster_by": ["id"],
+            "columns": [Column("id", "NUMBER(12,0)", not_null=True).as_dict(),
+                        Column("full_name", "VARCHAR(10)", renamed_from="name").as_dict(),
+                        Column("age", "INT").as_dict()]
+        })
+
+        table = client.catalog.get(TABLE, "test_db.public.test_table")
+        self.assertEqual(table.created_on, created_on)
+        self.assertEqual(
+            [(column["name"], column["type"], column["not_null"]) for column in table.columns],
+            [("ID", "NUMBER(12,0)", True), ("FULL_NAME", "VARCHAR(10)", False),
+             ("AGE", "INT", False)])
+        self.assertEqual(table.cluster_by, ["id"])
+
+    def test_when_column_replaced_without_renamed_from_then_dropped_and_added(self):
+        provider = TableProvider(self.get_mock_provider(), Mock())
+
+        statements = provider.generate_sql_update_statements("test_table", {
+            "columns": [Column("id", "INT").as_dict(), Column("old_name", "VARCHAR(10)").as_dict()]
+        }, {
+            "columns": [Column("id", "INT").as_dict(), Column("new_name", "VARCHAR(10)").as_dict()]
+        }, None)
+
+        self.assertEqual(statements, ["ALTER TABLE test_table ADD COLUMN new_name VARCHAR(10)",
+                                      "ALTER TABLE test_table DROP COLUMN old_name"])
+
+    def test_when_renamed_column_keeps_renamed_from_then_no_changes(self):
+        provider = TableProvider(self.get_mock_provider(), Mock())
+        columns = [Column("id", "INT").as_dict(),
+                   Column("new_name", "VARCHAR(10)", renamed_from="old_name").as_dict()]
+
+        result = provider.diff("test_table", {"name": "test_table", "columns": columns},
+                               {"name": "test_table", "columns": columns})
+
+        self.assertFalse(result.changes)
+
+    def test_when_only_column_order_changed_then_no_changes(self):
+        provider = TableProvider(self.get_mock_provider(), Mock())
+
+        result = provider.diff("test_table", {
+            "name": "test_table",
+            "columns": [Column("id", "INT").as_dict(), Column("value", "VARCHAR(10)").as_dict()]
+        }, {
+            "name": "test_table",
+            "columns": [Column("value", "VARCHAR(10)").as_dict(), Column("id", "INT").as_dict()]
+        })
+
+        self.assertFalse(result.changes)
+        self.assertEqual(result.replaces, [])
+
+    def test_when_column_default_set_to_non_sequence_then_replaced(self):
+        provider = TableProvider(self.get_mock_provider(), Mock())
+
+        for (old_default, new_default) in [(None, "0"), ("0", "1"), ("0", "test_seq.NEXTVAL")]:
+            result = provider.diff("test_table", {
+                "name": "test_table",
+                "columns": [Column("id", "INT", default=old_default).as_dict()]
+            }, {
+                "name": "test_table",
+                "columns": [Column("id", "INT", default=new_default).as_dict()]
+            })
+
+            self.assertEqual(result.replaces, ["columns"],
+                             f"default {old_default} to {new_default}")
+
+    def test_when_sequence_default_changed_or_default_dropped_then_updated_in_place(self):
+        provider = TableProvider(self.get_mock_provider(), Mock())
+
+        statements = provider.generate_sql_update_statements("test_table", {
+            "columns": [Column("id", "INT", default="test_seq.NEXTVAL").as_dict(),
+                        Column("value", "INT", default="0").as_dict()]
+        }, {
+            "columns": [Column("id", "INT", default="test_db.public.other_seq.nextval").as_dict(),
+                        Column("value", "INT").as_dict()]
+        }, None)
+
+        self.assertEqual(statements, [
+            "ALTER TABLE test_table ALTER COLUMN id SET DEFAULT test_db.public.other_seq.nextval",
+            "ALTER TABLE test_table ALTER COLUMN value DROP DEFAULT"
+        ])
+
+    def test_when_columns_cannot_be_changed_in_place_then_update_raises(self):
+        provider = TableProvider(self.get_mock_provider(), Mock())
+
+        self.assertRaises(Exception, provider.update, "test_table",
+                          {"columns": [Column("id", "VARCHAR").as_dict()]},
+                          {"columns": [Column("id", "INT").as_dict()]})
 
     # HELPERS
 
@@ -0,0 +1,309 @@
+import time
+import unittest
+from unittest.mock import Mock
+
+from pulumi_snowflake.database import DatabaseProvider
+from pulumi_snowflake.fileformat import FileFormatProvider
+from pulumi_snowflake.pipe import PipeProvider
+from pulumi_snowflake.schema import SchemaProvider
+from pulumi_snowflake.stage import StageProvider
+from pulumi_snowflake.storageintegration import StorageIntegrationProvider
+from pulumi_snowflake.table import TableProvider
+from pulumi_snowflake.testing import Catalog, FakeClient, ProgrammingError
+from pulumi_snowflake.testing.catalog import DATABASE, FILE_FORMAT, PIPE, SCHEMA, STAGE, \
+    STORAGE_INTEGRATION, TABLE, WAREHOUSE
+from pulumi_snowflake.warehouse import WarehouseProvider
+
+
+class FakeClientTests(unittest.TestCase):
+
+    def test_when_database_created_then_public_schema_exists(self):
+        client = FakeClient()
+
+        self.execute(client, "CREATE DATABASE test_db")
+
+        self.assertIsNotNone(client.catalog.get(DATABASE, "test_db"))
+        self.assertIsNotNone(client.catalog.get(SCHEMA, "test_db.public"))
+
+    def test_when_object_already_exists_then_create_fails(self):
+        client = FakeClient()
+        self.execute(client, "CREATE WAREHOUSE test_wh")
+
+        self.assertRaises(ProgrammingError, self.execute, client, "CREATE WAREHOUSE test_wh")
+        self.execute(client, "CREATE WAREHOUSE IF NOT EXISTS test_wh")
+        self.execute(client, "CREATE OR REPLACE WAREHOUSE test_wh")
+
+    def test_when_parent_does_not_exist_then_create_fails(self):
+        client = FakeClient()
+        self.execute(client, "CREATE DATABASE test_db")
+
+        error = self.assertRaisesError(client, "CREATE TABLE test_db.missing.test_table (id INT)")
+
+        self.assertEqual(error.errno, 2003)
+        self.assertIn("Schema 'TEST_DB.MISSING' does not exist", error.msg)
+
+    def test_when_object_does_not_exist_then_drop_fails_unless_if_exists(self):
+        client = FakeClient()
+
+        self.assertRaisesError(client, "DROP STAGE test_db.public.test_stage")
+        self.assertRaisesError(client, "DROP WAREHOUSE test_wh")
+        self.execute(client, "DROP WAREHOUSE IF EXISTS test_wh")
+
+    def test_when_database_dropped_then_contents_dropped(self):
+        client = FakeClient()
+        self.execute(client, "CREATE DATABASE test_db")
+        self.execute(client, "CREATE TABLE test_db..test_table (id INT)")
+
+        self.execute(client, "DROP DATABASE test_db")
+
+        self.assertEqual(client.catalog.objects, {})
+
+    def test_when_schema_dropped_with_restrict_and_not_empty_then_drop_fails(self):
+        client = FakeClient()
+        self.execute(client, "CREATE DATABASE test_db")
+        self.execute(client, "CREATE TABLE test_db.public.test_table (id INT)")
+
+        self.assertRaisesError(client, "DROP SCHEMA test_db.public RESTRICT")
+
+    def test_when_stage_references_missing_integration_then_create_fails(self):
+        client = FakeClient(database="test_db")
+        self.execute(client, "CREATE DATABASE test_db")
+
+        self.assertRaisesError(client, "CREATE STAGE test_stage URL = 's3://bucket' "
+                                       "STORAGE_INTEGRATION = 'missing'")
+
+        self.execute(client, "CREATE STORAGE INTEGRATION test_integration "
+                             "TYPE = EXTERNAL_STAGE ENABLED = TRUE")
+        self.execute(client, "CREATE STAGE test_stage URL = 's3://bucket' "
+                             "STORAGE_INTEGRATION = 'test_integration'")
+
+    def test_when_pipe_references_missing_table_or_stage_then_create_fails(self):
+        client = FakeClient(database="test_db")
+        self.execute(client, "CREATE DATABASE test_db")
+        pipe = "CREATE PIPE test_pipe AS COPY INTO test_table FROM @test_stage " \
+               "FILE_FORMAT = (TYPE = 'JSON')"
+
+        self.assertRaisesError(client, pipe)
+        self.execute(client, "CREATE TABLE test_table (data VARIANT)")
+        self.assertRaisesError(client, pipe)
+        self.execute(client, "CREATE STAGE test_stage")
+        self.execute(client, pipe)
+
+        self.assertEqual(client.catalog.get(PIPE, "test_db.public.test_pipe").definition,
+                         "COPY INTO test_table FROM @test_stage FILE_FORMAT = (TYPE = 'JSON')")
+
+    def test_when_property_invalid_then_create_fails(self):
+        client = FakeClient()
+
+        error = self.assertRaisesError(client, "CREATE WAREHOUSE test_wh NOT_A_PROPERTY = 1")
+
+        self.assertEqual(error.errno, 2029)
+
+    def test_when_unqualified_name_without_current_database_then_create_fails(self):
+        self.assertRaisesError(FakeClient(), "CREATE TABLE test_table (id INT)")
+
+    def test_when_quoted_identifier_then_case_preserved(self):
+        client = FakeClient()
+
+        self.execute(client, 'CREATE DATABASE "Mixed Case"')
+
+        self.assertIsNotNone(client.catalog.get(DATABASE, '"Mixed Case"'))
+        self.assertIsNone(client.catalog.get(DATABASE, "mixed_case"))
+
+    def test_when_alter_set_and_unset_then_properties_changed(self):
+        client = FakeClient()
+        self.execute(client, "CREATE WAREHOUSE test_wh WAREHOUSE_SIZE = 'XSMALL' COMMENT = 'old'")
+
+        self.execute(client,
+                     "ALTER WAREHOUSE test_wh SET WAREHOUSE_SIZE = 'LARGE', AUTO_SUSPEND = 60")
+        self.execute(client, "ALTER WAREHOUSE test_wh UNSET COMMENT")
+
+        self.assertEqual(client.catalog.get(WAREHOUSE, "test_wh").properties,
+                         {"WAREHOUSE_SIZE": "LARGE", "AUTO_SUSPEND": 60})
+
+    def test_when_file_format_type_changed_by_alter_then_fails(self):
+        client = FakeClient(database="test_db")
+        self.execute(client, "CREATE DATABASE test_db")
+        self.execute(client, "CREATE FILE FORMAT test_format TYPE = 'CSV'")
+
+        self.assertRaisesError(client, "ALTER FILE FORMAT test_format SET TYPE = 'JSON'")
+        self.assertRaisesError(client, "ALTER FILE FORMAT test_format UNSET COMMENT")
+
+    def test_when_database_renamed_then_contents_moved(self):
+        client = FakeClient()
+        self.execute(client, "CREATE DATABASE test_db")
+        self.execute(client, "CREATE TABLE test_db.public.test_table (id INT)")
+
+        self.execute(client, "ALTER DATABASE test_db RENAME TO new_db")
+
+        self.assertIsNone(client.catalog.get(DATABASE, "test_db"))
+        self.assertIsNotNone(client.catalog.get(TABLE, "new_db.public.test_table"))
+
+    def test_when_table_columns_altered_then_columns_changed(self):
+        client = FakeClient(database="test_db")
+        self.execute(client, "CREATE DATABASE test_db")
+        self.execute(client,
+                     "CREATE TABLE test_table (id NUMBER(10,0), name VARCHAR(10), old INT)")
+
+        self.execute(client, "ALTER TABLE test_table ADD COLUMN created TIMESTAMP_NTZ")
+        self.execute(client, "ALTER TABLE test_table DROP COLUMN old")
+        self.execute(client, "ALTER TABLE test_table RENAME COLUMN name TO full_name")
+        self.execute(client, "ALTER TABLE test_table ALTER COLUMN id SET NOT NULL, "
+                             "COLUMN full_name SET DATA TYPE VARCHAR(100)")
+
+        self.assertEqual(self.execute(client, "DESCRIBE TABLE test_table").fetchall(), [
+            ("ID", "NUMBER(10,0)", "COLUMN", "N", None, "N", "N", None),
+            ("FULL_NAME", "VARCHAR(100)", "COLUMN", "Y", None, "N", "N", None),
+            ("CREATED", "TIMESTAMP_NTZ", "COLUMN", "Y", None, "N", "N", None),
+        ])
+
+    def test_when_column_type_narrowed_then_alter_fails(self):
+        client = FakeClient(database="test_db")
+        self.execute(client, "CREATE DATABASE test_db")
+        self.execute(client, "CREATE TABLE test_table (name VARCHAR(10))")
+
+        self.assertRaisesError(client,
+                               "ALTER TABLE test_table ALTER COLUMN name SET DATA TYPE VARCHAR(5)")
+        self.assertRaisesError(client,
+                               "ALTER TABLE test_table ALTER COLUMN name SET DATA TYPE NUMBER")
+
+    def test_when_column_default_set_to_non_sequence_then_alter_fails(self):
+        client = FakeClient(database="test_db")
+        self.execute(client, "CREATE DATABASE test_db")
+        self.execute(client,
+                     "CREATE TABLE test_table (id INT DEFAULT test_seq.NEXTVAL, value INT)")
+
+        self.execute(client,
+                     "ALTER TABLE test_table ALTER COLUMN id SET DEFAULT other_seq.NEXTVAL")
+        self.assertRaisesError(client, "ALTER TABLE test_table ALTER COLUMN id SET DEFAULT 0")
+        self.assertRaisesError(client,
+                               "ALTER TABLE test_table ALTER COLUMN value SET DEFAULT "
+                               "other_seq.NEXTVAL")
+
+    def test_when_show_then_objects_in_scope_listed(self):
+        client = FakeClient()
+        self.execute(client, "CREATE DATABASE db_a")
+        self.execute(client, "CREATE DATABASE db_b")
+        self.execute(client, "CREATE STAGE db_a.public.stage_1 COMMENT = 'first'")
+        self.execute(client, "CREATE STAGE db_b.public.stage_2")
+
+        cursor = self.execute(client, "SHOW STAGES LIKE 'stage%' IN DATABASE db_a")
+        columns = [column[0] for column in cursor.description]
+        rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+        self.assertEqual([(row["name"], row["database_name"], row["comment"]) for row in rows],
+                         [("STAGE_1", "DB_A", "first")])
+        self.assertEqual(len(self.execute(client, "SHOW DATABASES").fetchall()), 2)
+
+    def test_when_describe_then_properties_returned(self):
+        client = FakeClient()
+        self.execute(client, "CREATE STORAGE INTEGRATION test_integration ENABLED = TRUE "
+                             "STORAGE_ALLOWED_LOCATIONS = ('s3://a','s3://b')")
+
+        rows = self.execute(client, "DESC INTEGRATION test_integration").fetchall()
+
+        self.assertEqual(rows, [
+            ("ENABLED", "Boolean", "true", ""),
+            ("STORAGE_ALLOWED_LOCATIONS", "List", "s3://a,s3://b", ""),
+        ])
+
+    def test_when_multiple_statements_then_result_set_per_statement(self):
+        client = FakeClient()
+
+        cursor = client.get().cursor()
+        cursor.execute("CREATE DATABASE test_db;\nCREATE SCHEMA test_db.test_schema",
+                       _statement_params={"MULTI_STATEMENT_COUNT": 2})
+        first_query_id = cursor.sfqid
+
+        self.assertIs(cursor.nextset(), cursor)
+        self.assertNotEqual(cursor.sfqid, first_query_id)
+        self.assertIsNone(cursor.nextset())
+
+    def test_when_statement_count_does_not_match_then_execute_fails(self):
+        cursor = FakeClient().get().cursor()
+
+        self.assertRaises(ProgrammingError, cursor.execute, "CREATE DATABASE a; CREATE DATABASE b")
+
+    def test_when_latency_configured_then_statements_delayed(self):
+        client = FakeClient(
+            latency=lambda statement: 0.05 if statement.startswith("CREATE") else 0)
+
+        start = time.monotonic()
+        self.execute(client, "CREATE DATABASE test_db")
+        self.execute(client, "SHOW DATABASES")
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+
+    def test_when_clients_share_catalog_then_objects_shared(self):
+        catalog = Catalog()
+
+        self.execute(FakeClient(catalog), "CREATE DATABASE test_db")
+
+        self.assertEqual(len(self.execute(FakeClient(catalog), "SHOW DATABASES").fetchall()), 1)
+        self.assertEqual(catalog.history, ["CREATE DATABASE test_db", "SHOW DATABASES"])
+
+    def test_when_every_provider_run_end_to_end_then_objects_created_and_dropped(self):
+        client = FakeClient()
+        provider_params = self.get_mock_provider()
+        inputs = [
+            (DatabaseProvider, DATABASE, {"name": "test_db", "comment": "test comment"}),
+            (SchemaProvider, SCHEMA, {"name": "test_schema", "database": "test_db",
+                                      "data_retention_time_in_days": 2}),
+            (FileFormatProvider, FILE_FORMAT, {"name": "test_format", "database": "test_db",
+                                               "schema": "test_schema", "type": "CSV",
+                                               "null_if": ["", "NULL"], "skip_header": 1}),
+            (StorageIntegrationProvider, STORAGE_INTEGRATION, {
+                "name": "test_integration", "type": "EXTERNAL_STAGE", "enabled": True,
+                "storage_provider": "S3", "storage_allowed_locations": ["s3://bucket/"]}),
+            (StageProvider, STAGE, {"name": "test_stage", "database": "test_db",
+                                    "schema": "test_schema", "url": "s3://bucket/",
+                                    "storage_integration": "test_integration",
+                                    "copy_options": {"on_error": "CONTINUE"}}),
+            (TableProvider, TABLE, {"name": "test_table", "database": "test_db",
+                                    "schema": "test_schema",
+                                    "columns": [{"name": "id", "type": "NUMBER(38,0)",
+                                                 "not_null": True},
+                                                {"name": "data", "type": "VARIANT"}],
+                                    "cluster_by": ["id"], "comment": "test comment"}),
+            (PipeProvider, PIPE, {"name": "test_pipe", "database": "test_db",
+                                  "schema": "test_schema", "auto_ingest": True,
+                                  "code": "COPY INTO test_db.test_schema.test_table "
+                                          "FROM @test_db.test_schema.test_stage "
+                                          "FILE_FORMAT = (FORMAT_NAME = "
+                                          "'test_db.test_schema.test_format');"}),
+            (WarehouseProvider, WAREHOUSE, {"name": "test_wh", "warehouse_size": "XSMALL",
+                                            "auto_resume": True, "initially_suspended": True}),
+        ]
+
+        outputs = []
+
+        for (provider_class, kind, resource_inputs) in inputs:
+            result = provider_class(provider_params, client).create(resource_inputs)
+            outputs.append((provider_class, kind, result))
+
+        self.assertEqual(len(client.catalog.objects), len(inputs) + 1)
+        table = client.catalog.get(TABLE, "test_db.test_schema.test_table")
+        self.assertEqual(table.cluster_by, ["id"])
+        self.assertEqual(client.catalog.get(WAREHOUSE, "test_wh").state, "SUSPENDED")
+
+        for (provider_class, kind, result) in reversed(outputs):
+            provider_class(provider_params, client).delete(result.id, result.outs)
+
+        self.assertEqual(client.catalog.objects, {})
+
+    # HELPERS
+
+    def execute(self, client, statement):
+        return client.get().cursor().execute(statement)
+
+    def assertRaisesError(self, client, statement) -> ProgrammingError:
+        with self.assertRaises(ProgrammingError) as context:
+            self.execute(client, statement)
+
+        return context.exception
+
+    def get_mock_provider(self):
+        mock_provider = Mock()
+        mock_provider.database = None
+        mock_provider.schema = None
+        return mock_provider
@@ -0,0 +1,154 @@
+import time
+import unittest
+
+from pulumi_snowflake import Client, Provider
+from pulumi_snowflake.async_executor import close_all_executors
+from pulumi_snowflake.connection_pool import close_all_pools
+from pulumi_snowflake.database import DatabaseProvider
+from pulumi_snowflake.schema import SchemaProvider
+from pulumi_snowflake.table import TableProvider
+from pulumi_snowflake.testing import LocalSnowflakeServer
+from pulumi_snowflake.testing.catalog import DATABASE, SCHEMA, TABLE
+from pulumi_snowflake.token_cache import clear_memory_cache
+
+
+class LocalSnowflakeServerTests(unittest.TestCase):
+
+    def setUp(self):
+        close_all_executors()
+        close_all_pools()
+        clear_memory_cache()
+        self.server = LocalSnowflakeServer().start()
+
+    def tearDown(self):
+        close_all_executors()
+        close_all_pools()
+        clear_memory_cache()
+        self.server.stop()
+
+    def test_when_client_connects_then_statements_run_against_catalog(self):
+        cursor = Client(self.get_provider()).get().cursor()
+
+        cursor.execute("CREATE DATABASE test_db")
+        cursor.execute("SHOW DATABASES")
+
+        self.assertEqual(cursor.fetchall()[0][1], "TEST_DB")
+        self.assertIsNotNone(self.server.catalog.get(DATABASE, "test_db"))
+        self.assertEqual(self.server.logins, 1)
+
+    def test_when_connections_pooled_then_one_login(self):
+        client = Client(self.get_provider())
+
+        for index in range(5):
+            connection = client.get()
+            connection.cursor().execute(f"CREATE WAREHOUSE test_wh_{index}")
+            connection.close()
+
+        self.assertEqual(self.server.logins, 1)
+        self.assertEqual(self.server.queries, 5)
+
+    def test_when_statement_fails_then_connector_raises_programming_error(self):
+        cursor = Client(self.get_provider()).get().cursor()
+
+        with self.assertRaises(Exception) as context:
+            cursor.execute("DROP TABLE test_db.public.missing")
+
+        self.assertEqual(type(context.exception).__name__, "ProgrammingError")
+        self.assertEqual(context.exception.errno, 2003)
+
+    def test_when_providers_run_then_multi_statement_requests_executed(self):
+        provider_params = self.get_provider()
+        client = Client(provider_params)
+
+        DatabaseProvider(provider_params, client).create({"name": "test_db"})
+        SchemaProvider(provider_params, client).create({
+            "name": "test_schema",
+            "database": "test_db"
+        })
+        result = TableProvider(provider_params, client).create({
+            "name": "test_table",
+            "database": "test_db",
+            "schema": "test_schema",
+            "columns": [{"name": "id", "type": "NUMBER(38,0)"}],
+            "cluster_by": ["id"]
+        })
+
+        self.assertIsNotNone(self.server.catalog.get(SCHEMA, "test_db.test_schema"))
+        table = self.server.catalog.get(TABLE, "test_db.test_schema.test_table")
+        self.assertEqual(table.cluster_by, ["id"])
+
+        TableProvider(provider_params, client).delete(result.id, result.outs)
+
+        self.assertIsNone(self.server.catalog.get(TABLE, "test_db.test_schema.test_table"))
+
+    def test_when_async_execution_then_statements_polled_to_completion(self):
+        provider_params = self.get_provider(async_execution=True)
+
+        DatabaseProvider(provider_params, Client(provider_params)).create({"name": "test_db"})
+
+        self.assertIsNotNone(self.server.catalog.get(DATABASE, "test_db"))
+
+    def test_when_async_execution_then_rowcount_taken_from_query_status(self):
+        provider_params = self.get_provider(async_execution=True)
+
+        provider = DatabaseProvider(provider_params, Client(provider_params))
+        [result] = provider._execute_sql("CREATE DATABASE test_db")
+
+        self.assertEqual(result.rowcount, 1)
+
+    def test_when_async_execution_then_result_of_each_statement_returned(self):
+        provider = DatabaseProvider(self.get_provider(), Client(self.get_provider()))
+        async_provider = DatabaseProvider(self.get_provider(async_execution=True),
+                                          Client(self.get_provider(async_execution=True)))
+
+        results = provider._execute_sql(["CREATE DATABASE db_a", "CREATE DATABASE db_b"])
+        async_results = async_provider._execute_sql(["CREATE DATABASE db_c",
+                                                     "CREATE DATABASE db_d"])
+
+        self.assertEqual([result.rowcount for result in async_results],
+                         [result.rowcount for result in results])
+        self.assertEqual(len({result.query_id for result in async_results}), 2)
+        self.assertIsNotNone(self.server.catalog.get(DATABASE, "db_d"))
+
+    def test_when_session_expires_then_token_renewed(self):
+        cursor = Client(self.get_provider()).get().cursor()
+        cursor.execute("CREATE DATABASE test_db")
+
+        self.server.expire_sessions()
+        cursor.execute("DROP DATABASE test_db")
+
+        self.assertEqual(self.server.renewals, 1)
+        self.assertEqual(self.server.logins, 1)
+
+    def test_when_credentials_wrong_then_login_fails(self):
+        self.server.username = "test_user"
+        self.server.password = "other_password"
+
+        self.assertRaises(Exception, Client(self.get_provider()).get)
+
+    def test_when_requests_fail_then_connector_retries(self):
+        self.server.error_rate = 0.5
+        self.server.throttle_rate = 0.2
+        self.server._random.seed(1)
+        cursor = Client(self.get_provider()).get().cursor()
+
+        for index in range(3):
+            cursor.execute(f"CREATE WAREHOUSE test_wh_{index}")
+
+        self.assertEqual(len(self.server.catalog.list_objects("WAREHOUSE")), 3)
+        self.assertGreater(self.server.failed_requests + self.server.throttled_requests, 0)
+
+    def test_when_latency_configured_then_statements_delayed(self):
+        self.server.latency = lambda statement: 0.2 if statement.startswith("CREATE") else 0
+        cursor = Client(self.get_provider()).get().cursor()
+
+        start = time.monotonic()
+        cursor.execute("CREATE DATABASE test_db")
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+
+    # HELPERS
+
+    def get_provider(self, **kwargs):
+        return Provider(username="test_user", password="test_password",
+                        account_name="test_account", **self.server.connection_parameters, **kwargs)
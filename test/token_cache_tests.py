@@ -0,0 +1,88 @@
+import os
+import tempfile
+import unittest
+
+from pulumi_snowflake.token_cache import TokenCache, clear_memory_cache, FILE_HEADER, SALT_LENGTH
+
+
+class TokenCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        clear_memory_cache()
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        clear_memory_cache()
+
+    def test_when_tokens_put_then_returned(self):
+        cache = TokenCache("test_stack", b"secret")
+        cache.put("session", "master")
+
+        self.assertEqual(cache.get(), {"session_token": "session", "master_token": "master"})
+
+    def test_when_tokens_expired_then_not_returned(self):
+        cache = TokenCache("test_stack", b"secret", lifetime=0)
+        cache.put("session", "master")
+
+        self.assertIsNone(cache.get())
+
+    def test_when_directory_given_then_tokens_survive_process(self):
+        TokenCache("test_stack", b"secret", self.directory).put("session", "master")
+        clear_memory_cache()
+
+        tokens = TokenCache("test_stack", b"secret", self.directory).get()
+
+        self.assertEqual(tokens["session_token"], "session")
+
+    def test_when_tokens_written_to_disk_then_encrypted(self):
+        token_cache = TokenCache("test_stack", b"secret", self.directory)
+        token_cache.put("session_token_value", "master_token_value")
+
+        for file_name in os.listdir(self.directory):
+            with open(os.path.join(self.directory, file_name), "rb") as token_file:
+                self.assertNotIn(b"session_token_value", token_file.read())
+
+    def test_when_tokens_written_to_disk_then_each_file_has_random_salt(self):
+        TokenCache("test_stack", b"secret", self.directory).put("session", "master")
+        first = self.read_token_file()
+        TokenCache("test_stack", b"secret", self.directory).put("session", "master")
+        second = self.read_token_file()
+
+        self.assertTrue(first.startswith(FILE_HEADER))
+        self.assertNotEqual(first[len(FILE_HEADER):len(FILE_HEADER) + SALT_LENGTH],
+                            second[len(FILE_HEADER):len(FILE_HEADER) + SALT_LENGTH])
+
+    def test_when_file_has_no_header_then_ignored(self):
+        TokenCache("test_stack", b"secret", self.directory).put("session", "master")
+        content = self.read_token_file()
+        clear_memory_cache()
+
+        with open(os.path.join(self.directory, os.listdir(self.directory)[0]), "wb") as token_file:
+            token_file.write(content[len(FILE_HEADER) + SALT_LENGTH:])
+
+        self.assertIsNone(TokenCache("test_stack", b"secret", self.directory).get())
+
+    def test_when_secret_differs_then_disk_tokens_not_readable(self):
+        TokenCache("test_stack", b"secret", self.directory).put("session", "master")
+        clear_memory_cache()
+
+        self.assertIsNone(TokenCache("test_stack", b"other_secret", self.directory).get())
+
+    def test_when_stack_differs_then_tokens_not_shared(self):
+        TokenCache("test_stack", b"secret", self.directory).put("session", "master")
+
+        self.assertIsNone(TokenCache("other_stack", b"secret", self.directory).get())
+
+    def test_when_directory_unwritable_then_falls_back_to_memory(self):
+        cache = TokenCache("test_stack", b"secret", os.path.join(os.devnull, "tokens"))
+        cache.put("session", "master")
+
+        self.assertEqual(cache.get()["master_token"], "master")
+
+    # HELPERS
+
+    def read_token_file(self):
+        [file_name] = os.listdir(self.directory)
+
+        with open(os.path.join(self.directory, file_name), "rb") as token_file:
+            return token_file.read()
@@ -34,3 +34,29 @@ class ValidationTests(unittest.TestCase):
 
     def test_when_is_enquoted_identifier_valid_called_with_invalid_enquoted_identifier_then_false(self):
         self.assertEqual(Validation.is_enquoted_identifier_valid('test"id'), False)
+
+    def test_when_strings_valid_then_validate_strings_returns_them(self):
+        strings = ["test", "it\\'s", "multi\nline", ""]
+        self.assertEqual(Validation.validate_strings(iter(strings)), strings)
+
+    def test_when_one_string_invalid_then_validate_strings_raises_exception(self):
+        with self.assertRaises(Exception) as context:
+            Validation.validate_strings(["test", "it's", "other's"])
+
+        self.assertEqual(str(context.exception), "Invalid Snowflake string: it's")
+
+    def test_when_string_ends_with_backslash_then_validate_strings_raises_exception(self):
+        self.assertRaises(Exception, Validation.validate_strings, ["test\\", "'"])
+        self.assertRaises(Exception, Validation.validate_strings, ["test\\", "value"])
+
+    def test_when_identifier_enquoted_repeatedly_then_result_memoized(self):
+        Validation.enquote_identifier.cache_clear()
+
+        for _ in range(3):
+            self.assertEqual(Validation.enquote_identifier("test id"), '"test id"')
+
+        self.assertEqual(Validation.enquote_identifier.cache_info().hits, 2)
+
+    def test_when_identifiers_enquoted_together_then_each_enquoted(self):
+        self.assertEqual(Validation.enquote_identifiers(["test", "test id", None]),
+                         ["test", '"test id"', None])
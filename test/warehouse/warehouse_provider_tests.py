@@ -3,6 +3,8 @@ import unittest
 from unittest.mock import Mock, call
 
 from pulumi_snowflake.database.database_provider import DatabaseProvider
+from pulumi_snowflake.testing import FakeClient
+from pulumi_snowflake.testing.catalog import WAREHOUSE
 from pulumi_snowflake.warehouse import WarehouseProvider
 from pulumi_snowflake.warehouse.warehouse_scaling_policy_values import WarehouseScalingPolicyValues
 from pulumi_snowflake.warehouse.warehouse_size_values import WarehouseSizeValues
@@ -71,6 +73,105 @@ class WarehouseProviderTests(unittest.TestCase):
             call(f"DROP WAREHOUSE test_warehouse")
         ])
 
+    def test_when_warehouse_properties_changed_then_updated_without_replacement(self):
+        provider = WarehouseProvider(self.get_mock_provider(), Mock())
+
+        result = provider.diff("test_wh", {
+            "name": "test_wh",
+            "full_name": "test_wh",
+            "warehouse_size": WarehouseSizeValues.XSMALL,
+            "auto_suspend": 300
+        }, {
+            "name": "test_wh",
+            "warehouse_size": WarehouseSizeValues.LARGE,
+            "auto_suspend": 60
+        })
+
+        self.assertTrue(result.changes)
+        self.assertEqual(result.replaces, [])
+
+    def test_when_warehouse_unchanged_then_no_changes(self):
+        provider = WarehouseProvider(self.get_mock_provider(), Mock())
+
+        result = provider.diff("test_wh", {
+            "name": "test_wh",
+            "full_name": "test_wh",
+            "auto_suspend": 300
+        }, {
+            "name": "test_wh",
+            "auto_suspend": 300
+        })
+
+        self.assertFalse(result.changes)
+
+    def test_when_warehouse_updated_then_set_and_unset_sent_in_one_request(self):
+        mock_cursor = Mock()
+        mock_connection_provider = self.get_mock_connection_provider(mock_cursor)
+
+        provider = WarehouseProvider(self.get_mock_provider(), mock_connection_provider)
+        result = provider.update("test_wh", {
+            "name": "test_wh",
+            "warehouse_size": WarehouseSizeValues.XSMALL,
+            "max_cluster_count": 2,
+            "auto_resume": True,
+            "comment": "test comment"
+        }, {
+            "name": "test_wh",
+            "warehouse_size": WarehouseSizeValues.LARGE,
+            "max_cluster_count": 2,
+            "scaling_policy": WarehouseScalingPolicyValues.ECONOMY,
+            "auto_resume": False
+        })
+
+        mock_cursor.execute.assert_called_once_with(";\n".join([
+            "\n".join([
+                "ALTER WAREHOUSE test_wh SET",
+                f"WAREHOUSE_SIZE = '{WarehouseSizeValues.LARGE}'",
+                f"SCALING_POLICY = '{WarehouseScalingPolicyValues.ECONOMY}'",
+                "AUTO_RESUME = FALSE"
+            ]),
+            "ALTER WAREHOUSE test_wh UNSET COMMENT"
+        ]), _statement_params={"MULTI_STATEMENT_COUNT": 2})
+        self.assertEqual(result.outs["warehouse_size"], WarehouseSizeValues.LARGE)
+
+    def test_when_auto_suspend_changed_to_zero_then_set_to_zero(self):
+        mock_cursor = Mock()
+
+        provider = WarehouseProvider(self.get_mock_provider(),
+                                     self.get_mock_connection_provider(mock_cursor))
+        provider.update("test_wh", {"name": "test_wh", "auto_suspend": 300},
+                        {"name": "test_wh", "auto_suspend": 0})
+
+        mock_cursor.execute.assert_called_once_with(
+            "ALTER WAREHOUSE test_wh SET\nAUTO_SUSPEND = 0")
+
+    def test_when_only_initially_suspended_changed_then_no_statements(self):
+        mock_connection_provider = Mock()
+
+        provider = WarehouseProvider(self.get_mock_provider(), mock_connection_provider)
+        provider.update("test_wh", {"name": "test_wh", "initially_suspended": True},
+                        {"name": "test_wh", "initially_suspended": False})
+
+        mock_connection_provider.get.assert_not_called()
+
+    def test_when_warehouse_updated_then_catalog_keeps_warehouse(self):
+        client = FakeClient()
+        provider = WarehouseProvider(self.get_mock_provider(), client)
+        inputs = {"name": "test_wh", "warehouse_size": WarehouseSizeValues.XSMALL,
+                  "comment": "test comment"}
+        outputs = provider.create(inputs).outs
+        created_on = client.catalog.get(WAREHOUSE, "test_wh").created_on
+
+        provider.update("test_wh", outputs, {
+            "name": "test_wh",
+            "warehouse_size": WarehouseSizeValues.MEDIUM,
+            "auto_suspend": 120
+        })
+
+        warehouse = client.catalog.get(WAREHOUSE, "test_wh")
+        self.assertEqual(warehouse.created_on, created_on)
+        self.assertEqual(warehouse.properties, {"WAREHOUSE_SIZE": WarehouseSizeValues.MEDIUM,
+                                                "AUTO_SUSPEND": 120})
 
     # HELPERS
 